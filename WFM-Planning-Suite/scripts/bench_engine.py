@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Time the Erlang engine and sizing across traffic regimes and compare to a JSON baseline.
+
+    python scripts/bench_engine.py --save      # record a baseline on this machine
+    python scripts/bench_engine.py             # compare; exits 1 on regressions
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.erlang.engine import erlang_b, erlang_c, kpis_for_agents, required_agents  # noqa: E402
+from core.models import ErlangModel, Profile  # noqa: E402
+from core.sizing.orchestrator import derive_interval_pattern, size_intervals  # noqa: E402
+
+DEFAULT_BASELINE = ROOT / "scripts" / "bench_engine_baseline.json"
+
+# (agents, traffic in Erlangs) per regime; agents sit just above traffic where the engine works hardest.
+REGIMES = {
+    "small": (8, 5.5),
+    "medium": (115, 100.0),
+    "large": (5200, 5000.0),
+}
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    cases: dict[str, Callable[[], object]] = {}
+    for regime, (agents, traffic) in REGIMES.items():
+        volume = traffic * 1800 / 300
+        cases[f"erlang_b/{regime}"] = lambda n=agents, a=traffic: erlang_b(n, a)
+        cases[f"erlang_c/{regime}"] = lambda n=agents, a=traffic: erlang_c(n, a)
+        for model in (ErlangModel.C, ErlangModel.A):
+            cases[f"kpis_for_agents/{model.name}/{regime}"] = (
+                lambda n=agents, v=volume, m=model: kpis_for_agents(n, v, 1800, 300, m, 20, 120)
+            )
+        cases[f"required_agents/{regime}"] = (
+            lambda v=volume: required_agents(v, 1800, 300, ErlangModel.C, 80, 20, 120, max_agents=None)
+        )
+
+    points = [{"timestamp": datetime(2024, 6, d), "volume": 4000.0} for d in range(1, 8)]
+    demand = derive_interval_pattern([], points, 30)
+    for model in (ErlangModel.C, ErlangModel.A):
+        profile = Profile(erlang_model=model)
+        cases[f"size_intervals/{model.name}/week"] = lambda p=profile: size_intervals(demand, p)
+    return cases
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """Best-of-``repeat`` seconds per call; the minimum is the least noisy estimate."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Cases slower than ``baseline * (1 + threshold)``."""
+    regressions = []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference and seconds > reference * (1.0 + threshold):
+            regressions.append(f"{name}: {seconds * 1e6:.1f}us vs {reference * 1e6:.1f}us (+{seconds / reference - 1:.0%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown fraction (default 0.25)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="pattern", default="", help="only run cases containing this text")
+    args = parser.parse_args()
+
+    results: dict[str, float] = {}
+    for name, func in _cases().items():
+        if args.pattern in name:
+            results[name] = measure(func, args.repeat)
+            print(f"{name:<40} {results[name] * 1e6:>12.1f} us")
+
+    if args.save:
+        payload = {"machine": platform.platform(), "python": platform.python_version(), "results": results}
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save first")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text())["results"], args.threshold)
+    if regressions:
+        print(f"PERFORMANCE REGRESSIONS (>{args.threshold:.0%} slower than baseline):")
+        for line in regressions:
+            print(line)
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
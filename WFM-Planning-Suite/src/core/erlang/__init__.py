@@ -1,21 +1,54 @@
+from core.erlang.cache import CacheStats, ErlangCache
 from core.erlang.engine import (
+    AgentSearch,
+    AgentSolution,
     abandonment_erlang_a,
+    asa_erlang_a,
     asa_erlang_c,
+    asa_erlang_c_log,
+    erlang_a_measures,
     erlang_b,
     erlang_c,
     kpis_for_agents,
+    kpis_for_agents_log,
+    log_erlang_b,
+    log_erlang_c,
     required_agents,
     sla_erlang_a,
     sla_erlang_c,
+    sla_erlang_c_log,
+    solve_required_agents,
+)
+from core.erlang.vectorized import (
+    ErlangKPIArrays,
+    erlang_b_array,
+    erlang_c_array,
+    kpis_for_agents_array,
 )
 
 __all__ = [
+    "AgentSearch",
+    "AgentSolution",
+    "CacheStats",
+    "ErlangCache",
+    "ErlangKPIArrays",
     "abandonment_erlang_a",
+    "asa_erlang_a",
     "asa_erlang_c",
+    "asa_erlang_c_log",
+    "erlang_a_measures",
     "erlang_b",
+    "erlang_b_array",
     "erlang_c",
+    "erlang_c_array",
     "kpis_for_agents",
+    "kpis_for_agents_array",
+    "kpis_for_agents_log",
+    "log_erlang_b",
+    "log_erlang_c",
     "required_agents",
     "sla_erlang_a",
     "sla_erlang_c",
+    "sla_erlang_c_log",
+    "solve_required_agents",
 ]
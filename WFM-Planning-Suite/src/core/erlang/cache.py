@@ -0,0 +1,129 @@
+"""Bounded LRU memo layer around the Erlang engine."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+from core.erlang.engine import AgentSearch, ErlangKPIs, kpis_for_agents, required_agents
+from core.models import ErlangModel
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ErlangCache:
+    """Memoise ``kpis_for_agents`` and ``required_agents`` on (traffic, profile) keys.
+
+    Results depend on volume, interval and AHT only through traffic, so keys use
+    traffic rather than volume. With ``traffic_quantum > 0`` traffic is rounded
+    up to a multiple of the quantum before evaluation, so near-identical
+    intervals share an entry. Rounding up keeps staffing conservative, but it is
+    still an approximation and callers must record ``approximation_note``.
+    """
+
+    def __init__(self, maxsize: int = 65536, traffic_quantum: float = 0.0):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if traffic_quantum < 0:
+            raise ValueError("traffic_quantum must be non-negative")
+        self.maxsize = maxsize
+        self.traffic_quantum = traffic_quantum
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def approximation_note(self) -> str | None:
+        if self.traffic_quantum <= 0:
+            return None
+        return f"Erlang KPI cache rounds traffic up to multiples of {self.traffic_quantum:g} Erlangs"
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self._entries), maxsize=self.maxsize)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _traffic_key(self, volume: float, interval_seconds: float, aht_seconds: float) -> tuple[float, float]:
+        """Return (key, volume to evaluate) for the given inputs."""
+        if interval_seconds <= 0:
+            interval_seconds = 1800.0
+        traffic = (volume * aht_seconds) / interval_seconds if volume > 0 else 0.0
+        if self.traffic_quantum <= 0 or traffic <= 0 or aht_seconds <= 0:
+            return traffic, volume
+        steps = math.ceil(traffic / self.traffic_quantum)
+        return float(steps), steps * self.traffic_quantum * interval_seconds / aht_seconds
+
+    def _lookup(self, key: Hashable) -> Any | None:
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> Any:
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def kpis_for_agents(
+        self,
+        agents: int,
+        volume: float,
+        interval_seconds: float,
+        aht_seconds: float,
+        model: ErlangModel,
+        sla_time_seconds: float = 20.0,
+        patience_seconds: float = 120.0,
+    ) -> ErlangKPIs:
+        traffic_key, volume = self._traffic_key(volume, interval_seconds, aht_seconds)
+        key = ("kpis", traffic_key, agents, aht_seconds, model, sla_time_seconds, patience_seconds)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        kpi = kpis_for_agents(agents, volume, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds)
+        return self._store(key, kpi)
+
+    def required_agents(
+        self,
+        volume: float,
+        interval_seconds: float,
+        aht_seconds: float,
+        model: ErlangModel,
+        sla_target_pct: float = 80.0,
+        sla_time_seconds: float = 20.0,
+        patience_seconds: float = 120.0,
+        max_agents: int | None = 500,
+        search: AgentSearch = AgentSearch.INCREMENTAL,
+    ) -> tuple[int, ErlangKPIs]:
+        traffic_key, volume = self._traffic_key(volume, interval_seconds, aht_seconds)
+        key = (
+            "required", traffic_key, aht_seconds, model, sla_target_pct,
+            sla_time_seconds, patience_seconds, max_agents, search,
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        result = required_agents(
+            volume, interval_seconds, aht_seconds, model, sla_target_pct,
+            sla_time_seconds, patience_seconds, max_agents, search,
+        )
+        return self._store(key, result)
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from enum import Enum
+from itertools import count
+from statistics import NormalDist
 
 from core.models import ErlangModel
 
@@ -19,27 +22,74 @@ class ErlangKPIs:
     model: ErlangModel
 
 
+class AgentSearch(str, Enum):
+    LINEAR = "linear"
+    INCREMENTAL = "incremental"
+    BISECT = "bisect"
+
+
+@dataclass(frozen=True)
+class AgentSolution:
+    agents: int
+    kpis: ErlangKPIs
+    evaluations: int
+    capped: bool = False
+
+
+# 1/B grows like n!/A^n once agents exceed traffic; the scaled recurrence renormalises past this bound.
+_RESCALE_AT = 1e250
+_LOG_RESCALE_AT = math.log(_RESCALE_AT)
+
+
+def _inverse_erlang_b(agents: int, traffic: float, from_agents: int = 0, inv_b: float = 1.0) -> float:
+    """Continue the 1/B recurrence from ``from_agents`` (where it equals ``inv_b``) up to ``agents``."""
+    for k in range(from_agents + 1, agents + 1):
+        inv_b = 1.0 + (k / traffic) * inv_b
+    return inv_b
+
+
+def _scaled_inverse_erlang_b(
+    agents: int,
+    traffic: float,
+    from_agents: int = 0,
+    state: tuple[float, float] = (1.0, 0.0),
+) -> tuple[float, float]:
+    """Same recurrence as ``_inverse_erlang_b`` carried as ``(scaled, log_scale)`` with 1/B = scaled * e**log_scale.
+
+    Until the first rescale the arithmetic is identical to the plain recurrence.
+    """
+    scaled, log_scale = state
+    unit = math.exp(-log_scale)
+    for k in range(from_agents + 1, agents + 1):
+        scaled = unit + (k / traffic) * scaled
+        if scaled > _RESCALE_AT:
+            scaled /= _RESCALE_AT
+            log_scale += _LOG_RESCALE_AT
+            unit = math.exp(-log_scale)
+    return scaled, log_scale
+
+
 def erlang_b(agents: int, traffic: float) -> float:
     """Blocking probability Erlang B."""
     if agents <= 0:
         return 1.0
     if traffic <= 0:
         return 0.0
-    inv_b = 1.0
-    for k in range(1, agents + 1):
-        inv_b = 1.0 + (k / traffic) * inv_b
-    return 1.0 / inv_b
+    return 1.0 / _inverse_erlang_b(agents, traffic)
 
 
-def erlang_c(agents: int, traffic: float) -> float:
-    """Probability of wait Erlang C."""
+def erlang_c(agents: int, traffic: float, blocking: float | None = None) -> float:
+    """Probability of wait Erlang C.
+
+    ``blocking`` may carry a precomputed ``erlang_b(agents, traffic)``.
+    """
     if agents <= 0:
         return 1.0
     if traffic <= 0:
         return 0.0
     if agents <= traffic:
         return 1.0
-    b = erlang_b(agents, traffic)
+    b = erlang_b(agents, traffic) if blocking is None else blocking
     denom = agents - traffic * (1.0 - b)
     if denom <= 0:
         return 1.0
@@ -51,47 +101,144 @@ def sla_erlang_c(
     traffic: float,
     aht_seconds: float,
     sla_time_seconds: float,
+    wait_probability: float | None = None,
 ) -> float:
     """Service level for Erlang C: % answered within SLA time."""
     if traffic <= 0 or agents <= 0:
         return 100.0
     if agents <= traffic:
         return 0.0
-    c = erlang_c(agents, traffic)
+    c = erlang_c(agents, traffic) if wait_probability is None else wait_probability
     if aht_seconds <= 0:
         return 0.0
     exponent = -(agents - traffic) * (sla_time_seconds / aht_seconds)
     return max(0.0, min(100.0, (1.0 - c * math.exp(exponent)) * 100.0))
 
 
-def asa_erlang_c(agents: int, traffic: float, aht_seconds: float) -> float:
+def asa_erlang_c(
+    agents: int,
+    traffic: float,
+    aht_seconds: float,
+    wait_probability: float | None = None,
+) -> float:
     """Average speed of answer for Erlang C."""
     if traffic <= 0 or agents <= 0:
         return 0.0
     if agents <= traffic:
         return float("inf")
-    c = erlang_c(agents, traffic)
+    c = erlang_c(agents, traffic) if wait_probability is None else wait_probability
     return (c * aht_seconds) / (agents - traffic)
 
 
+def _erlang_a_series(x: float, y: float) -> tuple[float, float, float, float, float]:
+    """Sums over queue states of M/M/n+M relative to the all-busy state.
+
+    With ``x = n*mu/theta`` and ``y = lambda/theta`` the state with ``j`` callers
+    queued has weight ``t_j = prod(y / (x + i), i = 1..j)``. An arrival joining
+    behind ``j`` callers is eventually served with probability ``x / (x + j + 1)``.
+    Returns ``(sum t_j, served, abandoned, delay, log_scale)`` where every sum is
+    scaled by ``exp(-log_scale)`` to stay finite.
+    """
+    term = 1.0
+    harmonic = 0.0
+    wait_sum = served_sum = abandon_sum = delay_sum = 0.0
+    log_scale = 0.0
+    j = 0
+    while True:
+        harmonic += 1.0 / (x + 1.0 + j)
+        share = term / (x + j + 1.0)
+        wait_sum += term
+        served_sum += share * x
+        abandon_sum += share * (j + 1.0)
+        delay_sum += share * harmonic
+        if j > y - x and term <= 1e-17 * wait_sum:
+            break
+        j += 1
+        term *= y / (x + j)
+        if term > _RESCALE_AT:
+            term /= _RESCALE_AT
+            wait_sum /= _RESCALE_AT
+            served_sum /= _RESCALE_AT
+            abandon_sum /= _RESCALE_AT
+            delay_sum /= _RESCALE_AT
+            log_scale += _LOG_RESCALE_AT
+    return wait_sum, served_sum, abandon_sum, delay_sum, log_scale
+
+
+def erlang_a_measures(
+    agents: int,
+    traffic: float,
+    aht_seconds: float,
+    sla_time_seconds: float,
+    patience_seconds: float,
+    blocking: float | None = None,
+) -> tuple[float, float, float]:
+    """Exact M/M/n+M (Palm/Erlang A) service level %, answered ASA and abandonment %.
+
+    Follows the Garnett-Mandelbaum-Reiman state-space form: the offered wait has
+    density proportional to ``exp(lambda * H(t) - n * mu * t)`` with
+    ``H(t) = (1 - exp(-theta * t)) / theta``, and all integrals reduce to series
+    in the queue-state weights of ``_erlang_a_series``. Service level counts
+    callers answered within ``sla_time_seconds`` over all offered calls, as the
+    simulator does. A non-positive patience means callers never abandon, as in
+    the simulator, and reduces to Erlang C.
+    """
+    if traffic <= 0 or aht_seconds <= 0:
+        return 100.0, 0.0, 0.0
+    if agents <= 0:
+        return 0.0, 0.0, 100.0
+    if patience_seconds <= 0 or math.isinf(patience_seconds):
+        c = erlang_c(agents, traffic, blocking)
+        return sla_erlang_c(agents, traffic, aht_seconds, sla_time_seconds, c), asa_erlang_c(
+            agents, traffic, aht_seconds, c,
+        ), 0.0
+
+    theta = 1.0 / patience_seconds
+    x = agents * patience_seconds / aht_seconds
+    y = traffic * patience_seconds / aht_seconds
+    if blocking is not None and blocking > 0:
+        inv_scaled, inv_log = 1.0 / blocking, 0.0
+    else:
+        inv_scaled, inv_log = _scaled_inverse_erlang_b(agents, traffic)
+
+    wait_sum, served_sum, abandon_sum, delay_sum, series_log = _erlang_a_series(x, y)
+    y_tail = y * math.exp(-theta * sla_time_seconds)
+    _, tail_sum, _, _, tail_log = _erlang_a_series(x, y_tail)
+    tail_log += -(x + 1.0) * theta * sla_time_seconds + (y - y_tail)
+
+    # Express every quantity on a common scale exp(top) before normalising by Z.
+    top = max(inv_log, series_log)
+    idle = inv_scaled * math.exp(inv_log - top) - math.exp(-top)
+    series_scale = math.exp(series_log - top)
+    z = idle + wait_sum * series_scale
+    abandon = abandon_sum * series_scale / z
+    answered_late = tail_sum * math.exp(tail_log - top) / z
+    sla = idle / z + served_sum * series_scale / z - answered_late
+    answered = 1.0 - abandon
+    asa = (x / theta) * delay_sum * series_scale / z / answered if answered > 0 else float("inf")
+    return max(0.0, min(100.0, sla * 100.0)), asa, max(0.0, min(100.0, abandon * 100.0))
+
+
 def abandonment_erlang_a(
     agents: int,
     traffic: float,
     aht_seconds: float,
     patience_seconds: float,
+    blocking: float | None = None,
 ) -> float:
-    """Abandonment rate for Erlang A (exponential patience)."""
-    if traffic <= 0 or patience_seconds <= 0:
-        return 0.0
-    if agents <= traffic:
-        return 100.0
-    c = erlang_c(agents, traffic)
-    if aht_seconds <= 0:
-        return 0.0
-    factor = (agents - traffic) / aht_seconds
-    if factor <= 0:
-        return 0.0
-    return max(0.0, min(100.0, c * (factor / (factor + 1.0 / patience_seconds)) * 100.0))
+    """Abandonment rate for Erlang A (M/M/n+M, exponential patience)."""
+    return erlang_a_measures(agents, traffic, aht_seconds, 0.0, patience_seconds, blocking)[2]
+
+
+def asa_erlang_a(
+    agents: int,
+    traffic: float,
+    aht_seconds: float,
+    patience_seconds: float,
+    blocking: float | None = None,
+) -> float:
+    """Average speed of answer of answered calls for Erlang A."""
+    return erlang_a_measures(agents, traffic, aht_seconds, 0.0, patience_seconds, blocking)[1]
 
 
 def sla_erlang_a(
@@ -100,13 +247,10 @@ def sla_erlang_a(
     aht_seconds: float,
     sla_time_seconds: float,
     patience_seconds: float,
+    blocking: float | None = None,
 ) -> float:
-    """Service level for Erlang A with abandonment."""
-    if traffic <= 0:
-        return 100.0
-    abandon = abandonment_erlang_a(agents, traffic, aht_seconds, patience_seconds) / 100.0
-    base_sla = sla_erlang_c(agents, traffic, aht_seconds, sla_time_seconds) / 100.0
-    return max(0.0, min(100.0, base_sla * (1.0 - abandon * 0.5) * 100.0))
+    """Service level for Erlang A: % of offered calls answered within SLA time."""
+    return erlang_a_measures(agents, traffic, aht_seconds, sla_time_seconds, patience_seconds, blocking)[0]
 
 
 def occupancy(traffic: float, agents: int) -> float:
@@ -123,15 +267,22 @@ def kpis_for_agents(
     model: ErlangModel,
     sla_time_seconds: float = 20.0,
     patience_seconds: float = 120.0,
+    blocking: float | None = None,
 ) -> ErlangKPIs:
-    """Compute KPIs for a fixed agent count using the selected model."""
+    """Compute KPIs for a fixed agent count using the selected model.
+
+    ``blocking`` may carry a precomputed ``erlang_b(agents, traffic)`` so callers
+    stepping through agent counts do not restart the recurrence.
+    """
     if interval_seconds <= 0:
         interval_seconds = 1800.0
     traffic = (volume * aht_seconds) / interval_seconds if volume > 0 else 0.0
     agents = max(1, agents)
+    if blocking is None:
+        blocking = erlang_b(agents, traffic)
 
     if model == ErlangModel.B:
-        block = erlang_b(agents, traffic) * 100.0
+        block = blocking * 100.0
         return ErlangKPIs(
             agents=agents,
             traffic_erlangs=traffic,
@@ -142,30 +293,265 @@ def kpis_for_agents(
             model=model,
         )
 
-    if model == ErlangModel.C:
+    if model == ErlangModel.A:
+        sla, asa, abandon = erlang_a_measures(
+            agents, traffic, aht_seconds, sla_time_seconds, patience_seconds, blocking,
+        )
         return ErlangKPIs(
             agents=agents,
             traffic_erlangs=traffic,
-            sla_pct=sla_erlang_c(agents, traffic, aht_seconds, sla_time_seconds),
-            asa_seconds=asa_erlang_c(agents, traffic, aht_seconds),
-            abandonment_pct=0.0,
+            sla_pct=sla,
+            asa_seconds=asa,
+            abandonment_pct=abandon,
             occupancy_pct=occupancy(traffic, agents),
             model=model,
         )
 
-    # Erlang A
+    c = erlang_c(agents, traffic, blocking)
     return ErlangKPIs(
         agents=agents,
         traffic_erlangs=traffic,
-        sla_pct=sla_erlang_a(agents, traffic, aht_seconds, sla_time_seconds, patience_seconds),
-        asa_seconds=asa_erlang_c(agents, traffic, aht_seconds),
-        abandonment_pct=abandonment_erlang_a(agents, traffic, aht_seconds, patience_seconds),
+        sla_pct=sla_erlang_c(agents, traffic, aht_seconds, sla_time_seconds, c),
+        asa_seconds=asa_erlang_c(agents, traffic, aht_seconds, c),
+        abandonment_pct=0.0,
         occupancy_pct=occupancy(traffic, agents),
         model=model,
     )
 
 
-def required_agents(
+def log_erlang_b(agents: int, traffic: float) -> float:
+    """Natural log of Erlang B blocking, finite where ``erlang_b`` underflows to zero."""
+    if agents <= 0:
+        return 0.0
+    if traffic <= 0:
+        return -math.inf
+    scaled, log_scale = _scaled_inverse_erlang_b(agents, traffic)
+    return -(math.log(scaled) + log_scale)
+
+
+def log_erlang_c(agents: int, traffic: float, log_blocking: float | None = None) -> float:
+    """Natural log of the Erlang C probability of wait."""
+    if agents <= 0:
+        return 0.0
+    if traffic <= 0:
+        return -math.inf
+    if agents <= traffic:
+        return 0.0
+    lb = log_erlang_b(agents, traffic) if log_blocking is None else log_blocking
+    denom = agents - traffic * (1.0 - math.exp(lb))
+    if denom <= 0:
+        return 0.0
+    return math.log(agents) + lb - math.log(denom)
+
+
+def sla_erlang_c_log(
+    agents: int,
+    traffic: float,
+    aht_seconds: float,
+    sla_time_seconds: float,
+    log_wait_probability: float | None = None,
+) -> float:
+    """Erlang C service level with the wait tail ``C * exp(-(n - A) t / AHT)`` kept in log space."""
+    if traffic <= 0 or agents <= 0:
+        return 100.0
+    if agents <= traffic:
+        return 0.0
+    if aht_seconds <= 0:
+        return 0.0
+    log_c = log_erlang_c(agents, traffic) if log_wait_probability is None else log_wait_probability
+    log_tail = log_c - (agents - traffic) * (sla_time_seconds / aht_seconds)
+    return max(0.0, min(100.0, -math.expm1(log_tail) * 100.0))
+
+
+def asa_erlang_c_log(
+    agents: int,
+    traffic: float,
+    aht_seconds: float,
+    log_wait_probability: float | None = None,
+) -> float:
+    """Erlang C average speed of answer evaluated from ``log C``."""
+    if traffic <= 0 or agents <= 0 or aht_seconds <= 0:
+        return 0.0
+    if agents <= traffic:
+        return float("inf")
+    log_c = log_erlang_c(agents, traffic) if log_wait_probability is None else log_wait_probability
+    return math.exp(log_c + math.log(aht_seconds) - math.log(agents - traffic))
+
+
+def kpis_for_agents_log(
+    agents: int,
+    volume: float,
+    interval_seconds: float,
+    aht_seconds: float,
+    model: ErlangModel,
+    sla_time_seconds: float = 20.0,
+    patience_seconds: float = 120.0,
+    log_blocking: float | None = None,
+) -> ErlangKPIs:
+    """Log-space counterpart of ``kpis_for_agents`` for pools of thousands of agents.
+
+    Blocking and wait probabilities stay in log space until the final KPI, so
+    neither the Erlang B recurrence nor the SLA tail underflows.
+    """
+    if interval_seconds <= 0:
+        interval_seconds = 1800.0
+    traffic = (volume * aht_seconds) / interval_seconds if volume > 0 else 0.0
+    agents = max(1, agents)
+    if log_blocking is None:
+        log_blocking = log_erlang_b(agents, traffic)
+
+    if model == ErlangModel.B:
+        block = math.exp(log_blocking) * 100.0
+        return ErlangKPIs(
+            agents=agents,
+            traffic_erlangs=traffic,
+            sla_pct=max(0.0, 100.0 - block),
+            asa_seconds=0.0,
+            abandonment_pct=block,
+            occupancy_pct=occupancy(traffic, agents),
+            model=model,
+        )
+
+    if model == ErlangModel.A:
+        # The Erlang A series rescales on its own; only a representable blocking is worth passing on.
+        blocking = math.exp(log_blocking)
+        sla, asa, abandon = erlang_a_measures(
+            agents, traffic, aht_seconds, sla_time_seconds, patience_seconds, blocking if blocking > 0 else None,
+        )
+        return ErlangKPIs(
+            agents=agents,
+            traffic_erlangs=traffic,
+            sla_pct=sla,
+            asa_seconds=asa,
+            abandonment_pct=abandon,
+            occupancy_pct=occupancy(traffic, agents),
+            model=model,
+        )
+
+    log_c = log_erlang_c(agents, traffic, log_blocking)
+    return ErlangKPIs(
+        agents=agents,
+        traffic_erlangs=traffic,
+        sla_pct=sla_erlang_c_log(agents, traffic, aht_seconds, sla_time_seconds, log_c),
+        asa_seconds=asa_erlang_c_log(agents, traffic, aht_seconds, log_c),
+        abandonment_pct=0.0,
+        occupancy_pct=occupancy(traffic, agents),
+        model=model,
+    )
+
+
+def _meets_target(kpi: ErlangKPIs, model: ErlangModel, sla_target_pct: float) -> bool:
+    if model == ErlangModel.B:
+        return kpi.abandonment_pct <= (100.0 - sla_target_pct)
+    return kpi.sla_pct >= sla_target_pct
+
+
+def _square_root_staffing(traffic: float, sla_target_pct: float) -> int:
+    """Halfin-Whitt style guess ``A + beta * sqrt(A)`` with beta from the target quantile."""
+    target = min(max(sla_target_pct / 100.0, 0.5), 1.0 - 1e-9)
+    beta = NormalDist().inv_cdf(target)
+    return int(math.ceil(traffic + beta * math.sqrt(traffic)))
+
+
+def _scan_agents(
+    volume: float,
+    interval_seconds: float,
+    aht_seconds: float,
+    model: ErlangModel,
+    sla_target_pct: float,
+    sla_time_seconds: float,
+    patience_seconds: float,
+    traffic: float,
+    start: int,
+    max_agents: int | None,
+    incremental: bool,
+    log_space: bool,
+) -> AgentSolution:
+    evaluate = kpis_for_agents_log if log_space else kpis_for_agents
+    inv_b = _inverse_erlang_b(start - 1, traffic) if incremental and not log_space else 1.0
+    state = _scaled_inverse_erlang_b(start - 1, traffic) if incremental and log_space else (1.0, 0.0)
+    candidates = count(start) if max_agents is None else range(start, max_agents + 1)
+    evaluations = 0
+
+    for n in candidates:
+        blocking = None
+        if incremental and log_space:
+            state = _scaled_inverse_erlang_b(n, traffic, n - 1, state)
+            blocking = -(math.log(state[0]) + state[1])
+        elif incremental:
+            inv_b = _inverse_erlang_b(n, traffic, n - 1, inv_b)
+            blocking = 1.0 / inv_b
+        kpi = evaluate(n, volume, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds, blocking)
+        evaluations += 1
+        if _meets_target(kpi, model, sla_target_pct):
+            return AgentSolution(n, kpi, evaluations)
+
+    kpi = evaluate(max_agents, volume, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds)
+    return AgentSolution(max_agents, kpi, evaluations + 1, capped=True)
+
+
+def _bisect_agents(
+    volume: float,
+    interval_seconds: float,
+    aht_seconds: float,
+    model: ErlangModel,
+    sla_target_pct: float,
+    sla_time_seconds: float,
+    patience_seconds: float,
+    traffic: float,
+    start: int,
+    max_agents: int | None,
+    log_space: bool,
+) -> AgentSolution:
+    evaluate = kpis_for_agents_log if log_space else kpis_for_agents
+    evaluated: dict[int, ErlangKPIs] = {}
+
+    def meets(n: int) -> bool:
+        kpi = evaluate(n, volume, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds)
+        evaluated[n] = kpi
+        return _meets_target(kpi, model, sla_target_pct)
+
+    guess = max(start, _square_root_staffing(traffic, sla_target_pct))
+    if max_agents is not None:
+        guess = min(guess, max_agents)
+
+    # Bracket: ``lo`` fails (or lies below the search range), ``hi`` meets the target.
+    step = 1
+    if meets(guess):
+        lo, hi = start - 1, guess
+        probe = guess - step
+        while probe >= start:
+            if not meets(probe):
+                lo = probe
+                break
+            hi = probe
+            step *= 2
+            probe = hi - step
+    else:
+        lo = guess
+        while True:
+            probe = lo + step
+            if max_agents is not None and probe >= max_agents:
+                if lo >= max_agents or not meets(max_agents):
+                    return AgentSolution(max_agents, evaluated[max_agents], len(evaluated), capped=True)
+                hi = max_agents
+                break
+            if meets(probe):
+                hi = probe
+                break
+            lo = probe
+            step *= 2
+
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if meets(mid):
+            hi = mid
+        else:
+            lo = mid
+    return AgentSolution(hi, evaluated[hi], len(evaluated))
+
+
+def solve_required_agents(
     volume: float,
     interval_seconds: float,
     aht_seconds: float,
@@ -173,23 +559,56 @@ def required_agents(
     sla_target_pct: float = 80.0,
     sla_time_seconds: float = 20.0,
     patience_seconds: float = 120.0,
-    max_agents: int = 500,
-) -> tuple[int, ErlangKPIs]:
-    """Find minimum agents to meet SLA target."""
+    max_agents: int | None = None,
+    search: AgentSearch = AgentSearch.BISECT,
+    log_space: bool = False,
+) -> AgentSolution:
+    """Find minimum agents to meet SLA target and report how many evaluations it took.
+
+    ``AgentSearch.BISECT`` starts from a square-root-staffing estimate, brackets
+    the answer with doubling steps and bisects on the monotone SLA curve, so it
+    needs O(log n) evaluations. ``max_agents=None`` removes the agent cap.
+    ``log_space=True`` evaluates candidates with ``kpis_for_agents_log``.
+    """
     if volume <= 0:
         kpi = kpis_for_agents(0, 0, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds)
-        return 0, kpi
+        return AgentSolution(0, kpi, 1)
 
     traffic = (volume * aht_seconds) / interval_seconds
     start = max(1, int(math.ceil(traffic)))
+    args = (volume, interval_seconds, aht_seconds, model, sla_target_pct, sla_time_seconds, patience_seconds, traffic)
 
-    for n in range(start, max_agents + 1):
-        kpi = kpis_for_agents(n, volume, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds)
-        if model == ErlangModel.B:
-            if kpi.abandonment_pct <= (100.0 - sla_target_pct):
-                return n, kpi
-        elif kpi.sla_pct >= sla_target_pct:
-            return n, kpi
+    if max_agents is not None and start > max_agents:
+        # Traffic alone exceeds the cap, so no count is eligible under any strategy.
+        evaluate = kpis_for_agents_log if log_space else kpis_for_agents
+        kpi = evaluate(max_agents, volume, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds)
+        return AgentSolution(max_agents, kpi, 1, capped=True)
+    if search == AgentSearch.BISECT:
+        return _bisect_agents(*args, start, max_agents, log_space)
+    return _scan_agents(*args, start, max_agents, search == AgentSearch.INCREMENTAL, log_space)
 
-    kpi = kpis_for_agents(max_agents, volume, interval_seconds, aht_seconds, model, sla_time_seconds, patience_seconds)
-    return max_agents, kpi
+
+def required_agents(
+    volume: float,
+    interval_seconds: float,
+    aht_seconds: float,
+    model: ErlangModel,
+    sla_target_pct: float = 80.0,
+    sla_time_seconds: float = 20.0,
+    patience_seconds: float = 120.0,
+    max_agents: int | None = 500,
+    search: AgentSearch = AgentSearch.INCREMENTAL,
+) -> tuple[int, ErlangKPIs]:
+    """Find minimum agents to meet SLA target.
+
+    ``AgentSearch.INCREMENTAL`` carries the Erlang B recurrence forward as the
+    candidate count grows, so a search is linear in the answer instead of
+    quadratic. ``AgentSearch.LINEAR`` re-evaluates every candidate from scratch
+    and is kept as the reference. ``AgentSearch.BISECT`` brackets and bisects;
+    see ``solve_required_agents``. All modes return identical results.
+    """
+    solution = solve_required_agents(
+        volume, interval_seconds, aht_seconds, model, sla_target_pct,
+        sla_time_seconds, patience_seconds, max_agents, search,
+    )
+    return solution.agents, solution.kpis
@@ -1,3 +1,3 @@
-from core.forecasting.selector import select_and_forecast
+from core.forecasting.selector import select_and_forecast, select_and_forecast_many
 
-__all__ = ["select_and_forecast"]
+__all__ = ["select_and_forecast", "select_and_forecast_many"]
@@ -1,65 +1,90 @@
-"""Forecast models with automatic selection by holdout accuracy."""
+"""Forecast models with automatic selection by holdout accuracy.
+
+Every model takes a history array of shape ``(length,)`` or ``(series, length)``
+and returns forecasts of shape ``(horizon,)`` or ``(series, horizon)``, so many
+queue/skill series of a common length are forecast and scored together.
+"""
 
 from __future__ import annotations
 
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
 import numpy as np
+from numpy.typing import ArrayLike
 
 from core.models import Forecast, ForecastPoint
 
 
-def _wmape(actual: np.ndarray, predicted: np.ndarray) -> float:
-    denom = np.sum(np.abs(actual))
-    if denom == 0:
-        return 0.0
-    return float(np.sum(np.abs(actual - predicted)) / denom * 100.0)
+def _wmape(actual: np.ndarray, predicted: np.ndarray) -> np.ndarray:
+    """WMAPE along the last axis; 0 where the actuals sum to zero."""
+    denom = np.sum(np.abs(actual), axis=-1)
+    error = np.sum(np.abs(actual - predicted), axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denom == 0, 0.0, error / denom * 100.0)
 
 
-def _mape(actual: np.ndarray, predicted: np.ndarray) -> float:
+def _mape(actual: np.ndarray, predicted: np.ndarray) -> np.ndarray:
+    """MAPE along the last axis over non-zero actuals; 0 where every actual is zero."""
     mask = actual != 0
-    if not np.any(mask):
-        return 0.0
-    return float(np.mean(np.abs((actual[mask] - predicted[mask]) / actual[mask])) * 100.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(mask, np.abs((actual - predicted) / actual), 0.0)
+        counts = np.sum(mask, axis=-1)
+        return np.where(counts == 0, 0.0, np.sum(ratios, axis=-1) / counts * 100.0)
+
+
+def _bias(actual: np.ndarray, predicted: np.ndarray) -> np.ndarray:
+    if actual.shape[-1] == 0:
+        return np.zeros(actual.shape[:-1])
+    return np.mean(predicted - actual, axis=-1)
+
 
+def _as_batch(history: ArrayLike) -> tuple[np.ndarray, bool]:
+    values = np.asarray(history, dtype=np.float64)
+    return np.atleast_2d(values), values.ndim == 1
 
-def _bias(actual: np.ndarray, predicted: np.ndarray) -> float:
-    if len(actual) == 0:
-        return 0.0
-    return float(np.mean(predicted - actual))
 
+def _shape_like(forecast: np.ndarray, single: bool) -> np.ndarray:
+    return forecast[0] if single else forecast
 
-def forecast_naive(history: list[float], horizon: int) -> list[float]:
-    last = history[-1] if history else 0.0
-    return [last] * horizon
 
+def forecast_naive(history: ArrayLike, horizon: int) -> np.ndarray:
+    values, single = _as_batch(history)
+    last = values[:, -1:] if values.shape[1] else np.zeros((len(values), 1))
+    return _shape_like(np.repeat(last, horizon, axis=1), single)
 
-def forecast_moving_average(history: list[float], horizon: int, window: int = 7) -> list[float]:
-    if not history:
-        return [0.0] * horizon
-    avg = float(np.mean(history[-window:]))
-    return [avg] * horizon
 
+def forecast_moving_average(history: ArrayLike, horizon: int, window: int = 7) -> np.ndarray:
+    values, single = _as_batch(history)
+    if not values.shape[1]:
+        return _shape_like(np.zeros((len(values), horizon)), single)
+    avg = values[:, -window:].mean(axis=1, keepdims=True)
+    return _shape_like(np.repeat(avg, horizon, axis=1), single)
 
-def forecast_seasonal_naive(history: list[float], horizon: int, season: int = 7) -> list[float]:
-    if len(history) < season:
-        return forecast_moving_average(history, horizon)
-    result = []
-    for i in range(horizon):
-        idx = len(history) - season + (i % season)
-        result.append(history[idx])
-    return result
 
+def forecast_seasonal_naive(history: ArrayLike, horizon: int, season: int = 7) -> np.ndarray:
+    values, single = _as_batch(history)
+    if values.shape[1] < season:
+        return _shape_like(forecast_moving_average(values, horizon), single)
+    positions = values.shape[1] - season + np.arange(horizon) % season
+    return _shape_like(values[:, positions], single)
 
-def forecast_linear_trend(history: list[float], horizon: int) -> list[float]:
-    if len(history) < 2:
-        return forecast_naive(history, horizon)
-    x = np.arange(len(history))
-    coeffs = np.polyfit(x, history, 1)
-    result = []
-    for i in range(horizon):
-        result.append(float(coeffs[0] * (len(history) + i) + coeffs[1]))
-    return [max(0.0, v) for v in result]
+
+def forecast_linear_trend(history: ArrayLike, horizon: int) -> np.ndarray:
+    values, single = _as_batch(history)
+    length = values.shape[1]
+    if length < 2:
+        return _shape_like(forecast_naive(values, horizon), single)
+    # Least-squares line per series, the closed form of ``np.polyfit(x, y, 1)``.
+    x = np.arange(length, dtype=np.float64)
+    centred = x - x.mean()
+    means = values.mean(axis=1, keepdims=True)
+    # Row-wise sums rather than a matrix product keep each series' result independent of the batch.
+    slope = np.sum((values - means) * centred, axis=1, keepdims=True) / np.sum(centred * centred)
+    steps = np.arange(length, length + horizon, dtype=np.float64) - x.mean()
+    return _shape_like(np.maximum(0.0, means + slope * steps), single)
 
 
 MODELS = {
@@ -70,76 +95,157 @@ MODELS = {
 }
 
 
-def select_and_forecast(
-    timestamps: list[datetime],
-    volumes: list[float],
-    horizon: int,
-    holdout: int | None = None,
-) -> Forecast:
-    if not volumes:
-        return Forecast(
-            points=[],
-            model_name="none",
-            accuracy_wmape=None,
-            accuracy_mape=None,
-            bias=None,
-            fallback_used=True,
-            fallback_reason="No historical data",
-        )
-
-    holdout = holdout or max(1, min(7, len(volumes) // 5))
-    fallback_used = False
-    fallback_reason = None
-
-    if len(volumes) < holdout + 2:
-        fallback_used = True
-        fallback_reason = f"Insufficient history ({len(volumes)} points) for holdout validation"
-        preds = forecast_moving_average(volumes, horizon)
-        model_name = "moving_average"
-        wmape = mape = bias = None
-    else:
-        train = volumes[:-holdout]
-        test = np.array(volumes[-holdout:])
-        best_name = "moving_average"
-        best_wmape = float("inf")
-        best_preds_holdout: list[float] = []
-
-        for name, fn in MODELS.items():
-            try:
-                preds_holdout = fn(train, holdout)
-                score = _wmape(test, np.array(preds_holdout))
-                if score < best_wmape:
-                    best_wmape = score
-                    best_name = name
-                    best_preds_holdout = preds_holdout
-            except Exception:
-                continue
-
-        model_name = best_name
-        preds = MODELS[model_name](volumes, horizon)
-        wmape = _wmape(test, np.array(best_preds_holdout))
-        mape = _mape(test, np.array(best_preds_holdout))
-        bias = _bias(test, np.array(best_preds_holdout))
+_METRICS = ("wmape", "mape", "bias")
+
+
+def _score_series(job: tuple[np.ndarray, int, int]) -> np.ndarray:
+    """Rolling-origin scores of one block of series as ``(models, folds, metrics, series)``.
+
+    Fold ``k`` trains on everything before origin ``length - (folds - k) * holdout``
+    and tests on the ``holdout`` points after it, so the last fold is the
+    classic single holdout.
+    """
+    values, holdout, folds = job
+    length = values.shape[1]
+    scores = np.empty((len(MODELS), folds, len(_METRICS), values.shape[0]))
+    for k in range(folds):
+        origin = length - (folds - k) * holdout
+        train, test = values[:, :origin], values[:, origin:origin + holdout]
+        for m, model in enumerate(MODELS.values()):
+            predictions = model(train, holdout)
+            scores[m, k] = (_wmape(test, predictions), _mape(test, predictions), _bias(test, predictions))
+    return scores
+
 
+def _cross_validate(values: np.ndarray, holdout: int, folds: int, max_workers: int | None) -> np.ndarray:
+    """Score every model on every fold, splitting the series into one chunk per worker.
+
+    Each worker receives its rows once and runs all models and folds on them,
+    so the history is pickled once per chunk rather than once per job.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    max_workers = max(1, min(max_workers, len(values)))
+    if max_workers == 1:
+        return _score_series((values, holdout, folds))
+    jobs = [(chunk, holdout, folds) for chunk in np.array_split(values, max_workers)]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return np.concatenate(list(pool.map(_score_series, jobs)), axis=-1)
+
+
+def _forecast_points(timestamps: Sequence[datetime], predictions: np.ndarray) -> list[ForecastPoint]:
     last_ts = timestamps[-1] if timestamps else datetime.now()
     delta = timedelta(days=1)
     if len(timestamps) >= 2:
         delta = timestamps[1] - timestamps[0]
-
-    points = [
-        ForecastPoint(
-            timestamp=last_ts + delta * (i + 1),
-            volume=max(0.0, preds[i]),
-        )
-        for i in range(horizon)
+    return [
+        ForecastPoint(timestamp=last_ts + delta * (i + 1), volume=max(0.0, value))
+        for i, value in enumerate(predictions.tolist())
     ]
 
-    return Forecast(
-        points=points,
-        model_name=model_name,
-        accuracy_wmape=wmape,
-        accuracy_mape=mape,
-        bias=bias,
-        fallback_used=fallback_used,
-        fallback_reason=fallback_reason,
-    )
+
+def select_and_forecast_many(
+    timestamps: Sequence[datetime],
+    volumes: ArrayLike,
+    horizon: int,
+    holdout: int | None = None,
+    folds: int = 4,
+    max_workers: int | None = 1,
+) -> list[Forecast]:
+    """Select a model per series and forecast, for series sharing ``timestamps``.
+
+    ``volumes`` has shape ``(series, len(timestamps))``. Models are scored by
+    rolling-origin cross-validation over up to ``folds`` consecutive holdout
+    windows (fewer when the history is short; ``folds=1`` is a single holdout).
+    Each series keeps the model with the lowest finite mean WMAPE across folds
+    (the first listed in ``MODELS`` on ties); a series no model can score, e.g.
+    with missing values in every holdout, falls back to the moving average.
+    Scoring runs serially by default, as the vectorized models are cheap;
+    ``max_workers`` above one (``None`` for one per CPU) splits the series into
+    chunks scored across a process pool.
+    """
+    if folds < 1:
+        raise ValueError("folds must be at least 1")
+    values = np.asarray(volumes, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError("volumes must have shape (series, length)")
+    series, length = values.shape
+    if not length:
+        return [
+            Forecast(
+                points=[],
+                model_name="none",
+                accuracy_wmape=None,
+                accuracy_mape=None,
+                bias=None,
+                fallback_used=True,
+                fallback_reason="No historical data",
+            )
+            for _ in range(series)
+        ]
+
+    holdout = holdout or max(1, min(7, length // 5))
+    if length < holdout + 2:
+        reason = f"Insufficient history ({length} points) for holdout validation"
+        predictions = forecast_moving_average(values, horizon)
+        return [
+            Forecast(
+                points=_forecast_points(timestamps, predictions[s]),
+                model_name="moving_average",
+                accuracy_wmape=None,
+                accuracy_mape=None,
+                bias=None,
+                fallback_used=True,
+                fallback_reason=reason,
+            )
+            for s in range(series)
+        ]
+
+    # Every fold keeps at least two training points.
+    folds = min(folds, (length - 2) // holdout)
+    scores = _cross_validate(values, holdout, folds, max_workers)
+    means = scores.mean(axis=1)
+    names = list(MODELS)
+    # Non-finite scores (NaN in the history) are never selected, as a model that fails to score.
+    finite = np.isfinite(means[:, 0])
+    best = np.argmin(np.where(finite, means[:, 0], np.inf), axis=0)
+    unscored = ~finite.any(axis=0)
+    best[unscored] = names.index("moving_average")
+    chosen = means[best, :, np.arange(series)]
+
+    forecasts: dict[int, Forecast] = {}
+    for index in np.unique(best).tolist():
+        rows = np.flatnonzero(best == index)
+        predictions = MODELS[names[index]](values[rows], horizon)
+        for k, s in enumerate(rows.tolist()):
+            forecasts[s] = Forecast(
+                points=_forecast_points(timestamps, predictions[k]),
+                model_name=names[index],
+                accuracy_wmape=float(chosen[s, 0]),
+                accuracy_mape=float(chosen[s, 1]),
+                bias=float(chosen[s, 2]),
+                fallback_used=bool(unscored[s]),
+                fallback_reason="No model produced a finite holdout score" if unscored[s] else None,
+                cv_folds=folds,
+                cv_scores={
+                    name: {metric: scores[m, :, j, s].tolist() for j, metric in enumerate(_METRICS)}
+                    for m, name in enumerate(names)
+                },
+            )
+    return [forecasts[s] for s in range(series)]
+
+
+def select_and_forecast(
+    timestamps: list[datetime],
+    volumes: list[float],
+    horizon: int,
+    holdout: int | None = None,
+    folds: int = 4,
+    max_workers: int | None = 1,
+) -> Forecast:
+    """Single-series ``select_and_forecast_many``."""
+    return select_and_forecast_many(
+        timestamps, np.asarray(volumes, dtype=np.float64)[None, :], horizon, holdout, folds, max_workers,
+    )[0]
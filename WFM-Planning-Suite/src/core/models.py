@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, overload
+
+import numpy as np
 
 
 class ChannelType(str, Enum):
@@ -20,8 +24,19 @@ class ErlangModel(str, Enum):
     C = "erlang_c"
 
 
+class ServiceDistribution(str, Enum):
+    EXPONENTIAL = "exponential"
+    LOGNORMAL = "lognormal"
+
+
+class ArrivalProcess(str, Enum):
+    FIXED = "fixed"
+    POISSON = "poisson"
+
+
 class IntervalMethod(str, Enum):
     HISTORICAL = "historical"
+    HISTORICAL_WEEKDAY = "historical_weekday"
     FLAT_EQUAL = "flat_equal"
 
 
@@ -39,6 +54,18 @@ class Profile:
     channel: ChannelType = ChannelType.VOICE
     erlang_model: ErlangModel = ErlangModel.C
     interval_minutes: int = 30
+    max_concurrency: int = 1
+    concurrency_aht_factors: list[float] = field(default_factory=list)
+
+    def concurrency_factor(self, concurrency: int) -> float:
+        """AHT multiplier when an agent handles ``concurrency`` chats at once.
+
+        ``concurrency_aht_factors[c - 1]`` holds the factor for level ``c``;
+        levels past the end of the curve reuse its last factor.
+        """
+        if not self.concurrency_aht_factors:
+            return 1.0
+        return self.concurrency_aht_factors[min(concurrency, len(self.concurrency_aht_factors)) - 1]
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -54,6 +81,8 @@ class Profile:
             "channel": self.channel.value,
             "erlang_model": self.erlang_model.value,
             "interval_minutes": self.interval_minutes,
+            "max_concurrency": self.max_concurrency,
+            "concurrency_aht_factors": list(self.concurrency_aht_factors),
         }
 
     @classmethod
@@ -71,6 +100,8 @@ class Profile:
             channel=ChannelType(data.get("channel", "voice")),
             erlang_model=ErlangModel(data.get("erlang_model", "erlang_c")),
             interval_minutes=int(data.get("interval_minutes", 30)),
+            max_concurrency=int(data.get("max_concurrency", 1)),
+            concurrency_aht_factors=[float(f) for f in data.get("concurrency_aht_factors", [])],
         )
 
 
@@ -110,6 +141,12 @@ class ForecastPoint:
 
 @dataclass
 class Forecast:
+    """Selected model forecast; accuracies are means over the rolling-origin folds.
+
+    ``cv_scores[model][metric]`` holds one value per fold for every candidate
+    model and each of ``"wmape"``, ``"mape"`` and ``"bias"``.
+    """
+
     points: list[ForecastPoint]
     model_name: str
     accuracy_wmape: float | None
@@ -117,16 +154,79 @@ class Forecast:
     bias: float | None
     fallback_used: bool = False
     fallback_reason: str | None = None
-
-
-@dataclass
+    cv_folds: int = 0
+    cv_scores: dict[str, dict[str, list[float]]] = field(default_factory=dict)
+
+
+def _fields_equal(left: Any, right: Any) -> bool:
+    """Dataclass equality that compares ``ndarray`` fields with ``np.array_equal``.
+
+    The generated ``__eq__`` compares field tuples, which raises for arrays of
+    more than one element.
+    """
+    if type(left) is not type(right):
+        return NotImplemented
+    for f in fields(left):
+        if not f.compare:
+            continue
+        a, b = getattr(left, f.name), getattr(right, f.name)
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            if not np.array_equal(a, b):
+                return False
+        elif a != b:
+            return False
+    return True
+
+
+@dataclass(eq=False)
 class IntervalDemand:
-    intervals: list[dict[str, Any]]
+    """Interval volumes stored column-wise: ``datetime64[us]`` timestamps and ``float64`` volumes."""
+
+    timestamps: np.ndarray
+    volumes: np.ndarray
     interval_method: IntervalMethod
     approximations: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self.timestamps = np.asarray(self.timestamps, dtype="datetime64[us]")
+        self.volumes = np.asarray(self.volumes, dtype=np.float64)
+        if self.timestamps.shape != self.volumes.shape:
+            raise ValueError("timestamps and volumes must have the same length")
 
-@dataclass
+    def __len__(self) -> int:
+        return len(self.volumes)
+
+    def __eq__(self, other: object) -> bool:
+        return _fields_equal(self, other)
+
+    @property
+    def intervals(self) -> tuple[Mapping[str, Any], ...]:
+        """Read-only row view as ``{"timestamp", "volume"}`` mappings, built on each access.
+
+        Change the data through ``volumes`` or by building a new demand with
+        ``from_intervals``.
+        """
+        return tuple(
+            MappingProxyType({"timestamp": ts, "volume": vol})
+            for ts, vol in zip(self.timestamps.tolist(), self.volumes.tolist())
+        )
+
+    @classmethod
+    def from_intervals(
+        cls,
+        intervals: Sequence[Mapping[str, Any]],
+        interval_method: IntervalMethod,
+        approximations: list[str] | None = None,
+    ) -> IntervalDemand:
+        return cls(
+            timestamps=np.array([item["timestamp"] for item in intervals], dtype="datetime64[us]"),
+            volumes=np.array([float(item.get("volume", 0)) for item in intervals], dtype=np.float64),
+            interval_method=interval_method,
+            approximations=list(approximations or []),
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class SizingRow:
     timestamp: datetime
     volume: float
@@ -135,14 +235,125 @@ class SizingRow:
     asa_seconds: float
     abandonment_pct: float
     erlang_model: ErlangModel
-    overrides: list[str] = field(default_factory=list)
+    overrides: tuple[str, ...] = ()
 
 
-@dataclass
+class SizingRows(Sequence[SizingRow]):
+    """Read-only row view over a ``SizingResult``; rows are frozen and built on access.
+
+    Change sizing through the result's columns, e.g. ``result.agents_required[i] = n``.
+    """
+
+    __slots__ = ("_result",)
+
+    def __init__(self, result: SizingResult):
+        self._result = result
+
+    def __len__(self) -> int:
+        return len(self._result.volumes)
+
+    @overload
+    def __getitem__(self, index: int) -> SizingRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SizingRow]: ...
+
+    def __getitem__(self, index: int | slice) -> SizingRow | list[SizingRow]:
+        if isinstance(index, slice):
+            return list(self._iter(index))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sizing row index out of range")
+        return next(self._iter(slice(index, index + 1)))
+
+    def __iter__(self) -> Iterator[SizingRow]:
+        return self._iter(slice(None))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"SizingRows({len(self)} rows)"
+
+    def _iter(self, window: slice) -> Iterator[SizingRow]:
+        r = self._result
+        model = r.profile.erlang_model
+        columns = zip(
+            range(len(self))[window],
+            r.timestamps[window].tolist(),
+            r.volumes[window].tolist(),
+            r.agents_required[window].tolist(),
+            r.sla_pct[window].tolist(),
+            r.asa_seconds[window].tolist(),
+            r.abandonment_pct[window].tolist(),
+        )
+        for i, ts, volume, agents, sla, asa, abandon in columns:
+            yield SizingRow(ts, volume, agents, sla, asa, abandon, model, r.overrides.get(i, ()))
+
+
+@dataclass(eq=False)
 class SizingResult:
-    rows: list[SizingRow]
+    """Per-interval sizing stored column-wise; ``rows`` gives the row view.
+
+    ``overrides`` is sparse: only intervals with override notes have an entry.
+    Every row shares the profile's Erlang model.
+    """
+
     profile: Profile
+    timestamps: np.ndarray
+    volumes: np.ndarray
+    agents_required: np.ndarray
+    sla_pct: np.ndarray
+    asa_seconds: np.ndarray
+    abandonment_pct: np.ndarray
+    overrides: dict[int, tuple[str, ...]] = field(default_factory=dict)
     approximations: list[str] = field(default_factory=list)
+    occupancy_floor: float | None = None
+
+    def __post_init__(self) -> None:
+        self.timestamps = np.asarray(self.timestamps, dtype="datetime64[us]")
+        self.volumes = np.asarray(self.volumes, dtype=np.float64)
+        self.agents_required = np.asarray(self.agents_required, dtype=np.int64)
+        self.sla_pct = np.asarray(self.sla_pct, dtype=np.float64)
+        self.asa_seconds = np.asarray(self.asa_seconds, dtype=np.float64)
+        self.abandonment_pct = np.asarray(self.abandonment_pct, dtype=np.float64)
+        columns = (self.volumes, self.agents_required, self.sla_pct, self.asa_seconds, self.abandonment_pct)
+        if any(c.shape != self.timestamps.shape for c in columns):
+            raise ValueError("SizingResult columns must have the same length")
+
+    def __eq__(self, other: object) -> bool:
+        return _fields_equal(self, other)
+
+    @property
+    def rows(self) -> SizingRows:
+        return SizingRows(self)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[SizingRow],
+        profile: Profile,
+        approximations: list[str] | None = None,
+        occupancy_floor: float | None = None,
+    ) -> SizingResult:
+        rows = list(rows)
+        if any(r.erlang_model != profile.erlang_model for r in rows):
+            raise ValueError("SizingResult rows must share the profile's Erlang model")
+        return cls(
+            profile=profile,
+            timestamps=np.array([r.timestamp for r in rows], dtype="datetime64[us]"),
+            volumes=np.array([r.volume for r in rows], dtype=np.float64),
+            agents_required=np.array([r.agents_required for r in rows], dtype=np.int64),
+            sla_pct=np.array([r.sla_pct for r in rows], dtype=np.float64),
+            asa_seconds=np.array([r.asa_seconds for r in rows], dtype=np.float64),
+            abandonment_pct=np.array([r.abandonment_pct for r in rows], dtype=np.float64),
+            overrides={i: tuple(r.overrides) for i, r in enumerate(rows) if r.overrides},
+            approximations=list(approximations or []),
+            occupancy_floor=occupancy_floor,
+        )
 
 
 @dataclass
@@ -168,6 +379,30 @@ class SimulationResult:
     warmup_excluded: bool = True
     cross_check_passed: bool | None = None
     cross_check_notes: str | None = None
+    replications: int = 1
+    confidence: float | None = None
+    sla_ci: tuple[float, float] | None = None
+    asa_ci: tuple[float, float] | None = None
+    abandonment_ci: tuple[float, float] | None = None
+    trace: np.ndarray | None = field(default=None, compare=False, repr=False)
+
+
+@dataclass(eq=False)
+class IntervalSimulation:
+    """Continuous-time simulation with per-interval KPIs, indexed by arrival interval."""
+
+    summary: SimulationResult
+    timestamps: np.ndarray
+    agents: np.ndarray
+    offered: np.ndarray
+    answered: np.ndarray
+    abandoned: np.ndarray
+    sla_pct: np.ndarray
+    asa_seconds: np.ndarray
+    abandonment_pct: np.ndarray
+
+    def __eq__(self, other: object) -> bool:
+        return _fields_equal(self, other)
 
 
 @dataclass
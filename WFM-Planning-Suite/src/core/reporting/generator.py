@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable
 
 from core.models import Forecast, Profile, Report, Schedule, SimulationResult, SizingResult
+from core.sizing.orchestrator import iter_sizing_rows
 
 
 def build_report(
@@ -59,7 +60,12 @@ def build_report(
     )
 
 
-def report_to_export_dict(report: Report, sizing: SizingResult) -> dict[str, Any]:
+def report_to_export_dict(report: Report, sizing: SizingResult | Iterable[SizingResult]) -> dict[str, Any]:
+    """Sheet rows for export.
+
+    The "Sizing" sheet is a single-use generator so ``export_report_excel`` can
+    stream it row by row; call this again for a second pass over the rows.
+    """
     return {
         "sheets": {
             "Summary": [
@@ -67,7 +73,7 @@ def report_to_export_dict(report: Report, sizing: SizingResult) -> dict[str, Any
                 for section in report.sections
                 for item in section["items"]
             ],
-            "Sizing": [
+            "Sizing": (
                 {
                     "Timestamp": r.timestamp.isoformat(),
                     "Volume": r.volume,
@@ -76,7 +82,7 @@ def report_to_export_dict(report: Report, sizing: SizingResult) -> dict[str, Any
                     "ASA (sec)": round(r.asa_seconds, 2),
                     "Abandon %": round(r.abandonment_pct, 2),
                 }
-                for r in sizing.rows
-            ],
+                for r in iter_sizing_rows(sizing)
+            ),
         }
     }
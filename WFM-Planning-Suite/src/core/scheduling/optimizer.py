@@ -3,31 +3,27 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import Iterable
 
-from core.models import Schedule, ScheduleAssignment, SizingResult
+from core.models import Schedule, ScheduleAssignment, SizingResult, SizingRow
+from core.sizing.orchestrator import iter_sizing_rows
 
 
 def build_schedule(
-    sizing: SizingResult,
+    sizing: SizingResult | Iterable[SizingResult],
     available_agents: int,
     shift_hours: float = 8.0,
 ) -> Schedule:
+    """Build shifts from a sizing result or, in one pass, from ``iter_sizing`` chunks."""
     assignments: list[ScheduleAssignment] = []
     coverage_gaps: list[dict] = []
     warnings: list[str] = []
-
-    if not sizing.rows:
-        return Schedule(assignments=[], coverage_gaps=[], warnings=["No sizing data to schedule"])
-
-    peak = max(sizing.rows, key=lambda r: r.agents_required)
-    if peak.agents_required > available_agents:
-        warnings.append(
-            f"Required coverage ({peak.agents_required} agents at {peak.timestamp}) "
-            f"exceeds available headcount ({available_agents} agents)"
-        )
+    peak: SizingRow | None = None
 
     dates_seen: set[str] = set()
-    for row in sizing.rows:
+    for row in iter_sizing_rows(sizing):
+        if peak is None or row.agents_required > peak.agents_required:
+            peak = row
         date_key = row.timestamp.strftime("%Y-%m-%d")
         if date_key in dates_seen:
             continue
@@ -57,6 +53,13 @@ def build_schedule(
                 )
             )
 
+    if peak is None:
+        return Schedule(assignments=[], coverage_gaps=[], warnings=["No sizing data to schedule"])
+    if peak.agents_required > available_agents:
+        warnings.append(
+            f"Required coverage ({peak.agents_required} agents at {peak.timestamp}) "
+            f"exceeds available headcount ({available_agents} agents)"
+        )
     if coverage_gaps:
         warnings.append(f"{len(coverage_gaps)} interval(s) have coverage gaps due to headcount constraints")
 
@@ -1,3 +1,23 @@
-from core.simulation.des import cross_validate, run_simulation
+from core.simulation.des import (
+    TRACE_DTYPE,
+    TRACE_OUTCOMES,
+    cross_validate,
+    load_trace,
+    queue_waits,
+    run_replications,
+    run_simulation,
+    service_times,
+    simulate_staffing,
+)
 
-__all__ = ["cross_validate", "run_simulation"]
+__all__ = [
+    "TRACE_DTYPE",
+    "TRACE_OUTCOMES",
+    "cross_validate",
+    "load_trace",
+    "queue_waits",
+    "run_replications",
+    "run_simulation",
+    "service_times",
+    "simulate_staffing",
+]
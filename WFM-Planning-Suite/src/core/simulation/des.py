@@ -2,17 +2,261 @@
 
 from __future__ import annotations
 
-import random
-from dataclasses import dataclass
+import heapq
+import math
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Iterator
 
-from core.models import SimulationResult, SizingResult
+import numpy as np
+from scipy import stats
 
+from core.models import (
+    ArrivalProcess,
+    IntervalSimulation,
+    Schedule,
+    ServiceDistribution,
+    SimulationResult,
+    SizingResult,
+)
 
-@dataclass
-class _Call:
-    arrival: float
-    patience: float
-    service_time: float
+# Calls drawn per batch of intervals; bounds memory on multi-year horizons.
+_DRAW_BLOCK = 1 << 20
+
+# One record per simulated call. Times are seconds from the first sizing
+# interval; ``interval`` indexes the sizing rows and ``outcome`` indexes
+# ``TRACE_OUTCOMES``. Abandoned calls have no start and their wait is their patience.
+TRACE_DTYPE = np.dtype([
+    ("interval", np.int64),
+    ("arrival", np.float64),
+    ("start", np.float64),
+    ("wait", np.float64),
+    ("service", np.float64),
+    ("outcome", np.uint8),
+])
+TRACE_OUTCOMES = ("within_sla", "late", "abandoned")
+
+
+def service_times(
+    rng: np.random.Generator,
+    aht_seconds: float,
+    size: int,
+    distribution: ServiceDistribution = ServiceDistribution.EXPONENTIAL,
+    cv: float = 1.0,
+) -> np.ndarray:
+    """Handle times with mean ``aht_seconds``; ``cv`` (std / mean) applies to the lognormal."""
+    if aht_seconds <= 0:
+        return np.ones(size)
+    if distribution == ServiceDistribution.LOGNORMAL:
+        sigma2 = np.log1p(cv * cv)
+        return rng.lognormal(np.log(aht_seconds) - sigma2 / 2.0, np.sqrt(sigma2), size)
+    return rng.exponential(aht_seconds, size)
+
+
+_Streams = tuple[np.random.Generator, np.random.Generator, np.random.Generator]
+
+
+def _call_streams(rng_seed: int | np.random.SeedSequence) -> _Streams:
+    """Independent arrival, patience and service generators derived from one seed."""
+    seq = rng_seed if isinstance(rng_seed, np.random.SeedSequence) else np.random.SeedSequence(rng_seed)
+    return tuple(  # type: ignore[return-value]
+        np.random.default_rng(np.random.SeedSequence(seq.entropy, spawn_key=seq.spawn_key + (k,)))
+        for k in range(3)
+    )
+
+
+def _uniforms(rng: np.random.Generator, size: int, antithetic: bool) -> np.ndarray:
+    u = rng.random(size)
+    return 1.0 - u if antithetic else u
+
+
+def _ordered_arrivals(
+    rng: np.random.Generator, counts: np.ndarray, interval_seconds: float, antithetic: bool,
+) -> np.ndarray:
+    """Sorted uniform arrival offsets per interval, built from normalised exponential spacings.
+
+    ``n`` sorted uniforms are the partial sums of ``n + 1`` exponential gaps over
+    their total; drawing the gaps by inverse transform lets an antithetic run
+    swap long gaps for short ones instead of merely mirroring the interval.
+    """
+    groups = np.repeat(np.arange(len(counts)), counts + 1)
+    gaps = -np.log1p(-_uniforms(rng, len(groups), antithetic))
+    sums = np.cumsum(gaps)
+    group_ends = np.cumsum(counts + 1) - 1
+    before = np.concatenate(([0.0], sums[group_ends[:-1]]))
+    partial = sums - before[groups]
+    totals = partial[group_ends]
+    keep = np.ones(len(groups), dtype=bool)
+    keep[group_ends] = False
+    return (partial / totals[groups] * interval_seconds)[keep]
+
+
+def _intensity_knots(volumes: np.ndarray, timestamps: np.ndarray, interval_seconds: float) -> np.ndarray:
+    """Arrival intensity at the start, middle and end of each interval, in calls per interval.
+
+    Each interval's volume sits at its midpoint; an edge shared with the next
+    contiguous interval takes the mean of the two volumes, otherwise the
+    interval's own volume, and intensity is linear between those points.
+    """
+    volumes = np.maximum(volumes, 0.0)
+    joined = np.diff(timestamps) == np.timedelta64(int(interval_seconds), "s")
+    shared = (volumes[:-1] + volumes[1:]) / 2.0
+    start = volumes.copy()
+    end = volumes.copy()
+    end[:-1] = np.where(joined, shared, volumes[:-1])
+    start[1:] = np.where(joined, shared, volumes[1:])
+    return np.column_stack((start, volumes, end))
+
+
+def _linear_inverse(f0: np.ndarray, f1: np.ndarray, u: np.ndarray) -> np.ndarray:
+    # Inverse CDF on [0, 1] of a density linear from f0 to f1, in a form that is stable when f0 == f1.
+    return (f0 + f1) * u / (f0 + np.sqrt(f0 * f0 + (f1 * f1 - f0 * f0) * u))
+
+
+def _warp(fractions: np.ndarray, knots: np.ndarray) -> np.ndarray:
+    """Map uniform fractions of an interval onto its piecewise-linear intensity (monotone)."""
+    start, middle, end = knots.T
+    first = (start + middle) / 4.0
+    second = (middle + end) / 4.0
+    target = fractions * (first + second)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lower = 0.5 * _linear_inverse(start, middle, target / first)
+        upper = 0.5 + 0.5 * _linear_inverse(middle, end, (target - first) / second)
+    return np.where(target < first, lower, upper)
+
+
+def _arrival_plan(
+    rng: np.random.Generator | _Streams,
+    sizing: SizingResult,
+    interval_seconds: float,
+    process: ArrivalProcess,
+    dispersion: float,
+    antithetic: bool,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Call counts per interval and, for Poisson arrivals, the intensity knots that place them.
+
+    ``FIXED`` rounds each volume and spreads calls uniformly. ``POISSON``
+    draws counts with mean equal to the integrated piecewise-linear intensity,
+    which smooths volume across interval edges but keeps the total of each
+    contiguous run of intervals;
+    ``dispersion`` > 0 mixes the rate with a gamma variable (negative
+    binomial counts, variance ``mean + dispersion * mean**2``).
+    """
+    if dispersion < 0:
+        raise ValueError("dispersion must be non-negative")
+    if process == ArrivalProcess.FIXED:
+        if dispersion > 0:
+            raise ValueError("Overdispersion needs Poisson arrivals")
+        counts = np.rint(sizing.volumes).astype(np.int64)
+        counts[counts < 0] = 0
+        return counts, None
+
+    knots = _intensity_knots(sizing.volumes, sizing.timestamps, interval_seconds)
+    expected = knots @ np.array([0.25, 0.5, 0.25])
+    if isinstance(rng, tuple):
+        # Inverse transform keeps counts on the arrival stream and lets antithetic runs mirror them.
+        u = np.minimum(_uniforms(rng[0], len(expected), antithetic), np.nextafter(1.0, 0.0))
+        if dispersion > 0:
+            counts = stats.nbinom.ppf(u, 1.0 / dispersion, 1.0 / (1.0 + dispersion * expected))
+        else:
+            counts = stats.poisson.ppf(u, expected)
+        counts = np.maximum(counts, 0)
+    else:
+        rates = rng.gamma(1.0 / dispersion, dispersion * expected) if dispersion > 0 else expected
+        counts = rng.poisson(rates)
+    return counts.astype(np.int64), knots
+
+
+def _draw_calls(
+    rng: np.random.Generator | _Streams,
+    counts: np.ndarray,
+    interval_seconds: float,
+    patience_seconds: float,
+    aht_seconds: float,
+    antithetic: bool = False,
+    knots: np.ndarray | None = None,
+) -> Iterator[tuple[int, int, np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield ``(first, last, arrivals, patience, service)`` for batches of intervals.
+
+    Batches grow until they hold ``_DRAW_BLOCK`` calls (always at least one
+    interval). Arrivals are offsets into their interval, sorted within it.
+
+    ``rng`` is either one generator shared by all three quantities or a triple
+    from ``_call_streams``. With separate streams every value is the inverse
+    transform of its own uniform, so the draws for one quantity never shift
+    when another changes, and ``antithetic`` replaces each uniform ``u`` with
+    ``1 - u``. ``knots`` (from ``_intensity_knots``) reshapes arrivals within
+    each interval to a piecewise-linear intensity instead of a flat one.
+    """
+    separate = isinstance(rng, tuple)
+    if antithetic and not separate:
+        raise ValueError("Antithetic draws need separate random streams")
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    first = 0
+    while first < len(counts):
+        last = max(first + 1, int(np.searchsorted(ends, starts[first] + _DRAW_BLOCK, side="right")))
+        size = ends[last - 1] - starts[first]
+        owner = np.repeat(np.arange(first, last), counts[first:last])
+        if separate:
+            arrival_rng, patience_rng, service_rng = rng
+            arrivals = _ordered_arrivals(arrival_rng, counts[first:last], interval_seconds, antithetic)
+            patience = (
+                -patience_seconds * np.log1p(-_uniforms(patience_rng, size, antithetic))
+                if patience_seconds > 0 else np.full(size, np.inf)
+            )
+            service = (
+                -aht_seconds * np.log1p(-_uniforms(service_rng, size, antithetic))
+                if aht_seconds > 0 else np.ones(size)
+            )
+        else:
+            arrivals = rng.uniform(0.0, interval_seconds, size)
+            patience = rng.exponential(patience_seconds, size) if patience_seconds > 0 else np.full(size, np.inf)
+            service = rng.exponential(aht_seconds, size) if aht_seconds > 0 else np.ones(size)
+            arrivals = arrivals[np.lexsort((arrivals, owner))]
+        if knots is not None:
+            arrivals = _warp(arrivals / interval_seconds, knots[owner]) * interval_seconds
+        yield first, last, arrivals, patience, service
+        first = last
+
+
+def queue_waits(arrivals: np.ndarray, patience: np.ndarray, service: np.ndarray, agents: int) -> np.ndarray:
+    """Wait per call in a FIFO multi-server queue that starts with every agent free.
+
+    ``arrivals`` must be sorted; abandoned calls get NaN. Agent free times sit in
+    a min-heap, so each call costs O(log agents).
+    """
+    free = [0.0] * max(1, agents)
+    waits = np.full(len(arrivals), np.nan)
+    for c, (arrival, limit, duration) in enumerate(zip(arrivals.tolist(), patience.tolist(), service.tolist())):
+        earliest = free[0]
+        if earliest <= arrival:
+            heapq.heapreplace(free, arrival + duration)
+            waits[c] = 0.0
+            continue
+        wait = earliest - arrival
+        if wait > limit:
+            continue
+        heapq.heapreplace(free, earliest + duration)
+        waits[c] = wait
+    return waits
+
+
+def _simulate_interval(
+    arrivals: np.ndarray,
+    patience: np.ndarray,
+    service: np.ndarray,
+    agents: int,
+    sla_time_seconds: float,
+) -> tuple[int, int, int, float]:
+    """Tally one interval's queue as ``(answered, abandoned, within_sla, total_wait)``."""
+    return _tally(queue_waits(arrivals, patience, service, agents), sla_time_seconds)
+
+
+def _tally(waits: np.ndarray, sla_time_seconds: float) -> tuple[int, int, int, float]:
+    served = waits[~np.isnan(waits)]
+    return len(served), len(waits) - len(served), int(np.count_nonzero(served <= sla_time_seconds)), float(served.sum())
 
 
 def run_simulation(
@@ -21,65 +265,336 @@ def run_simulation(
     patience_seconds: float,
     agents: int,
     warmup_intervals: int = 5,
-    rng_seed: int = 42,
+    rng_seed: int | np.random.SeedSequence = 42,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    arrival_process: ArrivalProcess = ArrivalProcess.FIXED,
+    dispersion: float = 0.0,
+    trace: bool | str | os.PathLike[str] = False,
 ) -> SimulationResult:
-    rng = random.Random(rng_seed)
+    """Simulate each post-warm-up interval as an independent queue with ``agents`` servers.
+
+    By default each interval receives its rounded volume, spread uniformly;
+    ``ArrivalProcess.POISSON`` draws random counts from a piecewise-linear
+    intensity through the interval volumes (see ``_arrival_plan``). Patience
+    and service times are exponential. All draws for a batch of intervals are
+    made up front as arrays.
+    ``common_random_numbers`` draws arrivals, patience and service from separate
+    streams so runs that differ only in staffing, AHT or patience see the same
+    underlying randomness; ``antithetic`` (which implies separate streams)
+    mirrors every uniform for use as the second run of an antithetic pair.
+
+    ``trace`` records every post-warm-up call as a ``TRACE_DTYPE`` row in
+    ``SimulationResult.trace``: ``True`` keeps it in memory, a path writes a
+    ``.npy`` file through a memory map (reopen it with ``load_trace``).
+    """
+    rng = _call_streams(rng_seed) if common_random_numbers or antithetic else np.random.default_rng(rng_seed)
     interval_seconds = sizing.profile.interval_minutes * 60
+    sla_time = sizing.profile.sla_time_seconds
+
+    counts, knots = _arrival_plan(rng, sizing, interval_seconds, arrival_process, dispersion, antithetic)
+    counts = counts[warmup_intervals:]
+    if knots is not None:
+        knots = knots[warmup_intervals:]
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    log = _open_trace(trace, int(ends[-1]) if len(ends) else 0)
+    interval_offsets = ((sizing.timestamps - sizing.timestamps[:1]) / np.timedelta64(1, "s"))[warmup_intervals:]
 
     total_answered = 0
     total_abandoned = 0
     total_within_sla = 0
     total_wait = 0.0
-    intervals_simulated = 0
-
-    for idx, row in enumerate(sizing.rows):
-        if idx < warmup_intervals:
-            continue
-        intervals_simulated += 1
-        volume = int(round(row.volume))
-        if volume <= 0:
-            continue
-
-        calls: list[_Call] = []
-        for _ in range(volume):
-            arrival = rng.uniform(0, interval_seconds)
-            patience = rng.expovariate(1.0 / patience_seconds) if patience_seconds > 0 else float("inf")
-            service = rng.expovariate(1.0 / aht_seconds) if aht_seconds > 0 else 1.0
-            calls.append(_Call(arrival=arrival, patience=patience, service_time=service))
-        calls.sort(key=lambda c: c.arrival)
-
-        agent_free = [0.0] * max(1, agents)
-
-        for call in calls:
-            best = min(range(len(agent_free)), key=lambda i: agent_free[i])
-            if agent_free[best] <= call.arrival:
-                start = call.arrival
-                wait = 0.0
-            else:
-                wait = agent_free[best] - call.arrival
-                if wait > call.patience:
-                    total_abandoned += 1
-                    continue
-                start = agent_free[best]
 
+    for first, last, arrivals, patience, service in _draw_calls(
+        rng, counts, interval_seconds, patience_seconds, aht_seconds, antithetic, knots,
+    ):
+        offset = starts[first]
+        for i in range(first, last):
+            window = slice(starts[i] - offset, ends[i] - offset)
+            if window.start == window.stop:
+                continue
+            waits = queue_waits(arrivals[window], patience[window], service[window], agents)
+            answered, abandoned, within_sla, wait = _tally(waits, sla_time)
+            if log is not None:
+                _record(log[starts[i]:ends[i]], i + warmup_intervals, arrivals[window] + interval_offsets[i],
+                        waits, patience[window], service[window], sla_time)
+            total_answered += answered
+            total_abandoned += abandoned
+            total_within_sla += within_sla
             total_wait += wait
-            agent_free[best] = start + call.service_time
-            total_answered += 1
-            sla_time = sizing.profile.sla_time_seconds
-            if wait <= sla_time:
-                total_within_sla += 1
 
     total = total_answered + total_abandoned
     sla_pct = (total_within_sla / total * 100.0) if total > 0 else 100.0
     asa = (total_wait / total_answered) if total_answered > 0 else 0.0
     abandon_pct = (total_abandoned / total * 100.0) if total > 0 else 0.0
+    if isinstance(log, np.memmap):
+        log.flush()
 
     return SimulationResult(
         sla_pct=sla_pct,
         asa_seconds=asa,
         abandonment_pct=abandon_pct,
-        intervals_simulated=intervals_simulated,
+        intervals_simulated=len(counts),
         warmup_excluded=True,
+        trace=log,
+    )
+
+
+def _open_trace(trace: bool | str | os.PathLike[str], calls: int) -> np.ndarray | None:
+    if trace is False:
+        return None
+    if trace is True:
+        return np.empty(calls, dtype=TRACE_DTYPE)
+    return np.lib.format.open_memmap(trace, mode="w+", dtype=TRACE_DTYPE, shape=(calls,))
+
+
+def _record(
+    rows: np.ndarray,
+    interval: int,
+    arrivals: np.ndarray,
+    waits: np.ndarray,
+    patience: np.ndarray,
+    service: np.ndarray,
+    sla_time_seconds: float,
+) -> None:
+    served = ~np.isnan(waits)
+    rows["interval"] = interval
+    rows["arrival"] = arrivals
+    rows["start"] = np.where(served, arrivals + waits, np.nan)
+    rows["wait"] = np.where(served, waits, patience)
+    rows["service"] = np.where(served, service, 0.0)
+    rows["outcome"] = np.where(served, np.where(waits <= sla_time_seconds, 0, 1), 2)
+
+
+def load_trace(path: str | os.PathLike[str]) -> np.ndarray:
+    """Open a trace written by ``run_simulation`` read-only, without loading it into memory."""
+    trace = np.load(path, mmap_mode="r")
+    if trace.dtype != TRACE_DTYPE:
+        raise ValueError(f"{path} is not a simulation trace")
+    return trace
+
+
+def _interval_staffing(sizing: SizingResult, staffing: Schedule | np.ndarray | None) -> np.ndarray:
+    """Agents taking calls in each interval.
+
+    Sized requirements and scheduled headcount include shrinkage, so both are
+    scaled back to productive agents; explicit arrays are used as given.
+    """
+    productive = 1.0 - sizing.profile.shrinkage_pct / 100.0
+    if staffing is None:
+        headcount = sizing.agents_required
+    elif isinstance(staffing, Schedule):
+        shift_starts = np.sort(np.array([a.shift_start for a in staffing.assignments], dtype="datetime64[us]"))
+        shift_ends = np.sort(np.array([a.shift_end for a in staffing.assignments], dtype="datetime64[us]"))
+        headcount = (
+            np.searchsorted(shift_starts, sizing.timestamps, side="right")
+            - np.searchsorted(shift_ends, sizing.timestamps, side="right")
+        )
+    else:
+        agents = np.asarray(staffing, dtype=np.int64)
+        if agents.shape != sizing.volumes.shape:
+            raise ValueError("staffing needs one agent count per sizing interval")
+        return np.maximum(agents, 0)
+    if productive <= 0:
+        return headcount.astype(np.int64)
+    return np.floor(headcount * productive + 1e-9).astype(np.int64)
+
+
+def simulate_staffing(
+    sizing: SizingResult,
+    aht_seconds: float,
+    patience_seconds: float,
+    staffing: Schedule | np.ndarray | None = None,
+    warmup_intervals: int = 5,
+    rng_seed: int | np.random.SeedSequence = 42,
+    arrival_process: ArrivalProcess = ArrivalProcess.FIXED,
+    dispersion: float = 0.0,
+) -> IntervalSimulation:
+    """Simulate the horizon as one continuous FIFO queue with per-interval staffing.
+
+    Staffing comes from ``sizing.agents_required`` by default, or from a
+    ``Schedule`` or an explicit per-interval agent array. Agent position ``j`` is
+    on shift in intervals staffed above ``j``; calls in progress run past shift
+    end, and waiting calls carry across interval boundaries (and overnight gaps)
+    until answered or they abandon. KPIs are attributed to each call's arrival
+    interval; the summary excludes the first ``warmup_intervals``. Arrivals
+    follow ``arrival_process`` as in ``run_simulation``.
+    """
+    rng = np.random.default_rng(rng_seed)
+    interval_seconds = sizing.profile.interval_minutes * 60
+    sla_time = sizing.profile.sla_time_seconds
+    agents = _interval_staffing(sizing, staffing)
+
+    counts, knots = _arrival_plan(rng, sizing, interval_seconds, arrival_process, dispersion, False)
+    intervals = len(counts)
+    offsets = ((sizing.timestamps - sizing.timestamps[:1]) / np.timedelta64(1, "s")).astype(np.float64)
+    interval_starts = offsets.tolist()
+    staffed = agents.tolist()
+    shifts_by_position: dict[int, list[int]] = {}
+
+    def resume(position: int, t: float) -> float:
+        """Earliest moment at or after ``t`` when ``position`` is on shift."""
+        k = bisect_right(interval_starts, t) - 1
+        if k >= 0 and t < interval_starts[k] + interval_seconds and staffed[k] > position:
+            return t
+        shifts = shifts_by_position.get(position)
+        if shifts is None:
+            shifts = shifts_by_position[position] = np.flatnonzero(agents > position).tolist()
+        nxt = bisect_left(shifts, k + 1)
+        return interval_starts[shifts[nxt]] if nxt < len(shifts) else math.inf
+
+    free = [(resume(j, 0.0), j) for j in range(int(agents.max(initial=0)))]
+    heapq.heapify(free)
+
+    answered = np.zeros(intervals, dtype=np.int64)
+    within_sla = np.zeros(intervals, dtype=np.int64)
+    wait_sum = np.zeros(intervals, dtype=np.float64)
+    for first, last, arrivals, patience, service in _draw_calls(
+        rng, counts, interval_seconds, patience_seconds, aht_seconds, knots=knots,
+    ):
+        owner = np.repeat(np.arange(first, last), counts[first:last])
+        waits = np.full(len(owner), np.nan)
+        calls = zip(owner.tolist(), (arrivals + offsets[owner]).tolist(), patience.tolist(), service.tolist())
+        for c, (k, arrival, limit, duration) in enumerate(calls):
+            if not free:
+                continue
+            while True:
+                earliest, j = free[0]
+                if earliest >= arrival:
+                    start = earliest
+                    break
+                if staffed[k] > j:
+                    start = arrival
+                    break
+                heapq.heapreplace(free, (resume(j, arrival), j))
+            wait = start - arrival
+            if wait > limit or start == math.inf:
+                continue
+            heapq.heapreplace(free, (resume(j, start + duration), j))
+            waits[c] = wait
+        served = ~np.isnan(waits)
+        answered += np.bincount(owner[served], minlength=intervals)
+        within_sla += np.bincount(owner[served & (waits <= sla_time)], minlength=intervals)
+        wait_sum += np.bincount(owner[served], weights=waits[served], minlength=intervals)
+
+    abandoned = counts - answered
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sla_pct = np.where(counts > 0, within_sla / counts * 100.0, 100.0)
+        asa = np.where(answered > 0, wait_sum / answered, 0.0)
+        abandon_pct = np.where(counts > 0, abandoned / counts * 100.0, 0.0)
+
+    kept = slice(warmup_intervals, None)
+    total, total_answered = int(counts[kept].sum()), int(answered[kept].sum())
+    summary = SimulationResult(
+        sla_pct=float(within_sla[kept].sum() / total * 100.0) if total > 0 else 100.0,
+        asa_seconds=float(wait_sum[kept].sum() / total_answered) if total_answered > 0 else 0.0,
+        abandonment_pct=float(abandoned[kept].sum() / total * 100.0) if total > 0 else 0.0,
+        intervals_simulated=max(0, intervals - warmup_intervals),
+        warmup_excluded=True,
+    )
+    return IntervalSimulation(
+        summary=summary,
+        timestamps=sizing.timestamps.copy(),
+        agents=agents,
+        offered=counts,
+        answered=answered,
+        abandoned=abandoned,
+        sla_pct=sla_pct,
+        asa_seconds=asa,
+        abandonment_pct=abandon_pct,
+    )
+
+
+def _replicate(job: tuple[tuple[Any, ...], dict[str, Any]]) -> SimulationResult:
+    args, options = job
+    return run_simulation(*args, common_random_numbers=True, **options)
+
+
+def _mean_ci(values: list[float], confidence: float) -> tuple[float, tuple[float, float]]:
+    mean = float(np.mean(values))
+    if len(values) < 2:
+        return mean, (mean, mean)
+    half = float(stats.t.ppf(0.5 + confidence / 2.0, len(values) - 1) * stats.sem(values))
+    return mean, (mean - half, mean + half)
+
+
+def run_replications(
+    sizing: SizingResult,
+    aht_seconds: float,
+    patience_seconds: float,
+    agents: int,
+    warmup_intervals: int = 5,
+    rng_seed: int = 42,
+    max_replications: int = 30,
+    min_replications: int = 5,
+    confidence: float = 0.95,
+    sla_half_width_pct: float = 1.0,
+    max_workers: int | None = None,
+    antithetic: bool = False,
+    arrival_process: ArrivalProcess = ArrivalProcess.FIXED,
+    dispersion: float = 0.0,
+) -> SimulationResult:
+    """Run replications and report means with Student-t confidence intervals.
+
+    Replications draw arrivals, patience and service from separate streams of
+    child ``i`` of ``SeedSequence(rng_seed)``, so results do not depend on
+    ``max_workers``. Replications run in rounds of ``min_replications``; after
+    each round the run stops once the SLA interval's half-width is within
+    ``sla_half_width_pct`` points.
+
+    With ``antithetic`` replications come in pairs sharing a seed, the second
+    using mirrored uniforms. Intervals are then built from the pair means,
+    which are independent, and both bounds are rounded up to whole pairs.
+    """
+    if not 1 <= min_replications <= max_replications:
+        raise ValueError("Need 1 <= min_replications <= max_replications")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1")
+    group = 2 if antithetic else 1
+    rounds_of = -(-min_replications // group)
+    seeds = np.random.SeedSequence(rng_seed).spawn(-(-max_replications // group))
+    runs: list[SimulationResult] = []
+
+    def samples(field: str) -> list[float]:
+        values = [getattr(r, field) for r in runs]
+        return [sum(values[i:i + group]) / group for i in range(0, len(values), group)]
+
+    def rounds(pool: Executor | None) -> None:
+        while len(runs) < len(seeds) * group:
+            batch = seeds[len(runs) // group:len(runs) // group + rounds_of]
+            jobs = [
+                (
+                    (sizing, aht_seconds, patience_seconds, agents, warmup_intervals, seed),
+                    {"antithetic": mirrored, "arrival_process": arrival_process, "dispersion": dispersion},
+                )
+                for seed in batch for mirrored in (False, True)[:group]
+            ]
+            runs.extend(pool.map(_replicate, jobs) if pool is not None else map(_replicate, jobs))
+            _, (low, high) = _mean_ci(samples("sla_pct"), confidence)
+            if len(runs) >= 2 * group and (high - low) / 2.0 <= sla_half_width_pct:
+                return
+
+    if max_workers == 1:
+        rounds(None)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers or min(rounds_of * group, os.cpu_count() or 1)) as pool:
+            rounds(pool)
+
+    sla, sla_ci = _mean_ci(samples("sla_pct"), confidence)
+    asa, asa_ci = _mean_ci(samples("asa_seconds"), confidence)
+    abandon, abandon_ci = _mean_ci(samples("abandonment_pct"), confidence)
+    return SimulationResult(
+        sla_pct=sla,
+        asa_seconds=asa,
+        abandonment_pct=abandon,
+        intervals_simulated=runs[0].intervals_simulated,
+        warmup_excluded=True,
+        replications=len(runs),
+        confidence=confidence,
+        sla_ci=sla_ci,
+        asa_ci=asa_ci,
+        abandonment_ci=abandon_ci,
     )
 
 
@@ -89,12 +604,21 @@ def cross_validate(sizing: SizingResult, simulation: SimulationResult, tolerance
         simulation.cross_check_notes = "No sizing rows to compare"
         return simulation
 
-    avg_analytic_sla = sum(r.sla_pct for r in sizing.rows) / len(sizing.rows)
-    delta = abs(avg_analytic_sla - simulation.sla_pct)
-    passed = delta <= tolerance_pct
-    simulation.cross_check_passed = passed
-    simulation.cross_check_notes = (
-        f"Analytic avg SLA {avg_analytic_sla:.1f}% vs simulation {simulation.sla_pct:.1f}% "
-        f"(delta {delta:.1f}%, tolerance {tolerance_pct}%)"
-    )
+    avg_analytic_sla = float(sizing.sla_pct.mean())
+    if simulation.sla_ci is None:
+        delta = abs(avg_analytic_sla - simulation.sla_pct)
+        simulation.cross_check_notes = (
+            f"Analytic avg SLA {avg_analytic_sla:.1f}% vs simulation {simulation.sla_pct:.1f}% "
+            f"(delta {delta:.1f}%, tolerance {tolerance_pct}%)"
+        )
+    else:
+        # Distance from the analytic value to the simulated confidence interval.
+        low, high = simulation.sla_ci
+        delta = max(low - avg_analytic_sla, avg_analytic_sla - high, 0.0)
+        simulation.cross_check_notes = (
+            f"Analytic avg SLA {avg_analytic_sla:.1f}% vs simulation {simulation.sla_pct:.1f}% "
+            f"[{low:.1f}, {high:.1f}] at {simulation.confidence:.0%} over {simulation.replications} replications "
+            f"(distance {delta:.1f}%, tolerance {tolerance_pct}%)"
+        )
+    simulation.cross_check_passed = delta <= tolerance_pct
     return simulation
@@ -1,3 +1,27 @@
-from core.sizing.orchestrator import derive_interval_pattern, size_intervals
+from core.sizing.orchestrator import (
+    QueueSizing,
+    derive_interval_pattern,
+    iter_sizing,
+    iter_sizing_rows,
+    size_intervals,
+    size_many,
+)
+from core.sizing.simulated import size_intervals_simulated
+from core.sizing.sweep import SWEEP_AXES, StaffingSweep, sweep_staffing
+from core.sizing.tables import StaffingTable, build_staffing_table, profile_fingerprint
 
-__all__ = ["derive_interval_pattern", "size_intervals"]
+__all__ = [
+    "QueueSizing",
+    "SWEEP_AXES",
+    "StaffingSweep",
+    "StaffingTable",
+    "build_staffing_table",
+    "derive_interval_pattern",
+    "iter_sizing",
+    "iter_sizing_rows",
+    "profile_fingerprint",
+    "size_intervals",
+    "size_intervals_simulated",
+    "size_many",
+    "sweep_staffing",
+]
@@ -2,129 +2,398 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable, Iterable, Iterator, Sequence
 
 import numpy as np
 
-from core.erlang.engine import kpis_for_agents, required_agents
+from core.erlang.cache import ErlangCache
+from core.erlang.engine import ErlangKPIs, kpis_for_agents, required_agents
+from core.erlang.vectorized import kpis_for_agents_array
 from core.models import (
+    ChannelType,
     IntervalDemand,
     IntervalMethod,
     Profile,
     SizingResult,
     SizingRow,
 )
+from core.sizing.tables import StaffingTable
+
+_MINUTES_PER_DAY = 24 * 60
+_SECONDS_PER_DAY = 24 * 3600
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _weekdays(days: np.ndarray, special_days: dict[date, int] | None) -> np.ndarray:
+    """Weekday (Mon=0) per ``datetime64[D]`` day, with special days mapped to the weekday they behave like."""
+    weekdays = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    if special_days and len(days):
+        keys = np.array(list(special_days), dtype="datetime64[D]")
+        values = np.array(list(special_days.values()), dtype=np.int64)
+        order = np.argsort(keys)
+        keys, values = keys[order], values[order]
+        pos = np.minimum(np.searchsorted(keys, days), len(keys) - 1)
+        hit = keys[pos] == days
+        weekdays[hit] = values[pos[hit]]
+    return weekdays
+
+
+def _spread(
+    days: np.ndarray,
+    daily: np.ndarray,
+    slot_minutes: np.ndarray,
+    weights: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Broadcast daily volumes over intraday slots; ``weights=None`` splits each day equally."""
+    timestamps = days.astype("datetime64[us]")[:, None] + slot_minutes.astype("timedelta64[m]")[None, :]
+    if weights is None:
+        volumes = np.repeat(daily[:, None] / len(slot_minutes), len(slot_minutes), axis=1)
+    else:
+        volumes = daily[:, None] * weights[None, :]
+    return timestamps.ravel(), volumes.ravel()
 
 
 def derive_interval_pattern(
     historical_rows: list[dict],
     forecast_points: list[dict],
     interval_minutes: int = 30,
+    special_days: dict[date, int] | None = None,
 ) -> IntervalDemand:
-    """Derive intraday pattern from history or fall back to flat distribution."""
+    """Derive intraday pattern from history or fall back to flat distribution.
+
+    Interval history yields one slot-weight pattern per weekday; weekdays the
+    history never covers use the pattern pooled across all days, and say so.
+    ``special_days`` maps dates (holidays, events) to the weekday whose pattern
+    they follow, e.g. ``{date(2024, 12, 25): 6}`` treats Christmas as a Sunday,
+    both when learning from history and when spreading the forecast.
+    """
+    if special_days and any(not 0 <= w <= 6 for w in special_days.values()):
+        raise ValueError("special_days values must be weekdays 0 (Mon) to 6 (Sun)")
     approximations: list[str] = []
-    has_interval_history = False
-
-    if historical_rows:
-        timestamps = [r.get("timestamp") for r in historical_rows if r.get("timestamp")]
-        if timestamps and len(timestamps) > 1:
-            deltas = [(timestamps[i + 1] - timestamps[i]).total_seconds() for i in range(len(timestamps) - 1)]
-            if deltas and min(deltas) <= interval_minutes * 60:
-                has_interval_history = True
-
-    intervals: list[dict] = []
-
-    if has_interval_history:
-        method = IntervalMethod.HISTORICAL
-        total_by_slot: dict[int, float] = {}
-        counts: dict[int, int] = {}
-        for row in historical_rows:
-            ts = row.get("timestamp")
-            vol = float(row.get("volume", 0))
-            if not isinstance(ts, datetime):
-                continue
-            slot = ts.hour * 60 + ts.minute
-            total_by_slot[slot] = total_by_slot.get(slot, 0) + vol
-            counts[slot] = counts.get(slot, 0) + 1
-        pattern = {k: total_by_slot[k] / counts[k] for k in total_by_slot}
-        total_pattern = sum(pattern.values()) or 1.0
-        weights = {k: v / total_pattern for k, v in pattern.items()}
-
-        for fp in forecast_points:
-            ts = fp["timestamp"]
-            daily_vol = fp["volume"]
-            for slot, weight in weights.items():
-                hour = slot // 60
-                minute = slot % 60
-                interval_ts = ts.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                intervals.append({"timestamp": interval_ts, "volume": daily_vol * weight})
-    else:
-        method = IntervalMethod.FLAT_EQUAL
+
+    history = [r for r in historical_rows if isinstance(r.get("timestamp"), datetime)]
+    # Proleptic-ordinal seconds; much cheaper than numpy's own datetime object conversion.
+    history_seconds = np.fromiter(
+        (
+            ts.toordinal() * _SECONDS_PER_DAY + ts.hour * 3600 + ts.minute * 60 + ts.second
+            for ts in (r["timestamp"] for r in history)
+        ),
+        dtype=np.int64,
+        count=len(history),
+    )
+    has_interval_history = len(history) > 1 and np.diff(history_seconds).min() <= interval_minutes * 60
+
+    days = np.array([fp["timestamp"] for fp in forecast_points], dtype="datetime64[D]")
+    daily = np.array([float(fp["volume"]) for fp in forecast_points], dtype=np.float64)
+
+    if not has_interval_history:
         approximations.append(
             "Estimated intraday pattern — no historical interval data available; using flat equal distribution"
         )
         slots_per_day = max(1, (18 - 8) * 60 // interval_minutes)
-        for fp in forecast_points:
-            ts = fp["timestamp"]
-            daily_vol = fp["volume"]
-            per_slot = daily_vol / slots_per_day
-            for i in range(slots_per_day):
-                hour = 8 + (i * interval_minutes) // 60
-                minute = (i * interval_minutes) % 60
-                interval_ts = ts.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                intervals.append({"timestamp": interval_ts, "volume": per_slot})
+        slot_minutes = 8 * 60 + np.arange(slots_per_day, dtype=np.int64) * interval_minutes
+        timestamps, volumes = _spread(days, daily, slot_minutes, None)
+        return IntervalDemand(
+            timestamps=timestamps,
+            volumes=volumes,
+            interval_method=IntervalMethod.FLAT_EQUAL,
+            approximations=approximations,
+        )
+
+    # One grouped pass: mean volume per (weekday, minute-of-day) cell via bincount.
+    history_days = (history_seconds // _SECONDS_PER_DAY - _EPOCH_ORDINAL).astype("datetime64[D]")
+    minute = history_seconds % _SECONDS_PER_DAY // 60
+    cell = _weekdays(history_days, special_days) * _MINUTES_PER_DAY + minute
+    history_vol = np.array([float(r.get("volume", 0)) for r in history], dtype=np.float64)
+    sums = np.bincount(cell, weights=history_vol, minlength=7 * _MINUTES_PER_DAY).reshape(7, _MINUTES_PER_DAY)
+    counts = np.bincount(cell, minlength=7 * _MINUTES_PER_DAY).reshape(7, _MINUTES_PER_DAY)
+
+    def pattern(total: np.ndarray, seen: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        slots = np.nonzero(seen)[0]
+        means = total[slots] / seen[slots]
+        return slots, means / (means.sum() or 1.0)
+
+    pooled = pattern(sums.sum(axis=0), counts.sum(axis=0))
+    covered = counts.any(axis=1)
+    forecast_weekdays = _weekdays(days, special_days)
+    parts = []
+    for weekday in np.unique(forecast_weekdays):
+        on_day = forecast_weekdays == weekday
+        slot_minutes, weights = pattern(sums[weekday], counts[weekday]) if covered[weekday] else pooled
+        parts.append(_spread(days[on_day], daily[on_day], slot_minutes, weights))
+
+    missing = sorted(set(forecast_weekdays.tolist()) - set(np.nonzero(covered)[0].tolist()))
+    if missing:
+        names = ", ".join(_WEEKDAY_NAMES[w] for w in missing)
+        approximations.append(
+            f"No interval history for {names}; those days use the intraday pattern pooled across all days"
+        )
+    method = IntervalMethod.HISTORICAL_WEEKDAY if covered[forecast_weekdays].any() else IntervalMethod.HISTORICAL
 
-    return IntervalDemand(intervals=intervals, interval_method=method, approximations=approximations)
+    timestamps = np.concatenate([p[0] for p in parts]) if parts else np.array([], dtype="datetime64[us]")
+    volumes = np.concatenate([p[1] for p in parts]) if parts else np.array([], dtype=np.float64)
+    order = np.argsort(timestamps, kind="stable")
+    return IntervalDemand(
+        timestamps=timestamps[order],
+        volumes=volumes[order],
+        interval_method=method,
+        approximations=approximations,
+    )
+
+
+def _size_concurrent_interval(
+    solve: Callable[..., tuple[int, ErlangKPIs]],
+    volume: float,
+    interval_seconds: float,
+    profile: Profile,
+) -> tuple[int, ErlangKPIs, int, float]:
+    """Size a chat interval as ``agents x concurrency`` parallel slots.
+
+    Each concurrency level slows handling by the profile's curve, so every level
+    is tried and the one needing the fewest agents wins (lowest level on ties).
+    Returns ``(agents, slot KPIs, concurrency, per-chat AHT)``.
+    """
+    best: tuple[int, ErlangKPIs, int, float] | None = None
+    for level in range(1, profile.max_concurrency + 1):
+        chat_aht = profile.aht_seconds * profile.concurrency_factor(level)
+        slots, kpi = solve(
+            volume=volume,
+            interval_seconds=interval_seconds,
+            aht_seconds=chat_aht,
+            model=profile.erlang_model,
+            sla_target_pct=profile.sla_target_pct,
+            sla_time_seconds=profile.sla_time_seconds,
+            patience_seconds=profile.patience_seconds,
+        )
+        agents = -(-slots // level)
+        if best is None or agents < best[0]:
+            best = (agents, kpi, level, chat_aht)
+    return best
+
+
+def _reusable_rows(
+    previous: SizingResult | None,
+    profile: Profile,
+    occupancy_floor: float | None,
+    approximations: list[str],
+) -> dict[tuple[datetime, float], int]:
+    """Row indices of ``previous`` keyed by (timestamp, volume), or nothing if any sizing input changed."""
+    if (
+        previous is None
+        or previous.occupancy_floor != occupancy_floor
+        or previous.approximations != approximations
+        or {**previous.profile.to_dict(), "name": None} != {**profile.to_dict(), "name": None}
+    ):
+        return {}
+    keys = zip(previous.timestamps.tolist(), previous.volumes.tolist())
+    return {key: i for i, key in enumerate(keys)}
 
 
 def size_intervals(
     demand: IntervalDemand,
     profile: Profile,
     occupancy_floor: float | None = None,
+    cache: ErlangCache | None = None,
+    table: StaffingTable | None = None,
+    previous: SizingResult | None = None,
 ) -> SizingResult:
+    """Size every demand interval.
+
+    Pass a shared ``cache`` to reuse Erlang work across runs, or a ``table``
+    built for this profile to resolve agents by binary search; intervals the
+    table cannot decide fall back to the engine, so results are unchanged.
+
+    Chat profiles with ``max_concurrency > 1`` are sized per interval at the
+    concurrency level needing the fewest agents; the table is not used for them
+    because handle time then depends on the chosen level.
+
+    Pass the ``previous`` result for this queue to size incrementally: rows
+    whose timestamp and volume are unchanged are reused as-is, provided the
+    profile, occupancy floor and approximations also match. Otherwise every
+    interval is recomputed.
+    """
+    if table is not None and not table.matches(profile):
+        raise ValueError("Staffing table was built for a different profile")
     interval_seconds = profile.interval_minutes * 60
-    rows: list[SizingRow] = []
     approximations = list(demand.approximations)
+    solve = cache.required_agents if cache is not None else required_agents
+    evaluate = cache.kpis_for_agents if cache is not None else kpis_for_agents
+    if cache is not None and cache.approximation_note:
+        approximations.append(cache.approximation_note)
+    concurrent = profile.channel == ChannelType.CHAT and profile.max_concurrency > 1
+    if concurrent:
+        approximations.append(
+            f"Chat sized as agents x concurrency (up to {profile.max_concurrency}) parallel slots "
+            "with handle time scaled by the concurrency curve"
+        )
 
-    for item in demand.intervals:
-        volume = float(item.get("volume", 0))
-        ts = item["timestamp"]
-        overrides: list[str] = []
+    volumes = demand.volumes.tolist()
+    count = len(volumes)
+    agents_required = np.zeros(count, dtype=np.int64)
+    sla_pct = np.zeros(count, dtype=np.float64)
+    asa_seconds = np.zeros(count, dtype=np.float64)
+    abandonment_pct = np.zeros(count, dtype=np.float64)
+    overrides: dict[int, tuple[str, ...]] = {}
 
-        agents, kpi = required_agents(
-            volume=volume,
-            interval_seconds=interval_seconds,
-            aht_seconds=profile.aht_seconds,
-            model=profile.erlang_model,
-            sla_target_pct=profile.sla_target_pct,
-            sla_time_seconds=profile.sla_time_seconds,
-            patience_seconds=profile.patience_seconds,
+    reusable = _reusable_rows(previous, profile, occupancy_floor, approximations)
+    source = np.array([reusable.get(key, -1) for key in zip(demand.timestamps.tolist(), volumes)], dtype=np.int64)
+    kept = np.nonzero(source >= 0)[0]
+    if kept.size:
+        agents_required[kept] = previous.agents_required[source[kept]]
+        sla_pct[kept] = previous.sla_pct[source[kept]]
+        asa_seconds[kept] = previous.asa_seconds[source[kept]]
+        abandonment_pct[kept] = previous.abandonment_pct[source[kept]]
+        overrides.update(
+            (i, previous.overrides[j]) for i, j in zip(kept.tolist(), source[kept].tolist()) if j in previous.overrides
+        )
+    pending = np.nonzero(source < 0)[0].tolist()
+
+    looked_up = None
+    if table is not None and not concurrent and pending:
+        pending_volumes = demand.volumes[pending]
+        traffic = np.where(pending_volumes > 0, (pending_volumes * profile.aht_seconds) / interval_seconds, 0.0)
+        table_agents = np.where(pending_volumes > 0, table.lookup(traffic), 0)
+        looked_up = (
+            table_agents,
+            kpis_for_agents_array(
+                table_agents, pending_volumes, interval_seconds, profile.aht_seconds, profile.erlang_model,
+                profile.sla_time_seconds, profile.patience_seconds,
+            ),
         )
 
+    for k, i in enumerate(pending):
+        volume = volumes[i]
+        notes: list[str] = []
+        concurrency, aht_seconds = 1, profile.aht_seconds
+
+        if concurrent:
+            agents, kpi, concurrency, aht_seconds = _size_concurrent_interval(solve, volume, interval_seconds, profile)
+            if concurrency > 1:
+                notes.append(f"Chat concurrency {concurrency} (AHT x{profile.concurrency_factor(concurrency):g})")
+        elif looked_up is not None and looked_up[0][k] >= 0:
+            agents, kpi = int(looked_up[0][k]), looked_up[1].row(k)
+        else:
+            agents, kpi = solve(
+                volume=volume,
+                interval_seconds=interval_seconds,
+                aht_seconds=profile.aht_seconds,
+                model=profile.erlang_model,
+                sla_target_pct=profile.sla_target_pct,
+                sla_time_seconds=profile.sla_time_seconds,
+                patience_seconds=profile.patience_seconds,
+            )
+
         shrinkage_factor = 1.0 - profile.shrinkage_pct / 100.0
         if shrinkage_factor > 0:
             agents = int(np.ceil(agents / shrinkage_factor)) if agents > 0 else 0
 
         if occupancy_floor is not None and kpi.occupancy_pct < occupancy_floor:
-            overrides.append(f"Occupancy floor {occupancy_floor}% applied")
-            min_agents = max(agents, int(np.ceil(kpi.traffic_erlangs / (occupancy_floor / 100.0))))
+            notes.append(f"Occupancy floor {occupancy_floor}% applied")
+            min_agents = max(agents, int(np.ceil(kpi.traffic_erlangs / (occupancy_floor / 100.0) / concurrency)))
             agents = min_agents
-            kpi = kpis_for_agents(
-                agents, volume, interval_seconds, profile.aht_seconds,
+            kpi = evaluate(
+                agents * concurrency, volume, interval_seconds, aht_seconds,
                 profile.erlang_model, profile.sla_time_seconds, profile.patience_seconds,
             )
 
-        rows.append(
-            SizingRow(
-                timestamp=ts,
-                volume=volume,
-                agents_required=agents,
-                sla_pct=kpi.sla_pct,
-                asa_seconds=kpi.asa_seconds,
-                abandonment_pct=kpi.abandonment_pct,
-                erlang_model=profile.erlang_model,
-                overrides=overrides,
-            )
+        agents_required[i] = agents
+        sla_pct[i] = kpi.sla_pct
+        asa_seconds[i] = kpi.asa_seconds
+        abandonment_pct[i] = kpi.abandonment_pct
+        if notes:
+            overrides[i] = tuple(notes)
+
+    return SizingResult(
+        profile=profile,
+        timestamps=demand.timestamps.copy(),
+        volumes=demand.volumes.copy(),
+        agents_required=agents_required,
+        sla_pct=sla_pct,
+        asa_seconds=asa_seconds,
+        abandonment_pct=abandonment_pct,
+        overrides=overrides,
+        approximations=approximations,
+        occupancy_floor=occupancy_floor,
+    )
+
+
+def iter_sizing(
+    demand: IntervalDemand,
+    profile: Profile,
+    occupancy_floor: float | None = None,
+    cache: ErlangCache | None = None,
+    table: StaffingTable | None = None,
+) -> Iterator[SizingResult]:
+    """Size ``demand`` one calendar day at a time, yielding each day's result as it completes.
+
+    Concatenating the chunks gives exactly what ``size_intervals`` returns; only
+    the current day's rows are held, so multi-year horizons stream in bounded memory.
+    """
+    days = demand.timestamps.astype("datetime64[D]")
+    starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]]) if len(days) else np.array([], dtype=np.int64)
+    for start, stop in zip(starts.tolist(), np.r_[starts[1:], len(days)].tolist()):
+        chunk = IntervalDemand(
+            timestamps=demand.timestamps[start:stop],
+            volumes=demand.volumes[start:stop],
+            interval_method=demand.interval_method,
+            approximations=demand.approximations,
         )
+        yield size_intervals(chunk, profile, occupancy_floor, cache, table)
+
+
+def iter_sizing_rows(sizing: SizingResult | Iterable[SizingResult]) -> Iterator[SizingRow]:
+    """Rows of a sizing result or of a stream of chunks from ``iter_sizing``."""
+    for chunk in [sizing] if isinstance(sizing, SizingResult) else sizing:
+        yield from chunk.rows
+
+
+@dataclass(frozen=True)
+class QueueSizing:
+    """One queue's sizing from ``size_many`` with its wall-clock cost."""
+
+    result: SizingResult
+    seconds: float
+
+
+_worker_cache: ErlangCache | None = None
+
+
+def _init_worker() -> None:
+    global _worker_cache
+    _worker_cache = ErlangCache()
+
+
+def _size_queue(job: tuple[IntervalDemand, Profile, float | None], cache: ErlangCache | None = None) -> QueueSizing:
+    demand, profile, occupancy_floor = job
+    start = time.perf_counter()
+    result = size_intervals(demand, profile, occupancy_floor, cache=cache or _worker_cache)
+    return QueueSizing(result=result, seconds=time.perf_counter() - start)
+
+
+def size_many(
+    queues: Sequence[tuple[IntervalDemand, Profile]],
+    occupancy_floor: float | None = None,
+    max_workers: int | None = None,
+) -> list[QueueSizing]:
+    """Size many ``(demand, profile)`` queues, in parallel across processes.
 
-    return SizingResult(rows=rows, profile=profile, approximations=approximations)
+    Results come back in input order. Each worker keeps an exact Erlang cache
+    shared by the queues it sizes, so results match ``size_intervals`` run on
+    each queue alone. ``max_workers=1`` sizes serially in this process.
+    """
+    jobs = [(demand, profile, occupancy_floor) for demand, profile in queues]
+    if max_workers is None:
+        max_workers = max(1, min(len(jobs), os.cpu_count() or 1))
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if max_workers == 1 or len(jobs) <= 1:
+        cache = ErlangCache()
+        return [_size_queue(job, cache) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+        return list(pool.map(_size_queue, jobs))
@@ -0,0 +1,168 @@
+"""Staffing search driven by the discrete-event simulator instead of Erlang formulas."""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.erlang.engine import required_agents
+from core.models import (
+    ChannelType,
+    ErlangModel,
+    IntervalDemand,
+    Profile,
+    ServiceDistribution,
+    SizingResult,
+)
+from core.simulation.des import queue_waits, service_times
+
+_Job = tuple[float, int, tuple[int, int], Profile, ServiceDistribution, float, int, int, float | None]
+
+
+def _simulated_staffing(job: _Job) -> tuple[int, float, float, float, bool, bool]:
+    """Staffed agents for one interval volume, applying shrinkage and the occupancy floor.
+
+    Returns ``(agents, sla_pct, asa_seconds, abandonment_pct, capped, floored)``.
+    """
+    volume, warm_start, seed, profile, distribution, service_cv, periods, max_agents, occupancy_floor = job
+    interval_seconds = profile.interval_minutes * 60
+    horizon = interval_seconds * (periods + 1)
+    rng = np.random.default_rng(np.random.SeedSequence(seed))
+    size = int(rng.poisson(volume / interval_seconds * horizon))
+    arrivals = np.sort(rng.uniform(0.0, horizon, size))
+    abandons = profile.erlang_model == ErlangModel.A and profile.patience_seconds > 0
+    patience = rng.exponential(profile.patience_seconds, size) if abandons else np.full(size, np.inf)
+    service = service_times(rng, profile.aht_seconds, size, distribution, service_cv)
+    # The first interval's worth of arrivals warms the queue up and is not measured.
+    measured = arrivals >= interval_seconds
+    evaluated: dict[int, tuple[float, float, float]] = {}
+
+    def evaluate(agents: int) -> tuple[float, float, float]:
+        # Every candidate sees the same arrivals, patience and handle times (common random numbers).
+        if agents not in evaluated:
+            waits = queue_waits(arrivals, patience, service, agents)[measured]
+            served = waits[~np.isnan(waits)]
+            total = len(waits)
+            evaluated[agents] = (
+                np.count_nonzero(served <= profile.sla_time_seconds) / total * 100.0 if total else 100.0,
+                float(served.mean()) if len(served) else 0.0,
+                (total - len(served)) / total * 100.0 if total else 0.0,
+            )
+        return evaluated[agents]
+
+    def meets(agents: int) -> bool:
+        return evaluate(agents)[0] >= profile.sla_target_pct
+
+    agents = min(max(1, warm_start), max_agents)
+    if meets(agents):
+        while agents > 1 and meets(agents - 1):
+            agents -= 1
+    else:
+        while agents < max_agents and not meets(agents + 1):
+            agents += 1
+        agents = min(agents + 1, max_agents)
+    capped = not meets(agents)
+
+    # Shrinkage and the occupancy floor follow ``size_intervals``; a floored count is re-simulated.
+    traffic = volume * profile.aht_seconds / interval_seconds
+    occupancy = min(100.0, traffic / agents * 100.0)
+    shrinkage_factor = 1.0 - profile.shrinkage_pct / 100.0
+    staffed = math.ceil(agents / shrinkage_factor) if shrinkage_factor > 0 else agents
+    floored = occupancy_floor is not None and occupancy < occupancy_floor
+    if floored:
+        staffed = max(staffed, math.ceil(traffic / (occupancy_floor / 100.0)))
+        return (staffed, *evaluate(staffed), capped, True)
+    return (staffed, *evaluate(agents), capped, False)
+
+
+def size_intervals_simulated(
+    demand: IntervalDemand,
+    profile: Profile,
+    service_distribution: ServiceDistribution = ServiceDistribution.LOGNORMAL,
+    service_cv: float = 1.0,
+    occupancy_floor: float | None = None,
+    periods: int = 20,
+    max_agents: int = 500,
+    rng_seed: int = 42,
+    max_workers: int | None = None,
+) -> SizingResult:
+    """Size every interval by simulating candidate staffing levels.
+
+    Each distinct interval volume is simulated as a stationary queue with
+    Poisson arrivals over ``periods`` interval-lengths after a one-interval
+    warm-up, with handle times drawn from ``service_distribution``. Abandonment
+    is modelled for Erlang A profiles only. The search starts from the analytic
+    ``required_agents`` answer and steps up or down; all candidates share one
+    set of draws. Seeds depend on ``rng_seed`` and the volume alone, so results
+    do not depend on ``max_workers`` (``1`` runs serially). Shrinkage and
+    ``occupancy_floor`` are applied as in ``size_intervals``. Erlang B and chat
+    concurrency are not simulated and raise ``ValueError``.
+    """
+    if profile.erlang_model == ErlangModel.B:
+        raise ValueError("Simulated sizing needs a queueing model (Erlang C or A)")
+    if profile.channel == ChannelType.CHAT and profile.max_concurrency > 1:
+        raise ValueError("Simulated sizing does not model chat concurrency")
+    if service_cv < 0:
+        raise ValueError("service_cv must be non-negative")
+    if periods < 1:
+        raise ValueError("periods must be at least 1")
+    interval_seconds = profile.interval_minutes * 60
+    volumes, inverse = np.unique(demand.volumes, return_inverse=True)
+    jobs: list[_Job] = []
+    for volume in volumes.tolist():
+        warm_start, _ = required_agents(
+            volume, interval_seconds, profile.aht_seconds, profile.erlang_model, profile.sla_target_pct,
+            profile.sla_time_seconds, profile.patience_seconds, max_agents,
+        )
+        seed = (rng_seed, int(np.float64(volume).view(np.int64)) & 0x7FFFFFFFFFFFFFFF)
+        jobs.append((
+            volume, warm_start, seed, profile, service_distribution, service_cv, periods, max_agents, occupancy_floor,
+        ))
+
+    busy = [job for job in jobs if job[0] > 0]
+    if max_workers == 1 or len(busy) <= 1:
+        solved = list(map(_simulated_staffing, busy))
+    else:
+        workers = max_workers or min(len(busy), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            solved = list(pool.map(_simulated_staffing, busy, chunksize=max(1, len(busy) // (4 * workers))))
+    results = iter(solved)
+    # Idle intervals mirror ``size_intervals``: no agents, and any floor is recorded but adds none.
+    idle = (0, 100.0, 0.0, 0.0, False, occupancy_floor is not None)
+    table = np.array([next(results) if job[0] > 0 else idle for job in jobs], dtype=np.float64)
+
+    label = (
+        f"lognormal AHT (CV {service_cv:g})" if service_distribution == ServiceDistribution.LOGNORMAL
+        else "exponential AHT"
+    )
+    approximations = list(demand.approximations)
+    approximations.append(
+        f"Agents sized by simulation ({label}, Poisson arrivals, {periods} interval-lengths per volume); "
+        "SLA, ASA and abandonment are simulated estimates"
+    )
+    overrides: dict[int, tuple[str, ...]] = {}
+    capped = table[inverse, 4].astype(bool)
+    floored = table[inverse, 5].astype(bool)
+    for i in np.flatnonzero(capped | floored).tolist():
+        notes = []
+        if capped[i]:
+            notes.append(f"Simulated SLA target not met at the {max_agents}-agent cap")
+        if floored[i]:
+            notes.append(f"Occupancy floor {occupancy_floor}% applied")
+        overrides[i] = tuple(notes)
+
+    return SizingResult(
+        profile=profile,
+        timestamps=demand.timestamps.copy(),
+        volumes=demand.volumes.copy(),
+        agents_required=table[inverse, 0].astype(np.int64),
+        sla_pct=table[inverse, 1],
+        asa_seconds=table[inverse, 2],
+        abandonment_pct=table[inverse, 3],
+        overrides=overrides,
+        approximations=approximations,
+        occupancy_floor=occupancy_floor,
+    )
@@ -0,0 +1,158 @@
+"""What-if sweeps of required staffing over a grid of profile perturbations."""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass, field, replace
+from typing import Any, Sequence
+
+import numpy as np
+
+from core.erlang.cache import ErlangCache
+from core.models import ChannelType, IntervalDemand, Profile
+from core.sizing.orchestrator import size_intervals
+
+SWEEP_AXES = ("aht_seconds", "sla_target_pct", "shrinkage_pct", "volume_factor")
+
+
+@dataclass(eq=False)
+class StaffingSweep:
+    """Required agents for every grid point and interval.
+
+    ``agents`` has shape ``(len(aht_seconds), len(sla_target_pct),
+    len(shrinkage_pct), len(volume_factor), intervals)``; axis values are in
+    ``axes`` under the names in ``SWEEP_AXES``.
+    """
+
+    axes: dict[str, np.ndarray]
+    timestamps: np.ndarray
+    agents: np.ndarray
+    interval_minutes: int
+    approximations: list[str] = field(default_factory=list)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StaffingSweep):
+            return NotImplemented
+        return (
+            self.axes.keys() == other.axes.keys()
+            and all(np.array_equal(axis, other.axes[name]) for name, axis in self.axes.items())
+            and np.array_equal(self.timestamps, other.timestamps)
+            and np.array_equal(self.agents, other.agents)
+            and self.interval_minutes == other.interval_minutes
+            and self.approximations == other.approximations
+        )
+
+    def peak_agents(self) -> np.ndarray:
+        """Peak interval requirement per grid point."""
+        return self.agents.max(axis=-1, initial=0)
+
+    def agent_hours(self) -> np.ndarray:
+        """Total required agent-hours across the horizon per grid point."""
+        return self.agents.sum(axis=-1, dtype=np.int64) * (self.interval_minutes / 60.0)
+
+    def scenario(self, **values: float) -> np.ndarray:
+        """Per-interval agents at the given axis values; omitted axes must have a single value."""
+        unknown = set(values) - set(SWEEP_AXES)
+        if unknown:
+            raise ValueError(f"Unknown sweep axes: {sorted(unknown)}")
+        index = []
+        for name in SWEEP_AXES:
+            axis = self.axes[name]
+            if name not in values:
+                if len(axis) != 1:
+                    raise ValueError(f"Sweep axis '{name}' has several values; pass one")
+                index.append(0)
+                continue
+            hits = np.nonzero(np.isclose(axis, values[name]))[0]
+            if not hits.size:
+                raise ValueError(f"{name}={values[name]} is not on the sweep grid")
+            index.append(int(hits[0]))
+        return self.agents[tuple(index)]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "axes": {name: values.tolist() for name, values in self.axes.items()},
+            "timestamps": [ts.isoformat() for ts in self.timestamps.tolist()],
+            "agents": self.agents.tolist(),
+            "interval_minutes": self.interval_minutes,
+            "approximations": list(self.approximations),
+        }
+
+
+def _axis(values: Sequence[float] | None, base: float) -> np.ndarray:
+    axis = np.asarray([base] if values is None else values, dtype=np.float64)
+    if axis.ndim != 1 or not axis.size:
+        raise ValueError("Sweep axes need at least one value")
+    return axis
+
+
+def sweep_staffing(
+    demand: IntervalDemand,
+    profile: Profile,
+    aht_seconds: Sequence[float] | None = None,
+    sla_target_pct: Sequence[float] | None = None,
+    shrinkage_pct: Sequence[float] | None = None,
+    volume_factor: Sequence[float] | None = None,
+    occupancy_floor: float | None = None,
+    cache: ErlangCache | None = None,
+) -> StaffingSweep:
+    """Size ``demand`` for every combination of the given parameter values.
+
+    Axes left as ``None`` hold the profile's own value (or a volume factor of 1).
+    Every grid point equals ``size_intervals`` run on the perturbed inputs. The
+    Erlang search runs once per (AHT, SLA target, volume) point through a shared
+    cache; shrinkage and the occupancy floor are applied to those raw counts in
+    bulk. Concurrent chat profiles are sized in full at every grid point.
+    """
+    axes = {
+        "aht_seconds": _axis(aht_seconds, profile.aht_seconds),
+        "sla_target_pct": _axis(sla_target_pct, profile.sla_target_pct),
+        "shrinkage_pct": _axis(shrinkage_pct, profile.shrinkage_pct),
+        "volume_factor": _axis(volume_factor, 1.0),
+    }
+    cache = cache if cache is not None else ErlangCache()
+    interval_seconds = profile.interval_minutes * 60
+    concurrent = profile.channel == ChannelType.CHAT and profile.max_concurrency > 1
+    agents = np.zeros(tuple(len(v) for v in axes.values()) + (len(demand),), dtype=np.int32)
+    approximations: list[str] = []
+
+    for (a, aht), (s, sla), (v, factor) in itertools.product(
+        enumerate(axes["aht_seconds"].tolist()),
+        enumerate(axes["sla_target_pct"].tolist()),
+        enumerate(axes["volume_factor"].tolist()),
+    ):
+        scaled = IntervalDemand(
+            timestamps=demand.timestamps,
+            volumes=demand.volumes * factor,
+            interval_method=demand.interval_method,
+            approximations=demand.approximations,
+        )
+        variant = replace(profile, aht_seconds=aht, sla_target_pct=sla)
+
+        if concurrent:
+            for k, shrinkage in enumerate(axes["shrinkage_pct"].tolist()):
+                result = size_intervals(scaled, replace(variant, shrinkage_pct=shrinkage), occupancy_floor, cache)
+                agents[a, s, k, v] = result.agents_required
+                approximations = result.approximations
+            continue
+
+        result = size_intervals(scaled, replace(variant, shrinkage_pct=0.0), None, cache)
+        raw = result.agents_required
+        approximations = result.approximations
+        traffic = np.where(scaled.volumes > 0, (scaled.volumes * aht) / interval_seconds, 0.0)
+        occupancy = np.maximum(0.0, np.minimum(100.0, (traffic / np.maximum(1, raw)) * 100.0))
+        for k, shrinkage in enumerate(axes["shrinkage_pct"].tolist()):
+            shrinkage_factor = 1.0 - shrinkage / 100.0
+            staffed = np.where(raw > 0, np.ceil(raw / shrinkage_factor), 0).astype(np.int64) if shrinkage_factor > 0 else raw
+            if occupancy_floor is not None:
+                floor_agents = np.ceil(traffic / (occupancy_floor / 100.0)).astype(np.int64)
+                staffed = np.where(occupancy < occupancy_floor, np.maximum(staffed, floor_agents), staffed)
+            agents[a, s, k, v] = staffed
+
+    return StaffingSweep(
+        axes=axes,
+        timestamps=demand.timestamps.copy(),
+        agents=agents,
+        interval_minutes=profile.interval_minutes,
+        approximations=list(approximations),
+    )
@@ -0,0 +1,149 @@
+"""Precomputed traffic → minimum-agents tables for a fixed sizing profile."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from core.erlang.engine import kpis_for_agents
+from core.models import ErlangModel, Profile
+
+_BUILD_INTERVAL_SECONDS = 3600.0
+
+
+def profile_fingerprint(profile: Profile) -> dict[str, Any]:
+    """Profile fields that determine required agents for a given traffic."""
+    return {
+        "sla_target_pct": profile.sla_target_pct,
+        "sla_time_seconds": profile.sla_time_seconds,
+        "aht_seconds": profile.aht_seconds,
+        "patience_seconds": profile.patience_seconds,
+        "erlang_model": profile.erlang_model.value,
+    }
+
+
+@dataclass(eq=False)
+class StaffingTable:
+    """Minimum agents as a step function of traffic (Erlangs).
+
+    ``capacity[n - 1]`` is the largest traffic verified to meet the target with
+    ``n`` agents and ``failure[n - 1]`` the smallest traffic verified to miss it.
+    Traffic between the two is ambiguous and is left to the Erlang engine, so
+    table lookups always agree with ``required_agents``.
+    """
+
+    fingerprint: dict[str, Any]
+    resolution: float
+    capacity: np.ndarray
+    failure: np.ndarray
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StaffingTable):
+            return NotImplemented
+        return (
+            self.fingerprint == other.fingerprint
+            and self.resolution == other.resolution
+            and np.array_equal(self.capacity, other.capacity)
+            and np.array_equal(self.failure, other.failure)
+        )
+
+    @property
+    def max_agents(self) -> int:
+        return len(self.capacity)
+
+    def matches(self, profile: Profile) -> bool:
+        return self.fingerprint == profile_fingerprint(profile)
+
+    def lookup(self, traffic: np.ndarray) -> np.ndarray:
+        """Minimum agents per traffic value; -1 where the table cannot decide."""
+        traffic = np.asarray(traffic, dtype=np.float64)
+        agents = np.searchsorted(self.capacity, traffic, side="left") + 1
+        inside = (traffic > 0) & (agents <= self.max_agents)
+        below_ok = np.ones(traffic.shape, dtype=bool)
+        has_prev = inside & (agents >= 2)
+        below_ok[has_prev] = traffic[has_prev] >= self.failure[agents[has_prev] - 2]
+        return np.where(inside & below_ok, agents, -1)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "resolution": self.resolution,
+            "capacity": self.capacity.tolist(),
+            "failure": self.failure.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StaffingTable:
+        return cls(
+            fingerprint=dict(data["fingerprint"]),
+            resolution=float(data["resolution"]),
+            capacity=np.asarray(data["capacity"], dtype=np.float64),
+            failure=np.asarray(data["failure"], dtype=np.float64),
+        )
+
+
+def build_staffing_table(profile: Profile, max_agents: int = 500, resolution: float = 1e-3) -> StaffingTable:
+    """Bisect, for each agent count, the largest traffic that still meets the profile target.
+
+    Mirrors ``required_agents``: a count of ``n`` agents is only eligible for
+    traffic up to ``n`` because the search never starts below ``ceil(traffic)``.
+    """
+    if profile.aht_seconds <= 0:
+        raise ValueError("Staffing tables need a positive AHT")
+    if resolution <= 0:
+        raise ValueError("resolution must be positive")
+
+    def evaluate(agents: int, traffic: float) -> tuple[bool, float]:
+        volume = traffic * _BUILD_INTERVAL_SECONDS / profile.aht_seconds
+        kpi = kpis_for_agents(
+            agents, volume, _BUILD_INTERVAL_SECONDS, profile.aht_seconds, profile.erlang_model,
+            profile.sla_time_seconds, profile.patience_seconds,
+        )
+        if kpi.traffic_erlangs > agents:
+            return False, kpi.traffic_erlangs
+        if profile.erlang_model == ErlangModel.B:
+            return kpi.abandonment_pct <= (100.0 - profile.sla_target_pct), kpi.traffic_erlangs
+        return kpi.sla_pct >= profile.sla_target_pct, kpi.traffic_erlangs
+
+    capacity = np.zeros(max_agents, dtype=np.float64)
+    failure = np.zeros(max_agents, dtype=np.float64)
+    lo = 0.0
+    step = 1.0
+    for n in range(1, max_agents + 1):
+        ok, at = evaluate(n, float(n))
+        if ok:
+            capacity[n - 1] = at
+            failure[n - 1] = math.nextafter(at, math.inf)
+            lo = at
+            continue
+
+        # Thresholds grow by roughly ``step`` per agent; probe just past that before falling back to n.
+        hi, hi_at = float(n), at
+        lo_at = lo
+        probe = min(hi, lo + 2.0 * step + resolution)
+        ok, at = evaluate(n, probe)
+        if ok:
+            lo, lo_at = probe, at
+        else:
+            hi, hi_at = probe, at
+        while hi - lo > resolution:
+            mid = (lo + hi) / 2.0
+            ok, at = evaluate(n, mid)
+            if ok:
+                lo, lo_at = mid, at
+            else:
+                hi, hi_at = mid, at
+        step = max(lo_at - (capacity[n - 2] if n >= 2 else 0.0), resolution)
+        capacity[n - 1] = lo_at
+        failure[n - 1] = hi_at
+        lo = lo_at
+
+    return StaffingTable(
+        fingerprint=profile_fingerprint(profile),
+        resolution=resolution,
+        capacity=capacity,
+        failure=failure,
+    )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QListWidget,
@@ -118,21 +118,3 @@ class MainWindow(QMainWindow):
         if self.nav.item(index).flags() & Qt.ItemFlag.ItemIsEnabled:
             self.nav.setCurrentRow(index)
 
-
-class WorkerThread(QThread):
-    finished = Signal(object)
-    error = Signal(str)
-    progress = Signal(int, str)
-
-    def __init__(self, fn, *args, **kwargs):
-        super().__init__()
-        self._fn = fn
-        self._args = args
-        self._kwargs = kwargs
-
-    def run(self):
-        try:
-            result = self._fn(*self._args, **self._kwargs)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
@@ -56,8 +56,11 @@ class ForecastStage(QWidget):
         self.forecast = select_and_forecast(day_ts, day_vol, self.horizon.value())
         self.model_label.setText(f"<b>Selected Model:</b> {self.forecast.model_name}")
         wmape = self.forecast.accuracy_wmape
+        folds = self.forecast.cv_folds
+        validation = "single holdout" if folds == 1 else f"mean of {folds} rolling-origin folds"
         self.accuracy_label.setText(
-            f"WMAPE: {wmape:.1f}%" if wmape is not None else "WMAPE: N/A (insufficient history)"
+            f"WMAPE: {wmape:.1f}% ({validation})"
+            if wmape is not None else "WMAPE: N/A (insufficient history)"
         )
 
         while self.badge_container.count():
@@ -69,6 +69,15 @@ class ProfileStage(QWidget):
         self.channel.addItems([c.value for c in ChannelType])
         form.addRow("Channel", self.channel)
 
+        self.concurrency = QSpinBox()
+        self.concurrency.setRange(1, 10)
+        self.concurrency.setValue(1)
+        form.addRow(help_label("Max Chat Concurrency", "Concurrency"), self.concurrency)
+
+        self.concurrency_factors = QLineEdit("")
+        self.concurrency_factors.setPlaceholderText("AHT factor per level, e.g. 1.0, 1.3, 1.7")
+        form.addRow("Concurrency AHT Curve", self.concurrency_factors)
+
         self.advanced = QCheckBox("Advanced mode")
         layout.addLayout(form)
         layout.addWidget(self.advanced)
@@ -84,8 +93,18 @@ class ProfileStage(QWidget):
         self.advanced.toggled.connect(lambda on: self.erlang_model.setEnabled(on))
         layout.addStretch()
 
+    def _factors(self) -> list[float] | None:
+        text = self.concurrency_factors.text().strip()
+        if not text:
+            return []
+        try:
+            factors = [float(part) for part in text.split(",")]
+        except ValueError:
+            return None
+        return factors if all(f > 0 for f in factors) else None
+
     def validate(self) -> bool:
-        return bool(self.name.text().strip())
+        return bool(self.name.text().strip()) and self._factors() is not None
 
     def collect(self) -> dict:
         profile = Profile(
@@ -98,5 +117,7 @@ class ProfileStage(QWidget):
             patience_seconds=float(self.patience.value()),
             channel=ChannelType(self.channel.currentText()),
             erlang_model=ErlangModel(self.erlang_model.currentText()),
+            max_concurrency=self.concurrency.value(),
+            concurrency_aht_factors=self._factors() or [],
         )
         return {"profile": profile}
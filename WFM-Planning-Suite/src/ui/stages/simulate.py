@@ -4,7 +4,26 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
-from core.simulation.des import cross_validate, run_simulation
+from core.models import IntervalSimulation, Profile, SimulationResult, SizingResult
+from core.simulation.des import cross_validate, run_replications, simulate_staffing
+from ui.widgets import WorkerThread
+
+
+def _ci(simulation: SimulationResult, bounds: tuple[float, float] | None) -> str:
+    if not bounds or simulation.confidence is None:
+        return ""
+    return f"({simulation.confidence:.0%} CI {bounds[0]:.1f}–{bounds[1]:.1f})"
+
+
+def _cross_check(
+    sizing: SizingResult, profile: Profile, agents: int,
+) -> tuple[SimulationResult, IntervalSimulation]:
+    # Serial replications: worker processes are not started from the UI's worker thread.
+    simulation = run_replications(
+        sizing, profile.aht_seconds, profile.patience_seconds, agents, max_workers=1, antithetic=True
+    )
+    continuous = simulate_staffing(sizing, profile.aht_seconds, profile.patience_seconds)
+    return cross_validate(sizing, simulation), continuous
 
 
 class SimulateStage(QWidget):
@@ -12,6 +31,7 @@ class SimulateStage(QWidget):
         super().__init__()
         self.main_window = main_window
         self.simulation = None
+        self._worker: WorkerThread | None = None
 
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("<h2>Simulation Cross-Check</h2>"))
@@ -26,27 +46,42 @@ class SimulateStage(QWidget):
         sizing = data.get("sizing")
         profile = data.get("profile")
         headcount = data.get("headcount", 50)
-        if not sizing or not profile:
+        if not sizing or not profile or self._worker is not None:
             return
 
         agents = min(headcount, max((r.agents_required for r in sizing.rows), default=1))
-        self.simulation = run_simulation(
-            sizing, profile.aht_seconds, profile.patience_seconds, agents
-        )
-        self.simulation = cross_validate(sizing, self.simulation)
+        self.simulation = None
+        self.results.setText("Running simulation…")
+        # Replications and the continuous run take seconds on long horizons; keep them off the GUI thread.
+        self._worker = WorkerThread(_cross_check, sizing, profile, agents)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.error.connect(self._on_error)
+        self._worker.start()
 
+    def _on_finished(self, outcome: tuple[SimulationResult, IntervalSimulation]):
+        self._worker = None
+        self.simulation, continuous = outcome
+        summary = continuous.summary
         status = "✓ Passed" if self.simulation.cross_check_passed else "⚠ Review"
         self.results.setText(
             f"<b>Simulation Results</b><br>"
-            f"SLA: {self.simulation.sla_pct:.1f}%<br>"
-            f"ASA: {self.simulation.asa_seconds:.1f} sec<br>"
-            f"Abandonment: {self.simulation.abandonment_pct:.1f}%<br>"
+            f"SLA: {self.simulation.sla_pct:.1f}% {_ci(self.simulation, self.simulation.sla_ci)}<br>"
+            f"ASA: {self.simulation.asa_seconds:.1f} sec {_ci(self.simulation, self.simulation.asa_ci)}<br>"
+            f"Abandonment: {self.simulation.abandonment_pct:.1f}% "
+            f"{_ci(self.simulation, self.simulation.abandonment_ci)}<br>"
+            f"Replications: {self.simulation.replications}<br>"
             f"Intervals simulated: {self.simulation.intervals_simulated} "
             f"(warm-up excluded)<br>"
+            f"Continuous run at sized staffing: SLA {summary.sla_pct:.1f}%, "
+            f"abandonment {summary.abandonment_pct:.1f}% (backlog carried between intervals)<br>"
             f"Cross-check: {status}<br>"
             f"<i>{self.simulation.cross_check_notes}</i>"
         )
 
+    def _on_error(self, message: str):
+        self._worker = None
+        self.results.setText(f"Simulation failed: {message}")
+
     def validate(self) -> bool:
         return self.simulation is not None
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import QLabel, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
 
+from core.erlang.cache import ErlangCache
 from core.sizing.orchestrator import derive_interval_pattern, size_intervals
 from ui.widgets import approximation_badge
 
@@ -14,6 +15,7 @@ class SizeStage(QWidget):
         self.main_window = main_window
         self.sizing = None
         self.demand = None
+        self.cache = ErlangCache()
 
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("<h2>Staffing (Erlang Sizing)</h2>"))
@@ -48,7 +50,7 @@ class SizeStage(QWidget):
         for note in self.demand.approximations:
             self.badge_container.addWidget(approximation_badge(note))
 
-        self.sizing = size_intervals(self.demand, profile)
+        self.sizing = size_intervals(self.demand, profile, cache=self.cache, previous=self.sizing)
         preview = self.sizing.rows[:200]
         self.table.setRowCount(len(preview))
         for i, row in enumerate(preview):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import QLabel
 
 HELP_TEXT = {
@@ -14,6 +15,7 @@ HELP_TEXT = {
     "Erlang B": "Blocking model for trunk/resource capacity (no queue).",
     "Patience": "Average time a caller waits before hanging up.",
     "AHT": "Average Handle Time — mean duration of a contact including wrap-up.",
+    "Concurrency": "Chats an agent may handle at once; each level multiplies AHT by its curve factor.",
 }
 
 
@@ -33,3 +35,22 @@ def approximation_badge(text: str) -> QLabel:
     )
     badge.setWordWrap(True)
     return badge
+
+
+class WorkerThread(QThread):
+    finished = Signal(object)
+    error = Signal(str)
+    progress = Signal(int, str)
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+            self.finished.emit(result)
+        except Exception as e:
+            self.error.emit(str(e))
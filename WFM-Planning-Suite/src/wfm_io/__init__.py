@@ -2,8 +2,20 @@ from wfm_io.files import (
     auto_map_columns,
     export_report_excel,
     load_profile,
+    load_staffing_table,
     load_upload,
     save_profile,
+    save_staffing_table,
+    staffing_table_path,
 )
 
-__all__ = ["auto_map_columns", "export_report_excel", "load_profile", "load_upload", "save_profile"]
+__all__ = [
+    "auto_map_columns",
+    "export_report_excel",
+    "load_profile",
+    "load_staffing_table",
+    "load_upload",
+    "save_profile",
+    "save_staffing_table",
+    "staffing_table_path",
+]
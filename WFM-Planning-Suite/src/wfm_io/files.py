@@ -8,9 +8,11 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+from openpyxl import Workbook
 
 from core.datetime.parser import parse_series, resolve_date_format
 from core.models import Profile, RawUpload, ValidationIssue
+from core.sizing.tables import StaffingTable
 
 EXPECTED_COLUMNS = {
     "timestamp": ["timestamp", "datetime", "date", "time", "interval"],
@@ -91,8 +93,10 @@ def load_upload(file_path: str | Path, column_mapping: dict[str, str] | None = N
     )
 
 
-def save_profile(profile: Profile, path: str | Path) -> None:
+def save_profile(profile: Profile, path: str | Path, table: StaffingTable | None = None) -> None:
     Path(path).write_text(json.dumps(profile.to_dict(), indent=2))
+    if table is not None:
+        save_staffing_table(table, path)
 
 
 def load_profile(path: str | Path) -> Profile:
@@ -100,7 +104,38 @@ def load_profile(path: str | Path) -> Profile:
     return Profile.from_dict(data)
 
 
+def staffing_table_path(profile_path: str | Path) -> Path:
+    """Staffing tables live next to their profile: ``queue.json`` → ``queue.staffing.json``."""
+    path = Path(profile_path)
+    return path.with_name(f"{path.stem}.staffing.json")
+
+
+def save_staffing_table(table: StaffingTable, profile_path: str | Path) -> None:
+    staffing_table_path(profile_path).write_text(json.dumps(table.to_dict()))
+
+
+def load_staffing_table(profile_path: str | Path, profile: Profile) -> StaffingTable | None:
+    """Load the table saved beside ``profile_path``; None if missing or built for other profile settings."""
+    path = staffing_table_path(profile_path)
+    if not path.exists():
+        return None
+    table = StaffingTable.from_dict(json.loads(path.read_text()))
+    return table if table.matches(profile) else None
+
+
 def export_report_excel(report_data: dict[str, Any], path: str | Path) -> None:
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        for sheet_name, rows in report_data.get("sheets", {}).items():
-            pd.DataFrame(rows).to_excel(writer, sheet_name=sheet_name[:31], index=False)
+    """Write each sheet's row dicts through a write-only workbook.
+
+    Rows are appended one at a time, so generator sheets such as "Sizing"
+    stream to disk without being materialised. Columns follow the first row's keys.
+    """
+    workbook = Workbook(write_only=True)
+    for sheet_name, rows in report_data.get("sheets", {}).items():
+        sheet = workbook.create_sheet(sheet_name[:31])
+        columns: list[str] | None = None
+        for row in rows:
+            if columns is None:
+                columns = list(row)
+                sheet.append(columns)
+            sheet.append([row.get(column) for column in columns])
+    workbook.save(path)
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pytest
+
+from core.erlang.cache import ErlangCache
+from core.erlang.engine import kpis_for_agents, required_agents
+from core.models import ErlangModel, Profile
+from core.sizing.orchestrator import derive_interval_pattern, size_intervals
+
+
+@pytest.mark.tier1
+class TestErlangCache:
+    def test_exact_cache_matches_engine_and_counts_hits(self):
+        cache = ErlangCache()
+        first = cache.required_agents(120, 1800, 300, ErlangModel.C, 80, 20)
+        second = cache.required_agents(120, 1800, 300, ErlangModel.C, 80, 20)
+        assert first == second == required_agents(120, 1800, 300, ErlangModel.C, 80, 20)
+        assert cache.kpis_for_agents(25, 120, 1800, 300, ErlangModel.A) == kpis_for_agents(
+            25, 120, 1800, 300, ErlangModel.A,
+        )
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+        assert cache.approximation_note is None
+
+    def test_lru_is_bounded(self):
+        cache = ErlangCache(maxsize=3)
+        for volume in (10, 20, 30, 40):
+            cache.required_agents(volume, 1800, 300, ErlangModel.C)
+        assert cache.stats().size == 3
+        cache.required_agents(10, 1800, 300, ErlangModel.C)
+        assert cache.stats().hits == 0
+
+    def test_quantized_traffic_shares_entries_conservatively(self):
+        cache = ErlangCache(traffic_quantum=0.1)
+        low, _ = cache.required_agents(100.0, 1800, 300, ErlangModel.C)
+        high, _ = cache.required_agents(100.2, 1800, 300, ErlangModel.C)
+        assert cache.stats().hits == 1
+        assert low == high >= required_agents(100.2, 1800, 300, ErlangModel.C)[0]
+        assert "0.1 Erlangs" in cache.approximation_note
+
+    def test_sizing_reuses_identical_days(self):
+        profile = Profile(erlang_model=ErlangModel.C)
+        points = [{"timestamp": datetime(2024, 6, d), "volume": 400} for d in range(1, 4)]
+        demand = derive_interval_pattern([], points, profile.interval_minutes)
+        cache = ErlangCache()
+        cached = size_intervals(demand, profile, cache=cache)
+        plain = size_intervals(demand, profile)
+        assert cached.rows == plain.rows
+        assert cache.stats().hits >= 2 * len(cached.rows) // 3
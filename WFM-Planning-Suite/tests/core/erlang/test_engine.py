@@ -1,11 +1,19 @@
 
+import numpy as np
 import pytest
+from scipy.linalg import expm
 
 from core.erlang.engine import (
+    AgentSearch,
+    abandonment_erlang_a,
+    asa_erlang_a,
+    asa_erlang_c,
     erlang_b,
     kpis_for_agents,
     required_agents,
+    sla_erlang_a,
     sla_erlang_c,
+    solve_required_agents,
 )
 from core.models import ErlangModel
 
@@ -58,9 +66,115 @@ class TestRequiredAgents:
         assert abs(display.sla_pct - kpi.sla_pct) < 0.01
         assert display.abandonment_pct == 0.0
 
+    @pytest.mark.parametrize("model", list(ErlangModel))
+    def test_incremental_search_matches_linear(self, model):
+        for volume in (0.5, 12, 80, 240, 900):
+            linear = required_agents(volume, 1800, 300, model, 85, 20, 90, search=AgentSearch.LINEAR)
+            incremental = required_agents(volume, 1800, 300, model, 85, 20, 90, search=AgentSearch.INCREMENTAL)
+            assert incremental == linear
+
+    @pytest.mark.parametrize("model", list(ErlangModel))
+    def test_bisect_matches_linear(self, model):
+        for volume in (0.5, 12, 80, 240, 900):
+            for target in (50, 80, 95):
+                linear = required_agents(volume, 1800, 300, model, target, 20, 90, search=AgentSearch.LINEAR)
+                bisect = required_agents(volume, 1800, 300, model, target, 20, 90, search=AgentSearch.BISECT)
+                assert bisect == linear
+
+    def test_bisect_has_no_agent_cap_and_fewer_evaluations(self):
+        volume = 6000
+        scan = solve_required_agents(volume, 1800, 300, ErlangModel.C, max_agents=None, search=AgentSearch.INCREMENTAL)
+        bisect = solve_required_agents(volume, 1800, 300, ErlangModel.C)
+        assert bisect.agents == scan.agents > 500
+        assert not bisect.capped
+        assert bisect.evaluations < scan.evaluations
+
+    def test_cap_is_reported(self):
+        solution = solve_required_agents(6000, 1800, 300, ErlangModel.C, max_agents=500)
+        assert solution.agents == 500
+        assert solution.capped
+
+    @pytest.mark.parametrize("search", list(AgentSearch))
+    def test_traffic_above_cap_is_capped_for_every_strategy(self, search):
+        # 12 Erlangs against a 10-agent cap; 10 trunks would meet the 50% blocking target.
+        assert kpis_for_agents(10, 72, 1800, 300, ErlangModel.B).abandonment_pct <= 50.0
+        solution = solve_required_agents(72, 1800, 300, ErlangModel.B, 50, max_agents=10, search=search)
+        assert (solution.agents, solution.capped) == (10, True)
+        assert solution == solve_required_agents(72, 1800, 300, ErlangModel.B, 50, max_agents=10,
+                                                 search=AgentSearch.LINEAR)
+
 
 @pytest.mark.tier1
 class TestErlangA:
     def test_abandonment_positive_with_patience(self):
         kpi = kpis_for_agents(15, 100, 1800, 300, ErlangModel.A, patience_seconds=60)
         assert kpi.abandonment_pct >= 0.0
+
+    def test_abandonment_matches_birth_death_chain(self):
+        agents, traffic, aht, patience = 50, 55.0, 300.0, 60.0
+        mu, theta = 1 / aht, 1 / patience
+        weights = [1.0]
+        for j in range(1, agents + 1):
+            weights.append(weights[-1] * traffic / j)
+        for k in range(1, 2000):
+            weights.append(weights[-1] * traffic * mu / (agents * mu + k * theta))
+        total = sum(weights)
+        mean_queue = sum(k * weights[agents + k] for k in range(1, 2000)) / total
+        expected = theta * mean_queue / (traffic * mu) * 100.0
+        assert abandonment_erlang_a(agents, traffic, aht, patience) == pytest.approx(expected, rel=1e-10)
+
+    @pytest.mark.parametrize("agents,traffic,aht,sla_time,patience", [
+        (10, 8.0, 300.0, 20.0, 120.0),
+        (25, 27.0, 240.0, 30.0, 60.0),
+        (4, 2.5, 600.0, 15.0, 300.0),
+    ])
+    def test_matches_tagged_caller_chain(self, agents, traffic, aht, sla_time, patience):
+        # Independent oracle: an arriving caller sees the stationary birth-death chain (PASTA),
+        # then moves up the queue as a transient CTMC until answered or abandoning.
+        mu, theta = 1 / aht, 1 / patience
+        depth = 300
+        weights = [1.0]
+        for j in range(1, agents + 1):
+            weights.append(weights[-1] * traffic / j)
+        for k in range(1, depth):
+            weights.append(weights[-1] * traffic * mu / (agents * mu + k * theta))
+        pi = np.array(weights) / sum(weights)
+        ahead = np.arange(depth)
+        generator = np.diag(-(agents * mu + ahead * theta + theta))
+        generator[ahead[1:], ahead[:-1]] = agents * mu + ahead[1:] * theta
+        answer_rate = np.zeros(depth)
+        answer_rate[0] = agents * mu
+        queued = pi[agents:agents + depth]
+        fundamental = np.linalg.inv(-generator)
+        # P(answered by t) = queued @ N (I - exp(Q t)) r, with N = (-Q)^-1 the fundamental matrix.
+        within = queued @ (fundamental @ (np.eye(depth) - expm(generator * sla_time)) @ answer_rate)
+        answered_later = queued @ fundamental @ answer_rate
+        wait_answered = queued @ fundamental @ fundamental @ answer_rate
+        sla = (pi[:agents].sum() + within) * 100.0
+        asa = wait_answered / (pi[:agents].sum() + answered_later)
+        assert sla_erlang_a(agents, traffic, aht, sla_time, patience) == pytest.approx(sla, rel=1e-9)
+        assert asa_erlang_a(agents, traffic, aht, patience) == pytest.approx(asa, rel=1e-9)
+
+    def test_long_patience_approaches_erlang_c(self):
+        sla = sla_erlang_a(12, 9.0, 300, 20, 1e7)
+        assert sla == pytest.approx(sla_erlang_c(12, 9.0, 300, 20), abs=1e-3)
+        assert asa_erlang_a(12, 9.0, 300, 1e7) == pytest.approx(asa_erlang_c(12, 9.0, 300), rel=1e-3)
+
+    def test_overloaded_queue_stays_finite(self):
+        kpi = kpis_for_agents(40, 200, 1800, 600, ErlangModel.A, patience_seconds=45)
+        assert 0.0 < kpi.abandonment_pct < 100.0
+        assert kpi.sla_pct < 50.0
+
+    def test_needs_no_more_agents_than_erlang_c(self):
+        c_agents, _ = required_agents(300, 1800, 300, ErlangModel.C, 80, 20)
+        a_agents, kpi = required_agents(300, 1800, 300, ErlangModel.A, 80, 20, 60)
+        assert a_agents <= c_agents
+        assert kpi.sla_pct >= 80.0
+
+    @pytest.mark.parametrize("patience", [0.0, -5.0, float("inf")])
+    def test_no_patience_means_no_abandonment(self, patience):
+        a = kpis_for_agents(12, 100, 1800, 300, ErlangModel.A, 20, patience)
+        c = kpis_for_agents(12, 100, 1800, 300, ErlangModel.C, 20, patience)
+        assert a.abandonment_pct == 0.0
+        assert (a.sla_pct, a.asa_seconds) == (c.sla_pct, c.asa_seconds)
+        assert required_agents(100, 1800, 300, ErlangModel.A, 80, 20, patience)[0] == 21
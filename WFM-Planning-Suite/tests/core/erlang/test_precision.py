@@ -0,0 +1,79 @@
+import math
+from decimal import Decimal, localcontext
+
+import pytest
+
+from core.erlang.engine import (
+    AgentSearch,
+    erlang_b,
+    kpis_for_agents,
+    kpis_for_agents_log,
+    log_erlang_b,
+    log_erlang_c,
+    sla_erlang_c_log,
+    solve_required_agents,
+)
+from core.models import ErlangModel
+
+
+def _reference_log_b(agents: int, traffic: float) -> Decimal:
+    with localcontext() as ctx:
+        ctx.prec = 60
+        a = Decimal(traffic)
+        inv_b = Decimal(1)
+        for k in range(1, agents + 1):
+            inv_b = 1 + Decimal(k) / a * inv_b
+        return -inv_b.ln()
+
+
+def _reference_log_c(agents: int, traffic: float) -> Decimal:
+    with localcontext() as ctx:
+        ctx.prec = 60
+        a = Decimal(traffic)
+        log_b = _reference_log_b(agents, traffic)
+        denom = agents - a * (1 - log_b.exp())
+        return Decimal(agents).ln() + log_b - denom.ln()
+
+
+LARGE_POOLS = [(1200, 1100.0), (2500, 2400.5), (5200, 5000.0), (8000, 5000.0), (3000, 800.0)]
+
+
+@pytest.mark.tier2
+class TestLogSpacePrecision:
+    @pytest.mark.parametrize("agents,traffic", LARGE_POOLS)
+    def test_log_erlang_b_matches_reference(self, agents, traffic):
+        expected = float(_reference_log_b(agents, traffic))
+        assert log_erlang_b(agents, traffic) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize("agents,traffic", LARGE_POOLS)
+    def test_log_erlang_c_matches_reference(self, agents, traffic):
+        expected = float(_reference_log_c(agents, traffic))
+        assert log_erlang_c(agents, traffic) == pytest.approx(expected, rel=1e-10, abs=1e-12)
+
+    def test_finite_where_float_recurrence_underflows(self):
+        assert erlang_b(8000, 5000.0) == 0.0
+        assert log_erlang_b(8000, 5000.0) < -700
+
+    def test_sla_tail_stays_below_one_hundred(self):
+        # The wait tail is ~4.5e-9 here: representable, and the SLA must reflect it.
+        sla = sla_erlang_c_log(5200, 5000.0, 300, 20)
+        log_tail = float(_reference_log_c(5200, 5000.0)) - 200 * (20 / 300)
+        assert sla < 100.0
+        assert 100.0 - sla == pytest.approx(100.0 * math.exp(log_tail), rel=1e-9)
+
+    @pytest.mark.parametrize("model", list(ErlangModel))
+    def test_agrees_with_float_path_for_moderate_pools(self, model):
+        for agents, volume in ((12, 100), (60, 900), (300, 5000)):
+            plain = kpis_for_agents(agents, volume, 1800, 300, model, 20, 90)
+            logged = kpis_for_agents_log(agents, volume, 1800, 300, model, 20, 90)
+            assert logged.sla_pct == pytest.approx(plain.sla_pct, rel=1e-9, abs=1e-9)
+            assert logged.asa_seconds == pytest.approx(plain.asa_seconds, rel=1e-9, abs=1e-9)
+            assert logged.abandonment_pct == pytest.approx(plain.abandonment_pct, rel=1e-9, abs=1e-9)
+
+    def test_solver_handles_thousands_of_erlangs(self):
+        scan = solve_required_agents(
+            30000, 1800, 300, ErlangModel.C, 90, max_agents=None, search=AgentSearch.INCREMENTAL, log_space=True,
+        )
+        bisect = solve_required_agents(30000, 1800, 300, ErlangModel.C, 90, log_space=True)
+        assert scan.agents == bisect.agents > 5000
+        assert bisect.kpis.sla_pct >= 90.0
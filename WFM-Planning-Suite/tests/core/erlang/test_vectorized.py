@@ -0,0 +1,56 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from core.erlang.engine import erlang_b, erlang_c, kpis_for_agents
+from core.erlang.vectorized import erlang_b_array, erlang_c_array, kpis_for_agents_array
+from core.models import ErlangModel
+
+
+def _grid():
+    rng = np.random.default_rng(7)
+    agents = rng.integers(0, 120, size=400)
+    volume = rng.uniform(0, 600, size=400)
+    volume[::17] = 0.0
+    aht = rng.uniform(60, 900, size=400)
+    return agents, volume, aht
+
+
+@pytest.mark.tier1
+class TestVectorizedParity:
+    def test_erlang_b_and_c_match_scalar(self):
+        agents, volume, aht = _grid()
+        traffic = volume * aht / 1800
+        b = erlang_b_array(agents, traffic)
+        c = erlang_c_array(agents, traffic)
+        assert b.tolist() == [erlang_b(int(n), float(a)) for n, a in zip(agents, traffic)]
+        assert c.tolist() == [erlang_c(int(n), float(a)) for n, a in zip(agents, traffic)]
+
+    @pytest.mark.parametrize("model", list(ErlangModel))
+    def test_kpis_match_scalar_exactly(self, model):
+        agents, volume, aht = _grid()
+        arrays = kpis_for_agents_array(agents, volume, 1800, aht, model, 20.0, 90.0)
+        for i in range(len(agents)):
+            kpi = kpis_for_agents(int(agents[i]), float(volume[i]), 1800, float(aht[i]), model, 20.0, 90.0)
+            assert arrays.agents[i] == kpi.agents
+            assert arrays.traffic_erlangs[i] == kpi.traffic_erlangs
+            assert arrays.sla_pct[i] == kpi.sla_pct
+            assert arrays.asa_seconds[i] == kpi.asa_seconds
+            assert arrays.abandonment_pct[i] == kpi.abandonment_pct
+            assert arrays.occupancy_pct[i] == kpi.occupancy_pct
+
+    def test_scalar_inputs_broadcast(self):
+        arrays = kpis_for_agents_array([10, 12, 14], 100, 1800, 300, ErlangModel.C)
+        assert len(arrays) == 3
+        assert arrays.sla_pct[0] <= arrays.sla_pct[1] <= arrays.sla_pct[2]
+
+    def test_large_agents_small_traffic_is_warning_free(self):
+        agents = np.array([2000, 800, 5])
+        traffic = np.array([0.01, 0.5, 3.0])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            b = erlang_b_array(agents, traffic)
+            c = erlang_c_array(agents, traffic)
+        assert b[0] == 0.0 and c[0] == 0.0
+        assert b.tolist() == [erlang_b(int(n), float(a)) for n, a in zip(agents, traffic)]
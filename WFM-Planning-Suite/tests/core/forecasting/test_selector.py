@@ -0,0 +1,173 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.forecasting.selector import (
+    MODELS,
+    forecast_linear_trend,
+    select_and_forecast,
+    select_and_forecast_many,
+)
+
+
+def _series(count: int, length: int) -> np.ndarray:
+    rng = np.random.default_rng(count)
+    trend = np.arange(length) * rng.uniform(-2, 4, (count, 1))
+    weekly = np.where(np.arange(length) % 7 < 5, 1.0, 0.4) * rng.uniform(0, 1, (count, 1))
+    return np.maximum(0.0, rng.poisson(300, (count, length)) * (1 + weekly) + trend)
+
+
+def _reference_selection(volumes: list[float], horizon: int) -> tuple[str, float, list[float]]:
+    """The pre-vectorisation list-based holdout loop, kept verbatim as an oracle."""
+    holdout = max(1, min(7, len(volumes) // 5))
+    train, test = volumes[:-holdout], np.array(volumes[-holdout:])
+
+    def naive(history, h):
+        return [history[-1]] * h
+
+    def moving_average(history, h, window=7):
+        return [float(np.mean(history[-window:]))] * h
+
+    def seasonal_naive(history, h, season=7):
+        if len(history) < season:
+            return moving_average(history, h)
+        return [history[len(history) - season + (i % season)] for i in range(h)]
+
+    def linear_trend(history, h):
+        coeffs = np.polyfit(np.arange(len(history)), history, 1)
+        return [max(0.0, float(coeffs[0] * (len(history) + i) + coeffs[1])) for i in range(h)]
+
+    models = {
+        "naive": naive,
+        "moving_average": moving_average,
+        "seasonal_naive": seasonal_naive,
+        "linear_trend": linear_trend,
+    }
+    best_name, best_wmape = "moving_average", float("inf")
+    for name, fn in models.items():
+        try:
+            score = float(np.sum(np.abs(test - np.array(fn(train, holdout)))) / np.sum(np.abs(test)) * 100.0)
+            if score < best_wmape:
+                best_name, best_wmape = name, score
+        except Exception:
+            continue
+    return best_name, best_wmape, [max(0.0, v) for v in models[best_name](volumes, horizon)]
+
+
+@pytest.mark.tier1
+class TestVectorizedModels:
+    @pytest.mark.parametrize("length", [0, 1, 3, 7, 40])
+    @pytest.mark.parametrize("name", list(MODELS))
+    def test_batch_matches_single_series(self, name, length):
+        history = _series(5, length)
+        batch = MODELS[name](history, 9)
+        assert batch.shape == (5, 9)
+        for row, expected in zip(history, batch):
+            np.testing.assert_array_equal(MODELS[name](row, 9), expected)
+
+    def test_linear_trend_matches_polyfit(self):
+        history = _series(1, 30)[0]
+        slope, intercept = np.polyfit(np.arange(30), history, 1)
+        expected = np.maximum(0.0, slope * np.arange(30, 37) + intercept)
+        np.testing.assert_allclose(forecast_linear_trend(history, 7), expected, rtol=1e-10)
+
+
+@pytest.mark.tier1
+class TestBatchedSelection:
+    def test_batch_matches_per_series_selection(self):
+        volumes = _series(40, 60)
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(60)]
+        batched = select_and_forecast_many(timestamps, volumes, horizon=14, max_workers=1)
+        assert len({f.model_name for f in batched}) > 1
+        for row, forecast in zip(volumes, batched):
+            assert forecast == select_and_forecast(timestamps, row.tolist(), horizon=14)
+
+    def test_ties_keep_model_order_and_short_history_falls_back(self):
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(20)]
+        assert select_and_forecast(timestamps, [50.0] * 20, horizon=3).model_name == "naive"
+        short = select_and_forecast_many(timestamps[:2], np.ones((3, 2)), horizon=3)
+        assert all(f.fallback_used and f.model_name == "moving_average" for f in short)
+        assert select_and_forecast([], [], horizon=3).model_name == "none"
+        with pytest.raises(ValueError):
+            select_and_forecast_many(timestamps, np.ones(20), horizon=3)
+
+
+@pytest.mark.tier1
+class TestReferenceSelection:
+    @pytest.mark.parametrize("length", [10, 23, 60])
+    def test_single_fold_matches_list_implementation(self, length):
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(length)]
+        names = set()
+        for row in _series(30, length):
+            name, wmape, points = _reference_selection(row.tolist(), 9)
+            forecast = select_and_forecast(timestamps, row.tolist(), horizon=9, folds=1)
+            names.add(name)
+            assert forecast.model_name == name
+            assert forecast.accuracy_wmape == pytest.approx(wmape, rel=1e-9)
+            assert [p.volume for p in forecast.points] == pytest.approx(points, rel=1e-9, abs=1e-9)
+        assert len(names) > 1
+
+    def test_nan_history_skips_unscorable_models(self):
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(40)]
+        row = _series(1, 40)[0]
+        row[3] = np.nan
+        name, wmape, _ = _reference_selection(row.tolist(), 7)
+        forecast = select_and_forecast(timestamps, row.tolist(), horizon=7, folds=1)
+        assert np.isnan(forecast.cv_scores["linear_trend"]["wmape"][0])
+        assert forecast.model_name == name != "linear_trend"
+        assert forecast.accuracy_wmape == pytest.approx(wmape)
+        assert not forecast.fallback_used
+
+    def test_unscorable_series_falls_back_to_moving_average(self):
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(30)]
+        volumes = _series(2, 30)
+        volumes[1, -2] = np.nan
+        scored, unscored = select_and_forecast_many(timestamps, volumes, horizon=3, folds=1, max_workers=1)
+        assert not scored.fallback_used
+        assert unscored.model_name == "moving_average"
+        assert unscored.fallback_used and unscored.fallback_reason
+
+
+@pytest.mark.tier1
+class TestRollingOrigin:
+    def test_fold_scores_and_selection(self):
+        history = _series(1, 50)[0]
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(50)]
+        forecast = select_and_forecast(timestamps, history.tolist(), horizon=7, holdout=7, folds=3)
+        assert forecast.cv_folds == 3
+        assert set(forecast.cv_scores) == set(MODELS)
+        for k, origin in enumerate((29, 36, 43)):
+            predicted = MODELS["seasonal_naive"](history[:origin], 7)
+            actual = history[origin:origin + 7]
+            expected = np.abs(actual - predicted).sum() / actual.sum() * 100.0
+            assert forecast.cv_scores["seasonal_naive"]["wmape"][k] == pytest.approx(expected)
+        means = {name: np.mean(scores["wmape"]) for name, scores in forecast.cv_scores.items()}
+        assert forecast.model_name == min(means, key=means.get)
+        assert forecast.accuracy_wmape == pytest.approx(means[forecast.model_name])
+        assert forecast.bias == pytest.approx(np.mean(forecast.cv_scores[forecast.model_name]["bias"]))
+
+    def test_single_fold_is_the_last_holdout(self):
+        history = _series(1, 30)[0].tolist()
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(30)]
+        single = select_and_forecast(timestamps, history, horizon=5, folds=1)
+        last = select_and_forecast(timestamps, history, horizon=5, folds=4)
+        assert single.cv_folds == 1
+        assert all(scores["wmape"] == [last.cv_scores[name]["wmape"][-1]] for name, scores in single.cv_scores.items())
+
+    def test_short_history_uses_fewer_folds(self):
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(12)]
+        forecast = select_and_forecast(timestamps, [10.0 + i for i in range(12)], horizon=2, holdout=4, folds=5)
+        assert forecast.cv_folds == 2
+        with pytest.raises(ValueError):
+            select_and_forecast(timestamps, [1.0] * 12, horizon=2, folds=0)
+
+
+@pytest.mark.tier2
+class TestParallelSelection:
+    @pytest.mark.parametrize("max_workers", [2, 5, 20])
+    def test_series_chunks_match_serial(self, max_workers):
+        volumes = _series(12, 60)
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(60)]
+        serial = select_and_forecast_many(timestamps, volumes, horizon=7)
+        assert select_and_forecast_many(timestamps, volumes, horizon=7, max_workers=max_workers) == serial
@@ -0,0 +1,274 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.models import (
+    ArrivalProcess,
+    ErlangModel,
+    IntervalDemand,
+    IntervalMethod,
+    Profile,
+    Schedule,
+    ScheduleAssignment,
+)
+from core.simulation import des
+from core.simulation.des import (
+    TRACE_OUTCOMES,
+    _simulate_interval,
+    cross_validate,
+    load_trace,
+    run_replications,
+    run_simulation,
+    simulate_staffing,
+)
+from core.sizing.orchestrator import derive_interval_pattern, size_intervals
+
+
+def _scan_interval(arrivals, patience, service, agents, sla_time):
+    # Reference: linear scan for the earliest-free agent, as the original engine did.
+    free = [0.0] * agents
+    answered = abandoned = within = 0
+    wait_sum = 0.0
+    for arrival, limit, duration in zip(arrivals, patience, service):
+        best = min(range(agents), key=lambda i: free[i])
+        wait = max(0.0, free[best] - arrival)
+        if wait > limit:
+            abandoned += 1
+            continue
+        free[best] = arrival + wait + duration
+        answered += 1
+        wait_sum += wait
+        within += wait <= sla_time
+    return answered, abandoned, within, wait_sum
+
+
+def _sizing(volume: float, days: int = 3):
+    points = [{"timestamp": datetime(2024, 6, d), "volume": volume} for d in range(1, days + 1)]
+    return size_intervals(derive_interval_pattern([], points, 30), Profile(erlang_model=ErlangModel.C))
+
+
+@pytest.mark.tier1
+class TestHeapKernel:
+    @pytest.mark.parametrize("agents", [1, 4, 15])
+    def test_matches_linear_scan(self, agents):
+        rng = np.random.default_rng(agents)
+        arrivals = np.sort(rng.uniform(0, 1800, 400))
+        patience = rng.exponential(90, 400)
+        service = rng.exponential(240, 400)
+        heap = _simulate_interval(arrivals, patience, service, agents, 20.0)
+        scan = _scan_interval(arrivals, patience, service, agents, 20.0)
+        assert heap[:3] == scan[:3]
+        assert heap[3] == pytest.approx(scan[3], rel=1e-12)
+
+
+@pytest.mark.tier2
+class TestRunSimulation:
+    def test_seeded_runs_repeat(self):
+        sizing = _sizing(1200)
+        assert run_simulation(sizing, 300, 120, 12) == run_simulation(sizing, 300, 120, 12)
+
+    def test_warmup_and_empty_intervals(self):
+        sizing = _sizing(0)
+        result = run_simulation(sizing, 300, 120, 5, warmup_intervals=5)
+        assert result.intervals_simulated == len(sizing.rows) - 5
+        assert (result.sla_pct, result.asa_seconds, result.abandonment_pct) == (100.0, 0.0, 0.0)
+
+    def test_draw_batches_cover_every_call(self, monkeypatch):
+        sizing = _sizing(600)
+        monkeypatch.setattr(des, "_DRAW_BLOCK", 50)
+        batched = run_simulation(sizing, 300, 1e9, 1, warmup_intervals=0)
+        assert batched.abandonment_pct == 0.0
+        assert batched.intervals_simulated == len(sizing.rows)
+
+    def test_more_agents_improve_service(self):
+        sizing = _sizing(800, days=10)
+        results = [run_simulation(sizing, 300, 120, agents, warmup_intervals=0) for agents in (7, 9, 12)]
+        assert results[0].sla_pct < results[1].sla_pct < results[2].sla_pct
+        assert results[0].abandonment_pct > results[1].abandonment_pct > results[2].abandonment_pct
+
+
+@pytest.mark.tier1
+class TestTrace:
+    def test_trace_matches_aggregates(self):
+        sizing = _sizing(400, days=1)
+        result = run_simulation(sizing, 300, 60, 5, trace=True)
+        trace = result.trace
+        assert result == run_simulation(sizing, 300, 60, 5)
+        assert len(trace) == int(np.rint(sizing.volumes[5:]).sum())
+        outcomes = np.bincount(trace["outcome"], minlength=len(TRACE_OUTCOMES))
+        assert outcomes[0] / len(trace) * 100.0 == pytest.approx(result.sla_pct)
+        assert outcomes[2] / len(trace) * 100.0 == pytest.approx(result.abandonment_pct)
+        answered = trace[trace["outcome"] < 2]
+        assert answered["wait"].mean() == pytest.approx(result.asa_seconds)
+        np.testing.assert_allclose(answered["start"], answered["arrival"] + answered["wait"])
+        assert np.isnan(trace[trace["outcome"] == 2]["start"]).all()
+        assert trace["interval"].min() == 5
+        assert (trace["arrival"] >= trace["interval"] * 1800.0).all()
+
+    def test_trace_spills_to_memory_mapped_file(self, tmp_path):
+        sizing = _sizing(400, days=1)
+        path = tmp_path / "trace.npy"
+        in_memory = run_simulation(sizing, 300, 60, 5, trace=True).trace
+        run_simulation(sizing, 300, 60, 5, trace=path)
+        spilled = load_trace(path)
+        assert isinstance(spilled, np.memmap)
+        for name in in_memory.dtype.names:
+            np.testing.assert_array_equal(spilled[name], in_memory[name])
+        np.save(tmp_path / "other.npy", np.zeros(3))
+        with pytest.raises(ValueError):
+            load_trace(tmp_path / "other.npy")
+
+
+@pytest.mark.tier2
+class TestReplications:
+    def test_parallel_matches_serial_and_brackets_mean(self):
+        sizing = _sizing(1200)
+        serial = run_replications(sizing, 300, 120, 12, max_replications=8, min_replications=4,
+                                  sla_half_width_pct=0.0, max_workers=1)
+        parallel = run_replications(sizing, 300, 120, 12, max_replications=8, min_replications=4,
+                                    sla_half_width_pct=0.0, max_workers=2)
+        assert serial == parallel
+        assert serial.replications == 8
+        for mean, (low, high) in ((serial.sla_pct, serial.sla_ci), (serial.asa_seconds, serial.asa_ci)):
+            assert low < mean < high
+
+    def test_stops_once_interval_is_tight(self):
+        sizing = _sizing(1200)
+        loose = run_replications(sizing, 300, 120, 12, max_replications=40, min_replications=5,
+                                 sla_half_width_pct=50.0, max_workers=1)
+        assert loose.replications == 5
+
+    def test_cross_validate_uses_interval(self):
+        sizing = _sizing(1200)
+        result = run_replications(sizing, 300, 120, 12, max_replications=6, max_workers=1)
+        checked = cross_validate(sizing, result, tolerance_pct=100.0)
+        assert checked.cross_check_passed
+        assert "replications" in checked.cross_check_notes
+
+    def test_antithetic_pairs_are_negatively_correlated(self):
+        sizing = _sizing(1200)
+        seeds = np.random.SeedSequence(1).spawn(30)
+        plain = [run_simulation(sizing, 300, 120, 12, rng_seed=s, common_random_numbers=True).sla_pct for s in seeds]
+        mirror = [run_simulation(sizing, 300, 120, 12, rng_seed=s, antithetic=True).sla_pct for s in seeds]
+        assert np.corrcoef(plain, mirror)[0, 1] < -0.2
+        paired = run_replications(sizing, 300, 120, 12, max_replications=7, min_replications=3,
+                                  sla_half_width_pct=0.0, max_workers=1, antithetic=True)
+        assert paired.replications == 8
+
+    def test_rejects_bad_bounds(self):
+        with pytest.raises(ValueError):
+            run_replications(_sizing(100), 300, 120, 5, max_replications=2, min_replications=3)
+
+
+@pytest.mark.tier1
+class TestRandomStreams:
+    def test_streams_are_independent_of_each_other(self):
+        counts = np.array([30, 0, 20])
+        draws = [
+            next(des._draw_calls(des._call_streams(7), counts, 1800, patience, 300))
+            for patience in (0.0, 90.0)
+        ]
+        np.testing.assert_array_equal(draws[0][2], draws[1][2])
+        np.testing.assert_array_equal(draws[0][4], draws[1][4])
+        arrivals = draws[0][2]
+        assert np.all(np.diff(arrivals[:30]) >= 0) and np.all(np.diff(arrivals[30:]) >= 0)
+        assert arrivals.min() >= 0.0 and arrivals.max() < 1800.0
+
+    def test_antithetic_mirrors_uniforms(self):
+        counts = np.array([50])
+        plain = next(des._draw_calls(des._call_streams(7), counts, 1800, 90, 300))
+        mirror = next(des._draw_calls(des._call_streams(7), counts, 1800, 90, 300, antithetic=True))
+        np.testing.assert_allclose(np.exp(-plain[4] / 300) + np.exp(-mirror[4] / 300), 1.0)
+        np.testing.assert_allclose(np.exp(-plain[3] / 90) + np.exp(-mirror[3] / 90), 1.0)
+        with pytest.raises(ValueError):
+            next(des._draw_calls(np.random.default_rng(7), counts, 1800, 90, 300, antithetic=True))
+
+    def test_staffing_comparisons_share_draws(self):
+        sizing = _sizing(900)
+        runs = [run_simulation(sizing, 300, 120, agents, common_random_numbers=True) for agents in (9, 10, 11)]
+        assert runs[0].sla_pct <= runs[1].sla_pct <= runs[2].sla_pct
+
+
+def _contiguous(volumes, profile=None):
+    start = np.datetime64("2024-06-03T00:00", "us")
+    timestamps = start + np.arange(len(volumes)) * np.timedelta64(30, "m")
+    demand = IntervalDemand(timestamps, np.asarray(volumes, dtype=np.float64), IntervalMethod.HISTORICAL)
+    return size_intervals(demand, profile or Profile(shrinkage_pct=0.0))
+
+
+@pytest.mark.tier1
+class TestPoissonArrivals:
+    def test_intensity_is_piecewise_linear_and_keeps_totals(self):
+        sizing = _contiguous([0.0, 100.0, 300.0, 100.0])
+        knots = des._intensity_knots(sizing.volumes, sizing.timestamps, 1800)
+        assert knots[1].tolist() == [50.0, 100.0, 200.0]
+        assert knots @ np.array([0.25, 0.5, 0.25]) == pytest.approx([12.5, 112.5, 250.0, 125.0])
+        gapped = des._intensity_knots(sizing.volumes[[0, 2]], sizing.timestamps[[0, 2]], 1800)
+        assert gapped.tolist() == [[0.0, 0.0, 0.0], [300.0, 300.0, 300.0]]
+
+    def test_arrivals_follow_the_intensity(self):
+        fractions = np.random.default_rng(0).random(200_000)
+        placed = des._warp(fractions, np.tile([50.0, 100.0, 200.0], (len(fractions), 1)))
+        quarters = np.histogram(placed, bins=4, range=(0.0, 1.0))[0] / len(placed)
+        # Exact quarter masses of the density 50 -> 100 -> 200 over the interval.
+        assert quarters == pytest.approx([25 / 180, 35 / 180, 50 / 180, 70 / 180], abs=0.005)
+        assert des._warp(np.array([0.3]), np.array([[80.0, 80.0, 80.0]])) == pytest.approx([0.3])
+
+    @pytest.mark.parametrize("dispersion", [0.0, 0.05])
+    def test_counts_are_poisson_or_negative_binomial(self, dispersion):
+        sizing = _contiguous([200.0] * 4000)
+        for rng in (np.random.default_rng(1), des._call_streams(1)):
+            counts, _ = des._arrival_plan(rng, sizing, 1800, ArrivalProcess.POISSON, dispersion, False)
+            assert counts.mean() == pytest.approx(200.0, rel=0.01)
+            assert counts.var() == pytest.approx(200.0 + dispersion * 200.0**2, rel=0.1)
+
+    def test_simulations_accept_poisson_arrivals(self):
+        sizing = _contiguous([60.0] * 20)
+        first = run_simulation(sizing, 300, 90, 9, arrival_process=ArrivalProcess.POISSON, dispersion=0.1)
+        assert first == run_simulation(sizing, 300, 90, 9, arrival_process=ArrivalProcess.POISSON, dispersion=0.1)
+        assert first != run_simulation(sizing, 300, 90, 9)
+        continuous = simulate_staffing(sizing, 300, 90, arrival_process=ArrivalProcess.POISSON)
+        assert continuous.offered.sum() != 60 * 20
+        with pytest.raises(ValueError):
+            run_simulation(sizing, 300, 90, 9, dispersion=0.1)
+
+
+@pytest.mark.tier1
+class TestContinuousStaffing:
+    def test_constant_staffing_is_one_long_queue(self):
+        sizing = _contiguous([60.0] * 12)
+        result = simulate_staffing(sizing, 300, 90, staffing=np.full(12, 9), warmup_intervals=0, rng_seed=3)
+        # Replay the same draws through the single-queue kernel over the whole horizon.
+        rng = np.random.default_rng(3)
+        counts = np.full(12, 60)
+        _, _, arrivals, patience, service = next(des._draw_calls(rng, counts, 1800, 90, 300))
+        absolute = arrivals + np.repeat(np.arange(12) * 1800.0, 60)
+        answered, abandoned, within, wait = _simulate_interval(absolute, patience, service, 9, 20.0)
+        assert (int(result.answered.sum()), int(result.abandoned.sum())) == (answered, abandoned)
+        assert result.summary.sla_pct == pytest.approx(within / 720 * 100.0)
+        assert result.summary.asa_seconds == pytest.approx(wait / answered)
+
+    def test_equal_runs_compare_equal(self):
+        sizing = _contiguous([40.0] * 6)
+        result = simulate_staffing(sizing, 300, 120, staffing=np.full(6, 7), warmup_intervals=0)
+        assert result == simulate_staffing(sizing, 300, 120, staffing=np.full(6, 7), warmup_intervals=0)
+        assert result != simulate_staffing(sizing, 300, 120, staffing=np.full(6, 8), warmup_intervals=0)
+
+    def test_backlog_carries_into_next_interval(self):
+        sizing = _contiguous([10.0, 0.0])
+        result = simulate_staffing(sizing, 300, 1e9, staffing=[0, 5], warmup_intervals=0)
+        assert result.answered.tolist() == [10, 0]
+        assert result.asa_seconds[0] > 0.0
+        assert result.summary.abandonment_pct == 0.0
+
+    def test_staffing_from_sizing_and_schedule(self):
+        sizing = _contiguous([40.0] * 4, Profile(shrinkage_pct=25.0))
+        result = simulate_staffing(sizing, 300, 120)
+        expected = np.floor(sizing.agents_required * 0.75 + 1e-9)
+        assert result.agents.tolist() == expected.astype(int).tolist()
+        shift = ScheduleAssignment("A1", datetime(2024, 6, 3, 0, 30), datetime(2024, 6, 3, 1, 30))
+        schedule = Schedule(assignments=[shift] * 8)
+        assert simulate_staffing(sizing, 300, 120, staffing=schedule).agents.tolist() == [0, 6, 6, 0]
+        with pytest.raises(ValueError):
+            simulate_staffing(sizing, 300, 120, staffing=[1, 2])
@@ -0,0 +1,259 @@
+import dataclasses
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.erlang.engine import required_agents
+from core.models import (
+    ChannelType,
+    ErlangModel,
+    IntervalDemand,
+    IntervalMethod,
+    Profile,
+    SizingResult,
+)
+from core.sizing import orchestrator
+from core.sizing.orchestrator import (
+    derive_interval_pattern,
+    iter_sizing,
+    iter_sizing_rows,
+    size_intervals,
+    size_many,
+)
+
+
+def _demand(volume: float = 600, days: int = 2):
+    points = [{"timestamp": datetime(2024, 6, d), "volume": volume} for d in range(1, days + 1)]
+    return derive_interval_pattern([], points, 30)
+
+
+@pytest.mark.tier1
+class TestColumnarDemand:
+    def test_pattern_is_columnar_and_chronological_per_day(self):
+        demand = _demand(600, days=2)
+        assert demand.timestamps.dtype == np.dtype("datetime64[us]")
+        assert demand.volumes.dtype == np.float64
+        assert len(demand) == 40
+        assert demand.intervals[0] == {"timestamp": datetime(2024, 6, 1, 8, 0), "volume": 30.0}
+        assert demand.intervals[-1]["timestamp"] == datetime(2024, 6, 2, 17, 30)
+        assert demand.volumes.sum() == pytest.approx(1200.0)
+
+    def test_from_intervals_round_trips(self):
+        rows = [{"timestamp": datetime(2024, 6, 1, 9, 30), "volume": 12.5}, {"timestamp": datetime(2024, 6, 1, 10)}]
+        demand = IntervalDemand.from_intervals(rows, IntervalMethod.HISTORICAL, ["note"])
+        assert demand.intervals == (rows[0], {"timestamp": datetime(2024, 6, 1, 10), "volume": 0.0})
+        assert demand.approximations == ["note"]
+        assert IntervalDemand.from_intervals(demand.intervals, IntervalMethod.HISTORICAL, ["note"]) == demand
+        sized = size_intervals(demand, Profile())
+        assert [r.timestamp for r in sized.rows] == [datetime(2024, 6, 1, 9, 30), datetime(2024, 6, 1, 10)]
+        assert sized.rows[1].agents_required == 0
+
+    def test_equality_compares_columns(self):
+        demand = _demand(600, days=2)
+        assert demand == _demand(600, days=2)
+        assert demand != _demand(700, days=2)
+        assert demand != IntervalDemand(demand.timestamps, demand.volumes, demand.interval_method, ["note"])
+
+    def test_intervals_view_is_read_only(self):
+        demand = _demand(600, days=1)
+        with pytest.raises(AttributeError):
+            demand.intervals.append({"timestamp": datetime(2024, 6, 2), "volume": 1.0})
+        with pytest.raises(TypeError):
+            demand.intervals[0]["volume"] = 99.0
+        assert demand.volumes[0] == 30.0
+
+    def test_rejects_mismatched_columns(self):
+        with pytest.raises(ValueError):
+            IntervalDemand(np.array(["2024-06-01"], dtype="datetime64[us]"), np.zeros(2), IntervalMethod.FLAT_EQUAL)
+
+
+def _weekly_history(weeks: int = 2):
+    # Weekdays peak at 10:00, weekends at 15:00; hourly rows from 08:00 to 17:00.
+    rows = []
+    for day in range(7 * weeks):
+        ts = datetime(2024, 5, 6) + timedelta(days=day)
+        peak = 10 if ts.weekday() < 5 else 15
+        for hour in range(8, 18):
+            rows.append({"timestamp": ts.replace(hour=hour), "volume": 50.0 if hour == peak else 10.0})
+    return rows
+
+
+@pytest.mark.tier1
+class TestWeekdayPattern:
+    def _peak_hour(self, demand, day):
+        on_day = [r for r in demand.intervals if r["timestamp"].date() == day]
+        return max(on_day, key=lambda r: r["volume"])["timestamp"].hour
+
+    def test_each_weekday_keeps_its_own_shape(self):
+        points = [{"timestamp": datetime(2024, 6, 7), "volume": 100}, {"timestamp": datetime(2024, 6, 8), "volume": 100}]
+        demand = derive_interval_pattern(_weekly_history(), points, 60)
+        assert demand.interval_method == IntervalMethod.HISTORICAL_WEEKDAY
+        assert demand.approximations == []
+        assert self._peak_hour(demand, date(2024, 6, 7)) == 10
+        assert self._peak_hour(demand, date(2024, 6, 8)) == 15
+        assert demand.volumes.sum() == pytest.approx(200.0)
+        assert np.all(np.diff(demand.timestamps) > np.timedelta64(0))
+
+    def test_special_day_follows_mapped_weekday(self):
+        points = [{"timestamp": datetime(2024, 12, 25), "volume": 100}]
+        demand = derive_interval_pattern(_weekly_history(), points, 60, special_days={date(2024, 12, 25): 6})
+        assert self._peak_hour(demand, date(2024, 12, 25)) == 15
+        with pytest.raises(ValueError):
+            derive_interval_pattern(_weekly_history(), points, 60, special_days={date(2024, 12, 25): 7})
+
+    def test_uncovered_weekday_uses_pooled_pattern_and_says_so(self):
+        history = [r for r in _weekly_history() if r["timestamp"].weekday() < 5]
+        points = [{"timestamp": datetime(2024, 6, 9), "volume": 100}]
+        demand = derive_interval_pattern(history, points, 60)
+        assert demand.interval_method == IntervalMethod.HISTORICAL
+        assert any("Sun" in note for note in demand.approximations)
+        assert self._peak_hour(demand, date(2024, 6, 9)) == 10
+
+
+@pytest.mark.tier1
+class TestIncrementalSizing:
+    @pytest.fixture
+    def solves(self, monkeypatch):
+        calls = []
+
+        def counting(**kwargs):
+            calls.append(kwargs["volume"])
+            return required_agents(**kwargs)
+
+        monkeypatch.setattr(orchestrator, "required_agents", counting)
+        return calls
+
+    def test_unchanged_rows_are_reused(self, solves):
+        profile = Profile()
+        first = size_intervals(_demand(600, days=3), profile)
+        edited = _demand(600, days=3)
+        edited.volumes[20:40] *= 1.5
+        solves.clear()
+        second = size_intervals(edited, profile, previous=first)
+        assert len(solves) == 20
+        assert second.rows == size_intervals(edited, profile).rows
+
+    def test_profile_or_floor_change_recomputes_everything(self, solves):
+        first = size_intervals(_demand(), Profile(), occupancy_floor=75.0)
+        for profile, floor in ((Profile(aht_seconds=360), 75.0), (Profile(), 85.0), (Profile(), None)):
+            solves.clear()
+            again = size_intervals(_demand(), profile, occupancy_floor=floor, previous=first)
+            assert len(solves) == len(first.rows)
+            assert again.rows == size_intervals(_demand(), profile, occupancy_floor=floor).rows
+        solves.clear()
+        renamed = size_intervals(_demand(), Profile(name="Renamed"), occupancy_floor=75.0, previous=first)
+        assert solves == []
+        assert renamed.rows == first.rows
+        assert renamed.overrides == first.overrides != {}
+
+
+@pytest.mark.tier1
+class TestColumnarResult:
+    def test_rows_view_matches_columns(self):
+        sized = size_intervals(_demand(), Profile(), occupancy_floor=75.0)
+        rows = sized.rows
+        assert len(rows) == len(sized.volumes) == 40
+        assert rows[-1] == list(rows)[-1] == rows[39]
+        assert rows[5:1:-2] == [rows[5], rows[3]]
+        assert rows[0].agents_required == int(sized.agents_required[0])
+        assert all(r.overrides == () for i, r in enumerate(rows) if i not in sized.overrides)
+        with pytest.raises(IndexError):
+            rows[40]
+
+    def test_from_rows_round_trips(self):
+        sized = size_intervals(_demand(), Profile(), occupancy_floor=75.0)
+        rebuilt = SizingResult.from_rows(sized.rows, sized.profile, sized.approximations, 75.0)
+        assert rebuilt.rows == sized.rows
+        assert rebuilt.overrides == sized.overrides
+        with pytest.raises(ValueError):
+            SizingResult.from_rows(sized.rows, Profile(erlang_model=ErlangModel.A))
+
+    def test_equality_compares_columns(self):
+        sized = size_intervals(_demand(), Profile(), occupancy_floor=75.0)
+        assert sized == size_intervals(_demand(), Profile(), occupancy_floor=75.0)
+        assert SizingResult.from_rows(sized.rows, sized.profile, sized.approximations, 75.0) == sized
+        assert sized != size_intervals(_demand(), Profile())
+        assert sized != size_intervals(_demand(), Profile(aht_seconds=360), occupancy_floor=75.0)
+
+    def test_rows_are_read_only(self):
+        sized = size_intervals(_demand(), Profile())
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sized.rows[3].agents_required = 99
+        sized.agents_required[3] = 99
+        assert sized.rows[3].agents_required == 99
+
+
+@pytest.mark.tier1
+class TestStreamingSizing:
+    def test_day_chunks_concatenate_to_full_result(self):
+        demand = _demand(600, days=4)
+        chunks = list(iter_sizing(demand, Profile(), occupancy_floor=75.0))
+        assert [len(c.rows) for c in chunks] == [20, 20, 20, 20]
+        assert all(len({r.timestamp.date() for r in c.rows}) == 1 for c in chunks)
+        assert list(iter_sizing_rows(iter(chunks))) == list(size_intervals(demand, Profile(), 75.0).rows)
+
+    def test_empty_demand_yields_nothing(self):
+        assert list(iter_sizing(_demand(days=0), Profile())) == []
+
+
+@pytest.mark.tier1
+class TestChatConcurrency:
+    def test_concurrency_reduces_agents(self):
+        voice = size_intervals(_demand(), Profile(channel=ChannelType.CHAT))
+        chat = size_intervals(
+            _demand(),
+            Profile(channel=ChannelType.CHAT, max_concurrency=3, concurrency_aht_factors=[1.0, 1.3, 1.8]),
+        )
+        assert sum(r.agents_required for r in chat.rows) < sum(r.agents_required for r in voice.rows)
+        assert all(any("Chat concurrency" in o for o in r.overrides) for r in chat.rows)
+        assert any("parallel slots" in a for a in chat.approximations)
+
+    def test_slow_curve_keeps_single_concurrency(self):
+        chat = size_intervals(
+            _demand(),
+            Profile(channel=ChannelType.CHAT, max_concurrency=2, concurrency_aht_factors=[1.0, 2.5]),
+        )
+        voice = size_intervals(_demand(), Profile(channel=ChannelType.CHAT))
+        assert [r.agents_required for r in chat.rows] == [r.agents_required for r in voice.rows]
+
+    def test_voice_ignores_concurrency(self):
+        profile = Profile(erlang_model=ErlangModel.C, max_concurrency=3, concurrency_aht_factors=[1.0, 1.2])
+        assert size_intervals(_demand(), profile).rows == size_intervals(_demand(), Profile()).rows
+
+    def test_curve_round_trips_and_extends(self):
+        profile = Profile(max_concurrency=4, concurrency_aht_factors=[1.0, 1.4])
+        restored = Profile.from_dict(profile.to_dict())
+        assert restored == profile
+        assert restored.concurrency_factor(4) == 1.4
+        assert Profile().concurrency_factor(2) == 1.0
+
+
+@pytest.mark.tier2
+class TestSizeMany:
+    def _queues(self):
+        return [
+            (_demand(volume), Profile(name=f"Q{i}", aht_seconds=aht, erlang_model=model))
+            for i, (volume, aht, model) in enumerate(
+                [(600, 300, ErlangModel.C), (900, 240, ErlangModel.A), (300, 420, ErlangModel.B), (1200, 300, ErlangModel.C)]
+            )
+        ]
+
+    def test_parallel_matches_serial_in_order(self):
+        queues = self._queues()
+        parallel = size_many(queues, max_workers=2)
+        serial = size_many(queues, max_workers=1)
+        assert [q.result.profile.name for q in parallel] == ["Q0", "Q1", "Q2", "Q3"]
+        for batch, one, (demand, profile) in zip(parallel, serial, queues):
+            expected = size_intervals(demand, profile)
+            assert batch.result.rows == one.result.rows == expected.rows
+            assert batch.result == one.result == expected
+            assert dataclasses.replace(batch, seconds=0.0) == dataclasses.replace(one, seconds=0.0)
+            assert batch.seconds >= 0.0
+
+    def test_rejects_zero_workers(self):
+        with pytest.raises(ValueError):
+            size_many(self._queues(), max_workers=0)
+
+    def test_no_queues(self):
+        assert size_many([]) == []
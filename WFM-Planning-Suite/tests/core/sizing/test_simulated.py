@@ -0,0 +1,89 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.models import (
+    ChannelType,
+    ErlangModel,
+    IntervalDemand,
+    IntervalMethod,
+    Profile,
+    ServiceDistribution,
+)
+from core.sizing.orchestrator import size_intervals
+from core.sizing.simulated import size_intervals_simulated
+
+
+def _demand():
+    timestamps = np.array([datetime(2024, 6, 3, 9, 0), datetime(2024, 6, 3, 9, 30), datetime(2024, 6, 3, 10, 0)], dtype="datetime64[us]")
+    return IntervalDemand(timestamps, np.array([0.0, 120.0, 120.0]), IntervalMethod.FLAT_EQUAL)
+
+
+@pytest.mark.tier1
+class TestSimulatedSizing:
+    def test_exponential_lands_near_erlang_c(self):
+        demand = _demand()
+        profile = Profile(shrinkage_pct=0.0)
+        analytic = size_intervals(demand, profile)
+        simulated = size_intervals_simulated(demand, profile, ServiceDistribution.EXPONENTIAL, max_workers=1)
+        assert simulated.agents_required[0] == 0
+        assert simulated.sla_pct[0] == 100.0
+        assert abs(int(simulated.agents_required[1]) - int(analytic.agents_required[1])) <= 2
+        assert simulated.agents_required[1] == simulated.agents_required[2]
+        assert simulated.sla_pct[1] >= profile.sla_target_pct
+        assert any("simulation" in note for note in simulated.approximations)
+
+    def test_zero_patience_agrees_with_analytic_sizing(self):
+        demand = _demand()
+        profile = Profile(erlang_model=ErlangModel.A, patience_seconds=0.0, shrinkage_pct=0.0)
+        analytic = size_intervals(demand, profile)
+        simulated = size_intervals_simulated(demand, profile, ServiceDistribution.EXPONENTIAL, max_workers=1)
+        assert analytic.abandonment_pct.tolist() == simulated.abandonment_pct.tolist() == [0.0, 0.0, 0.0]
+        assert abs(int(simulated.agents_required[1]) - int(analytic.agents_required[1])) <= 2
+        assert analytic.agents_required[1] == size_intervals(demand, Profile(shrinkage_pct=0.0)).agents_required[1]
+
+    def test_low_variance_handle_times_need_no_more_agents(self):
+        demand = _demand()
+        profile = Profile(erlang_model=ErlangModel.A)
+        exponential = size_intervals_simulated(demand, profile, ServiceDistribution.EXPONENTIAL, max_workers=1)
+        lognormal = size_intervals_simulated(demand, profile, ServiceDistribution.LOGNORMAL, 0.5, max_workers=1)
+        assert lognormal.agents_required[1] <= exponential.agents_required[1]
+
+    def test_shrinkage_and_cap(self):
+        demand = _demand()
+        shrunk = size_intervals_simulated(demand, Profile(shrinkage_pct=30.0), max_workers=1)
+        raw = size_intervals_simulated(demand, Profile(shrinkage_pct=0.0), max_workers=1)
+        assert shrunk.agents_required[1] == np.ceil(raw.agents_required[1] / 0.7)
+        capped = size_intervals_simulated(demand, Profile(shrinkage_pct=0.0), max_agents=5, max_workers=1)
+        assert capped.agents_required[1] == 5
+        assert 1 in capped.overrides and 0 not in capped.overrides
+
+    def test_occupancy_floor_matches_size_intervals(self):
+        demand = _demand()
+        profile = Profile(shrinkage_pct=0.0)
+        analytic = size_intervals(demand, profile, occupancy_floor=90.0)
+        floored = size_intervals_simulated(demand, profile, ServiceDistribution.EXPONENTIAL,
+                                           occupancy_floor=90.0, max_workers=1)
+        loose = size_intervals_simulated(demand, profile, ServiceDistribution.EXPONENTIAL, max_workers=1)
+        assert floored.agents_required.tolist() == loose.agents_required.tolist()
+        assert floored.overrides == analytic.overrides
+        assert floored.occupancy_floor == 90.0
+
+    def test_rejects_unmodelled_profiles(self):
+        with pytest.raises(ValueError):
+            size_intervals_simulated(_demand(), Profile(erlang_model=ErlangModel.B))
+        with pytest.raises(ValueError):
+            size_intervals_simulated(
+                _demand(), Profile(channel=ChannelType.CHAT, max_concurrency=2, concurrency_aht_factors=[1.0, 1.2]),
+            )
+
+
+@pytest.mark.tier2
+class TestSimulatedSizingParallel:
+    def test_workers_do_not_change_results(self):
+        timestamps = np.arange(4).astype("datetime64[h]").astype("datetime64[us]")
+        demand = IntervalDemand(timestamps, np.array([60.0, 90.0, 120.0, 60.0]), IntervalMethod.FLAT_EQUAL)
+        serial = size_intervals_simulated(demand, Profile(), max_workers=1)
+        parallel = size_intervals_simulated(demand, Profile(), max_workers=2)
+        assert serial.rows == parallel.rows
@@ -0,0 +1,70 @@
+from dataclasses import replace
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.models import ChannelType, ErlangModel, IntervalDemand, Profile
+from core.sizing.orchestrator import derive_interval_pattern, size_intervals
+from core.sizing.sweep import sweep_staffing
+
+
+def _demand():
+    points = [{"timestamp": datetime(2024, 6, d), "volume": 300.0 * d} for d in range(1, 4)]
+    demand = derive_interval_pattern([], points, 30)
+    demand.volumes[::7] = 0.0
+    return demand
+
+
+def _scaled(demand, factor):
+    return IntervalDemand(demand.timestamps, demand.volumes * factor, demand.interval_method, demand.approximations)
+
+
+GRID = {
+    "aht_seconds": [240.0, 300.0],
+    "sla_target_pct": [70.0, 90.0],
+    "shrinkage_pct": [0.0, 30.0, 35.0],
+    "volume_factor": [0.8, 1.25],
+}
+
+
+@pytest.mark.tier1
+class TestStaffingSweep:
+    @pytest.mark.parametrize(
+        "profile,floor",
+        [
+            (Profile(), None),
+            (Profile(erlang_model=ErlangModel.A), 80.0),
+            (Profile(channel=ChannelType.CHAT, max_concurrency=2, concurrency_aht_factors=[1.0, 1.2]), 80.0),
+        ],
+    )
+    def test_every_grid_point_matches_size_intervals(self, profile, floor):
+        demand = _demand()
+        sweep = sweep_staffing(demand, profile, occupancy_floor=floor, **GRID)
+        assert sweep.agents.shape == (2, 2, 3, 2, len(demand))
+        for a, aht in enumerate(GRID["aht_seconds"]):
+            for s, sla in enumerate(GRID["sla_target_pct"]):
+                for k, shrinkage in enumerate(GRID["shrinkage_pct"]):
+                    for v, factor in enumerate(GRID["volume_factor"]):
+                        variant = replace(profile, aht_seconds=aht, sla_target_pct=sla, shrinkage_pct=shrinkage)
+                        expected = size_intervals(_scaled(demand, factor), variant, floor)
+                        assert sweep.agents[a, s, k, v].tolist() == expected.agents_required.tolist()
+
+    def test_summaries_and_scenario_lookup(self):
+        sweep = sweep_staffing(_demand(), Profile(), aht_seconds=[240.0, 300.0], volume_factor=[1.0, 1.5])
+        assert sweep.peak_agents().shape == (2, 1, 1, 2)
+        assert np.all(np.diff(sweep.agent_hours(), axis=0) >= 0)
+        assert np.all(np.diff(sweep.agent_hours(), axis=3) >= 0)
+        base = sweep.scenario(aht_seconds=300.0, volume_factor=1.0)
+        assert base.tolist() == size_intervals(_demand(), Profile()).agents_required.tolist()
+        with pytest.raises(ValueError):
+            sweep.scenario(aht_seconds=300.0)
+        with pytest.raises(ValueError):
+            sweep.scenario(aht_seconds=310.0, volume_factor=1.0)
+        assert sweep.to_dict()["axes"]["shrinkage_pct"] == [30.0]
+
+    def test_equality_compares_arrays(self):
+        sweep = sweep_staffing(_demand(), Profile(), aht_seconds=[240.0, 300.0])
+        assert sweep == sweep_staffing(_demand(), Profile(), aht_seconds=[240.0, 300.0])
+        assert sweep != sweep_staffing(_demand(), Profile(), aht_seconds=[240.0, 360.0])
+        assert sweep != sweep_staffing(_demand(), Profile(), aht_seconds=[240.0, 300.0], volume_factor=[1.1])
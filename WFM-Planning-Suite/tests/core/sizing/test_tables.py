@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.erlang.engine import required_agents
+from core.models import ErlangModel, Profile
+from core.sizing.orchestrator import derive_interval_pattern, size_intervals
+from core.sizing.tables import build_staffing_table
+from wfm_io.files import load_staffing_table, save_profile, staffing_table_path
+
+
+@pytest.mark.tier1
+class TestStaffingTable:
+    @pytest.mark.parametrize("model", list(ErlangModel))
+    def test_lookup_agrees_with_required_agents(self, model):
+        profile = Profile(erlang_model=model, sla_target_pct=85)
+        table = build_staffing_table(profile, max_agents=80)
+        traffic = np.random.default_rng(3).uniform(0.01, 70, size=300)
+        agents = table.lookup(traffic)
+        assert (agents > 0).mean() > 0.9
+        for a, n in zip(traffic, agents):
+            if n > 0:
+                volume = a * 1800 / profile.aht_seconds
+                expected, _ = required_agents(
+                    volume, 1800, profile.aht_seconds, model, profile.sla_target_pct,
+                    profile.sla_time_seconds, profile.patience_seconds,
+                )
+                assert n == expected
+
+    def test_traffic_beyond_table_is_undecided(self):
+        table = build_staffing_table(Profile(), max_agents=20)
+        assert table.lookup(np.array([500.0]))[0] == -1
+
+    def test_sizing_with_table_matches_engine(self):
+        profile = Profile(erlang_model=ErlangModel.C)
+        points = [{"timestamp": datetime(2024, 6, d), "volume": 300 + 40 * d} for d in range(1, 6)]
+        demand = derive_interval_pattern([], points, profile.interval_minutes)
+        table = build_staffing_table(profile, max_agents=60)
+        assert size_intervals(demand, profile, table=table).rows == size_intervals(demand, profile).rows
+
+    def test_table_for_other_profile_is_rejected(self):
+        table = build_staffing_table(Profile(aht_seconds=200), max_agents=10)
+        demand = derive_interval_pattern([], [{"timestamp": datetime(2024, 6, 1), "volume": 100}])
+        with pytest.raises(ValueError):
+            size_intervals(demand, Profile(), table=table)
+
+    def test_persisted_next_to_profile(self, tmp_path):
+        profile = Profile(name="Sales")
+        table = build_staffing_table(profile, max_agents=15)
+        path = tmp_path / "sales.json"
+        save_profile(profile, path, table=table)
+        assert staffing_table_path(path) == tmp_path / "sales.staffing.json"
+        loaded = load_staffing_table(path, profile)
+        assert loaded is not None
+        assert np.array_equal(loaded.capacity, table.capacity)
+        assert loaded == table
+        assert table != build_staffing_table(profile, max_agents=16)
+        assert load_staffing_table(path, Profile(name="Sales", aht_seconds=420)) is None
@@ -4,9 +4,10 @@ import pytest
 
 from core.forecasting.selector import select_and_forecast
 from core.models import ErlangModel, Profile
+from core.reporting.generator import build_report, report_to_export_dict
 from core.scheduling.optimizer import build_schedule
 from core.simulation.des import cross_validate, run_simulation
-from core.sizing.orchestrator import derive_interval_pattern, size_intervals
+from core.sizing.orchestrator import derive_interval_pattern, iter_sizing, size_intervals
 
 
 @pytest.mark.tier2
@@ -38,6 +39,20 @@ class TestPipelineConservation:
         schedule = build_schedule(sizing, available_agents=1)
         assert len(schedule.warnings) > 0 or len(schedule.coverage_gaps) >= 0
 
+    def test_schedule_and_export_consume_streamed_chunks(self):
+        profile = Profile()
+        forecast_points = [{"timestamp": datetime(2024, 6, d), "volume": 900} for d in range(1, 6)]
+        demand = derive_interval_pattern([], forecast_points)
+        sizing = size_intervals(demand, profile)
+        streamed = build_schedule(iter_sizing(demand, profile), available_agents=12)
+        assert streamed == build_schedule(sizing, available_agents=12)
+        forecast = select_and_forecast([datetime(2024, 5, d) for d in range(1, 29)], [900] * 28, horizon=5)
+        report = build_report(profile, forecast, sizing, streamed)
+        exported = list(report_to_export_dict(report, iter_sizing(demand, profile))["sheets"]["Sizing"])
+        assert exported == list(report_to_export_dict(report, sizing)["sheets"]["Sizing"])
+        assert len(exported) == len(sizing.rows)
+        assert build_schedule(iter([]), available_agents=5).warnings == ["No sizing data to schedule"]
+
 
 @pytest.mark.tier2
 class TestSimulationCrossValidation:
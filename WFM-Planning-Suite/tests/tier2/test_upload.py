@@ -1,8 +1,9 @@
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
-from wfm_io.files import load_upload
+from wfm_io.files import export_report_excel, load_upload
 
 
 @pytest.mark.tier2
@@ -13,3 +14,14 @@ def test_load_sample_csv():
     assert upload.date_range is not None
     errors = [i for i in upload.issues if i.severity == "error"]
     assert len(errors) == 0
+
+
+@pytest.mark.tier2
+def test_export_streams_generator_sheets(tmp_path):
+    rows = ({"Timestamp": f"2024-06-01T{h:02d}:00", "Agents": h} for h in range(24))
+    path = tmp_path / "report.xlsx"
+    export_report_excel({"sheets": {"Summary": [{"Metric": "Peak", "Value": 23}], "Sizing": rows}}, path)
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert sheets["Summary"].to_dict("records") == [{"Metric": "Peak", "Value": 23}]
+    assert sheets["Sizing"]["Agents"].tolist() == list(range(24))
+    assert next(rows, None) is None